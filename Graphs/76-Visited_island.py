@@ -1,3 +1,6 @@
+from typing import List
+
+
 # basically a brute force approac.
 
 # We are walking through the island andremembering when we are visiting a peculiar node of the island
@@ -27,10 +30,14 @@ class Solution:
             # Mark this cell as visited
             self.visited[i][j] = True
 
-            # Recur for all connected neighbours
-            for k in range(len(rowNbr)):
-                if self.isSafe(i + rowNbr[k], j + colNbr[k]):
-                    self.dfs(i + rowNbr[k], j + colNbr[k])
+            # Explicit stack instead of recursion, so big islands can't hit the recursion limit
+            stack = [(i, j)]
+            while stack:
+                i, j = stack.pop()
+                for k in range(len(rowNbr)):
+                    if self.isSafe(i + rowNbr[k], j + colNbr[k]):
+                        self.visited[i + rowNbr[k]][j + colNbr[k]] = True
+                        stack.append((i + rowNbr[k], j + colNbr[k]))
 
         def countIsland(self):
             count = 0
@@ -59,16 +66,19 @@ def numIslands(self, grid: List[List[str]]) -> int:
         rows, cols = len(grid), len(grid[0])
 
         def dfs(r, c):
-            if (r not in range(rows) or
-                c not in range(cols) or
-                grid[r][c] == "0" or
-                (r, c) in visit):
-                return
-
-            visit.add((r, c))
+            stack = [(r, c)]
             directions = [[0, 1], [0, -1], [1, 0], [-1, 0]]
-            for dr, dc in directions:
-                dfs(r + dr, c + dc)
+            while stack:
+                r, c = stack.pop()
+                if (r not in range(rows) or
+                    c not in range(cols) or
+                    grid[r][c] == "0" or
+                    (r, c) in visit):
+                    continue
+
+                visit.add((r, c))
+                for dr, dc in directions:
+                    stack.append((r + dr, c + dc))
 
         for r in range(rows):
             for c in range(cols):
@@ -1,12 +1,14 @@
-"""
+from copy import deepcopy
+from typing import Optional
+
+
 # Definition for a Node.
 class Node:
     def __init__(self, val = 0, neighbors = None):
         self.val = val
         self.neighbors = neighbors if neighbors is not None else []
-"""
-from copy import deepcopy
-from typing import Optional
+
+
 class Solution:
     def __init__(self):
         self.visited = {}
@@ -1,3 +1,7 @@
+from collections import deque
+from typing import List
+
+
 class Solution:
     def maxAreaOfIsland(self, grid: List[List[int]]) -> int:
         if not grid or not grid[0]:
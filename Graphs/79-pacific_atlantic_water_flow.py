@@ -1,3 +1,6 @@
+import heapq
+
+
 class Solution(object):
     def pacificAtlantic(self, heights):
         """
@@ -5,40 +8,26 @@ class Solution(object):
         :rtype: List[List[int]]
         """
 
-        ROWS, COLS  = len(heights), len(heights[0])
-        pac, alt = set(), set()
-
-        def dfs(r, c, visit, prevHeight):
-            if (
-                (r, c) in visit
-                or r < 0
-                or c < 0
-                or r == ROWS
-                or c == COLS
-                or heights[r][c] < prevHeight
-            ):
-                return
-            visit.add((r, c))
-            directions = [[0,1], [0,-1], [1,0], [-1,0]]
-            for direction in directions:
-                dfs(r+direction[0], c+direction[1], visit, heights[r][c])
-
-        for c in range(COLS):
-            dfs(0, c, pac, heights[0][c])
-            dfs(ROWS - 1, c, alt, heights[ROWS - 1][c])
-
-        for r in range(ROWS):
-            dfs(r, 0, pac, heights[r][0])
-            dfs(r, COLS-1, alt, heights[r][COLS-1])
-
-        res = []
-
-        for i in range(ROWS):
-            for j in range(COLS):
-                if (i,j) in pac and (i,j) in alt:
-                    res.append([i,j])
-
-        return res
-        
-
-        
+        ROWS, COLS = len(heights), len(heights[0])
+        PAC, ATL = 1, 2
+        # one bit per ocean the cell drains to, in a flat list instead of two sets of tuples
+        reach = [0] * (ROWS * COLS)
+
+        def flood(cells, bit):
+            # priority flood: settle the lowest border cell first and climb
+            # to every neighbour that is no lower; no recursion
+            heap = [(heights[r][c], r, c) for r, c in cells]
+            heapq.heapify(heap)
+            for _, r, c in heap:
+                reach[r * COLS + c] |= bit
+            while heap:
+                h, r, c = heapq.heappop(heap)
+                for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+                    if 0 <= nr < ROWS and 0 <= nc < COLS and not reach[nr * COLS + nc] & bit and heights[nr][nc] >= h:
+                        reach[nr * COLS + nc] |= bit
+                        heapq.heappush(heap, (heights[nr][nc], nr, nc))
+
+        flood([(0, c) for c in range(COLS)] + [(r, 0) for r in range(ROWS)], PAC)
+        flood([(ROWS - 1, c) for c in range(COLS)] + [(r, COLS - 1) for r in range(ROWS)], ATL)
+
+        return [[i // COLS, i % COLS] for i, bits in enumerate(reach) if bits == PAC | ATL]
@@ -10,16 +10,20 @@ class Solution(object):
         def dfs(r, c, visited):
             directions = [[-1,0], [0, -1], [1, 0], [0, 1]]
             visited.add((r,c))
+            stack = [(r, c)]
 
-            for direction in directions:
-                new_r = r + direction[0]
-                new_c = c + direction[1]
+            while stack:
+                r, c = stack.pop()
+                for direction in directions:
+                    new_r = r + direction[0]
+                    new_c = c + direction[1]
 
-                if (new_r, new_c) in visited or (not 0<= new_r < ROWS) or (not 0<= new_c < COLS):
-                    continue
+                    if (new_r, new_c) in visited or (not 0<= new_r < ROWS) or (not 0<= new_c < COLS):
+                        continue
 
-                if board[new_r][new_c] == "O":
-                    visited = dfs(new_r, new_c, visited)
+                    if board[new_r][new_c] == "O":
+                        visited.add((new_r, new_c))
+                        stack.append((new_r, new_c))
             
             return visited
 
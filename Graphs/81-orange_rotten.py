@@ -1,3 +1,5 @@
+from typing import List
+
 
 ## NAive DFS solution -> not really well adapted to our issue
 ## Since we are 
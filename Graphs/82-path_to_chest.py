@@ -1,4 +1,6 @@
 from collections import deque
+from typing import List
+
 
 class Solution:
     def islandsAndTreasure(self, grid: List[List[int]]) -> None:
@@ -1,3 +1,6 @@
+from typing import List
+
+
 # This exercise is
 class Solution:
     def canFinish(self, numCourses: int, prerequisites: List[List[int]]) -> bool:
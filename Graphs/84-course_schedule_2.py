@@ -18,19 +18,26 @@ class Solution(object):
         output = []
 
         def dfs(crs):
-            if crs in visiting:
-                return False
             if crs in visited:
                 return True
 
+            # explicit stack of (course, iterator over its prereqs) instead of recursion
             visiting.add(crs)
-            for pre in preMap[crs]:
-                if not dfs(pre):
-                    return False
-            
-            visiting.remove(crs)
-            visited.add(crs)
-            output.append(crs)
+            stack = [(crs, iter(preMap[crs]))]
+            while stack:
+                crs, pres = stack[-1]
+                for pre in pres:
+                    if pre in visiting:
+                        return False
+                    if pre not in visited:
+                        visiting.add(pre)
+                        stack.append((pre, iter(preMap[pre])))
+                        break
+                else:
+                    stack.pop()
+                    visiting.remove(crs)
+                    visited.add(crs)
+                    output.append(crs)
             return True
 
         for c in range(numCourses):
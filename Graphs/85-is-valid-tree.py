@@ -1,3 +1,7 @@
+from collections import defaultdict
+from typing import List
+
+
 class Solution:
 
     ## The basic idea here is to chekc for 2 things for the tree to work:
@@ -16,13 +20,17 @@ class Solution:
         visited = [False] * n
 
         def dfs(node, parent):
+            # explicit stack of (node, parent) so long chains don't recurse
             visited[node] = True
-            for neighbor in graph[node]:
-                if not visited[neighbor]:
-                    if not dfs(neighbor, node):
+            stack = [(node, parent)]
+            while stack:
+                node, parent = stack.pop()
+                for neighbor in graph[node]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = True
+                        stack.append((neighbor, node))
+                    elif neighbor != parent:
                         return False
-                elif neighbor != parent:
-                    return False
             return True
 
         # Start DFS from the first node (assuming nodes are labeled from 0 to n-1)
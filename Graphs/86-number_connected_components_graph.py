@@ -1,3 +1,7 @@
+from collections import defaultdict, deque
+from typing import List
+
+
 class Solution:
     def countComponents(self, n: int, edges: List[List[int]]) -> int:
 
@@ -4,11 +4,11 @@ class UnionFind:
         self.rank = [1] * size  # Initialize ranks for union by rank optimization
 
     def find(self, x):
-        # Path compression
-        if x == self.root[x]:
-            return x
-        self.root[x] = self.find(self.root[x])  # Connect directly to the root
-        return self.root[x]
+        # Path halving: iterative, so long chains can't overflow the stack
+        while x != self.root[x]:
+            self.root[x] = self.root[self.root[x]]  # Skip to the grandparent
+            x = self.root[x]
+        return x
 
     def union(self, x, y):
         rootX = self.find(x)
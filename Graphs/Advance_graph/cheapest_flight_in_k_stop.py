@@ -1,16 +1,27 @@
+from typing import List
+
+
 class Solution:
     def findCheapestPrice(self, n: int, flights: List[List[int]], src: int, dst: int, k: int) -> int:
+        adj = [[] for _ in range(n)]
+        for s, d, p in flights:
+            adj[s].append((d, p))
         prices = [float('inf')] * n
         prices[src] = 0
 
+        # round i only relaxes legs out of airports whose price changed in
+        # round i-1, at that older price, so no fare uses more than i+1 legs;
+        # a round that changes nothing ends the search early
+        changed = {src: 0}
         for i in range(k+1):
-            temp_price = prices.copy()
-
-            for s,d, p in flights:
-                if prices[s] == float('inf'): continue
-                if prices[s] + p < temp_price[d]:
-                    temp_price[d] = prices[s] + p 
-            prices = temp_price
+            temp_price = {}
+            for s, price in changed.items():
+                for d, p in adj[s]:
+                    if price + p < prices[d] and price + p < temp_price.get(d, float('inf')):
+                        temp_price[d] = price + p
+            if not temp_price:
+                break
+            for d, p in temp_price.items():
+                prices[d] = p
+            changed = temp_price
         return -1 if prices[dst] == float('inf') else prices[dst]
-
-
@@ -1,25 +1,29 @@
+from typing import List
+
+
 class Solution:
     def minCostConnectPoints(self, points: List[List[int]]) -> int:
         N = len(points)
-        adj = {i : [] for i in range(N)}
-        for i in range(N):
-            x1,x2 = points[i]
-            for j in range(i+1,N):
-                y1,y2 = points[j]
-                dist = abs(x1-y1) + abs(x2- y2)
-                adj[i].append([dist,j])
-                adj[j].append([dist,i])
+        # dense Prim: every pair is an edge, so rather than building N^2
+        # adjacency lists and a heap, keep each point's distance to the tree
+        # and scan it for the minimum
+        best = [float("inf")] * N
+        v = [False] * N
         cnt = 0
-        minH= [[0,0]]
-        v = set()
-
-        while len(v) < N:
-            count, node = heapq.heappop(minH)
-            if node not in v:
-                v.add(node)
-                cnt += count
-                for wei, nei in adj[node]:
-                    if nei not in v:
-                        heapq.heappush(minH,[wei,nei])
+        node = 0
+        best[0] = 0
+        for _ in range(N):
+            v[node] = True
+            cnt += best[node]
+            x1, y1 = points[node]
+            nxt, low = -1, float("inf")
+            for j in range(N):
+                if v[j]:
+                    continue
+                dist = abs(x1 - points[j][0]) + abs(y1 - points[j][1])
+                if dist < best[j]:
+                    best[j] = dist
+                if best[j] < low:
+                    nxt, low = j, best[j]
+            node = nxt
         return cnt
-
@@ -1,5 +1,6 @@
 import collections
 import heapq
+from typing import List
 
 
 class Solution:
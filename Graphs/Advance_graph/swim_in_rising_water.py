@@ -1,20 +1,26 @@
-import heapq
+from typing import List
 
 
 class Solution:
     def swimInWater(self, grid: List[List[int]]) -> int:
         N = len(grid)
-        minh = [[grid[0][0],0,0]]
-        v = set()
-        direction = [[1,0],[0,1],[0,-1],[-1,0]]
-        v.add((0,0))
-        while minh:
-            t , r,c = heapq.heappop(minh)
-            if r == N-1 and c == N-1:
-                return t
-            for dr,dc in direction:
-                row, col = dr+r, dc+c
-                if row < 0 or row == N or col < 0 or col == N or (row,col) in v : continue
-                v.add((row,col))
-                heapq.heappush(minh,[max(t,grid[row][col]),row,col])
-        
\ No newline at end of file
+        # raise the water one cell at a time, in height order, and union each
+        # newly flooded cell with its flooded neighbours; the answer is the
+        # level at which the two corners end up in the same set
+        par = list(range(N * N))
+
+        def find(x):
+            while par[x] != x:
+                par[x] = par[par[x]]
+                x = par[x]
+            return x
+
+        flooded = [False] * (N * N)
+        for i in sorted(range(N * N), key=lambda i: grid[i // N][i % N]):
+            flooded[i] = True
+            r, c = divmod(i, N)
+            for row, col in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+                if 0 <= row < N and 0 <= col < N and flooded[row * N + col]:
+                    par[find(row * N + col)] = find(i)
+            if find(0) == find(N * N - 1):
+                return grid[r][c]
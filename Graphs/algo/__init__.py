@@ -0,0 +1,62 @@
+"""Graph algorithms over CSR arrays.
+
+`import algo` is cheap: it loads no submodule (and so not numpy) until a
+name is first used, e.g. `algo.dijkstra` imports `algo.dijkstras` then.
+Submodules are attributes too; `bfs`, `dfs`, `bellman_ford` and
+`instrument` name both a module and its main function, and `algo.bfs` is
+the module (`algo.bfs.bfs` the function), as a submodule import would
+leave it.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "all_pairs": ("distance_matrix", "floyd_warshall", "iter_distance_matrix"),
+    "batch": ("BatchExecutor", "shared_arrays"),
+    "bellman_ford": ("HopLimitedPaths", "cheapest_price", "hop_limited"),
+    "bfs": ("bfs_direction_optimizing", "bfs_ids", "bfs_levels"),
+    "bottleneck": ("BottleneckTree", "grid_tree", "kruskal_tree", "swim_in_water"),
+    "contraction_hierarchy": ("ContractionHierarchy", "build_contraction_hierarchy"),
+    "csr": ("CSRGraph", "as_csr"),
+    "dfs": ("dfs_ids",),
+    "dijkstras": ("ShortestPathEngine", "dijkstra", "dijkstra_ids", "dijkstra_queue", "euclidean", "grid_graph",
+                  "manhattan", "shortest_path"),
+    "edgelist": ("binary_dtype", "load_edgelist", "read_edges", "write_binary"),
+    "geometric_mst": ("delaunay_candidates", "dense_prim", "manhattan_candidates", "min_cost_connect_points",
+                      "point_mst"),
+    "graphfile": ("graph_info", "load_graph", "save_graph"),
+    "grid": ("as_mask", "capture_surrounded", "distance_transform", "label_components", "label_plateaus",
+             "max_area_of_island", "num_islands", "oranges_rotting", "walls_and_gates"),
+    "instrument": ("CallStats", "Recorder", "instrumented"),
+    "mst": ("boruvka", "kruskal", "minimum_spanning_tree", "parallel_boruvka"),
+    "prims": ("prim", "prim_ids", "prim_queue"),
+    "priority_queues": ("BucketQueue", "IndexedDaryHeap", "PairingHeap", "make_queue"),
+    "shm": ("SharedArrays", "attach"),
+    "tiled": ("flood_fill_tiled", "label_components_tiled", "num_islands_tiled", "open_raster", "reachable_tiled"),
+    "topological_sort": ("IncrementalTopologicalOrder", "build_adjacency_list", "kahn_topological_sort",
+                         "topological_sort_dfs"),
+    "traversal": ("DepthFirstSearch", "find_cycle", "grid_neighbors", "postorder", "preorder"),
+    "union_find": ("DisjointSet", "RollbackDisjointSet"),
+    "water_flow": ("drainage", "outlet_bits", "pacific_atlantic"),
+}
+
+_ORIGIN = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_ORIGIN)
+
+
+def __getattr__(name):
+    # PEP 562: resolve a public name on first access and cache it, so the
+    # module is only imported by the code that actually needs it
+    if name in _EXPORTS:
+        return importlib.import_module(f".{name}", __name__)
+    module = _ORIGIN.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_EXPORTS))
@@ -0,0 +1,218 @@
+import itertools
+import os
+from collections import deque
+
+import numpy as np
+
+from .bellman_ford import hop_limited
+from .bfs import bfs_ids
+from .csr import CSRGraph, as_csr
+from .dijkstras import dijkstra_ids
+
+
+# Many independent queries against one graph, spread over processes. The
+# CSR arrays are laid out once in shared memory (algo.shm) or, for a graph
+# file, mapped by each worker straight from the page cache (algo.graphfile);
+# either way workers attach in their initializer and never receive a copy
+# of the graph. Queries go out in chunks, so the pickling cost is one task
+# per chunk rather than per query, and at most 2 * workers chunks are in
+# flight: results stream back as they are consumed instead of piling up.
+#
+# A query function takes `(csr, query)` and must be picklable, i.e. defined
+# at module level. Queries and results are in node ids; use
+# `executor.csr.id_of` / `labels_of` for labelled graphs. Extra arrays
+# (per-batch data every query needs) can be shared the same way and are
+# read with shared_arrays() from inside the query function.
+
+_worker = None
+
+
+class BatchExecutor:
+    """Process pool with one graph attached to every worker.
+
+        with BatchExecutor(graph, workers=8) as pool:
+            for delay in pool.imap("network_delay", range(n)):
+                ...
+
+    graph is a CSRGraph, an adjacency dict or the path of a graph file
+    written by save_graph(). workers=1 runs queries in this process, which
+    is also what it falls back to on a single CPU unless workers is given.
+    """
+
+    def __init__(self, graph, workers=None, arrays=None):
+        if isinstance(graph, (str, os.PathLike)):
+            from .graphfile import load_graph
+
+            self.csr = load_graph(graph)
+            source = ("file", os.fspath(graph))
+        else:
+            self.csr = as_csr(graph)
+            source = None
+        self.workers = workers or os.cpu_count() or 1
+        self.arrays = dict(arrays or {})
+        self._shared = None
+        self._pool = None
+        if self.workers == 1:
+            return
+        # process pools and shared memory cost ~30 ms to import; only pay
+        # for them when there is a pool
+        from concurrent.futures import ProcessPoolExecutor
+
+        from .shm import SharedArrays
+
+        csr = self.csr
+        shared = dict(self.arrays)
+        if source is None:
+            shared.update(offsets=csr.offsets, targets=csr.targets)
+            if csr.weighted:
+                shared["weights"] = csr.weights
+        self._shared = SharedArrays(shared)
+        try:
+            self._pool = ProcessPoolExecutor(self.workers, initializer=_attach_worker,
+                                             initargs=(source, self._shared.spec, tuple(self.arrays)))
+        except BaseException:
+            self._shared.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def imap(self, query, queries, chunk_size=None):
+        """Results of `query(csr, q)` for each q, in the order of `queries`."""
+        for _, results in self._chunks(query, queries, chunk_size, ordered=True):
+            yield from results
+
+    def imap_unordered(self, query, queries, chunk_size=None):
+        """`(index, result)` pairs, a chunk at a time as chunks complete."""
+        for first, results in self._chunks(query, queries, chunk_size, ordered=False):
+            yield from enumerate(results, first)
+
+    def map(self, query, queries, chunk_size=None):
+        """imap() collected into a list."""
+        return list(self.imap(query, queries, chunk_size))
+
+    def _chunks(self, query, queries, chunk_size, ordered):
+        query = QUERIES.get(query, query) if isinstance(query, str) else query
+        if chunk_size is None:
+            # ~8 chunks per worker balances uneven queries against task overhead
+            chunk_size = -(-len(queries) // (8 * self.workers)) if hasattr(queries, "__len__") else 64
+            chunk_size = max(1, min(1024, chunk_size))
+        it = iter(queries)
+        chunks = iter(lambda: list(itertools.islice(it, chunk_size)), [])
+        if self._pool is None:
+            global _worker
+            _worker = self.csr, self.arrays
+            first = 0
+            for chunk in chunks:
+                yield first, _run_chunk(query, chunk)
+                first += len(chunk)
+            return
+
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        # ordered: a queue of (first, future) drained from the front;
+        # unordered: {future: first} drained as futures finish
+        pending = deque() if ordered else {}
+        first = 0
+        for chunk in chunks:
+            if len(pending) == 2 * self.workers:
+                if ordered:
+                    done_first, future = pending.popleft()
+                    yield done_first, future.result()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.result()
+            future = self._pool.submit(_run_chunk, query, chunk)
+            if ordered:
+                pending.append((first, future))
+            else:
+                pending[future] = first
+            first += len(chunk)
+        if ordered:
+            for done_first, future in pending:
+                yield done_first, future.result()
+        else:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+
+
+def shared_arrays():
+    """The `arrays` given to the BatchExecutor, as seen from a query function."""
+    return _worker[1]
+
+
+def _attach_worker(source, spec, extra):
+    from .shm import attach
+
+    global _worker
+    shm, views = attach(spec)
+    if source is None:
+        csr = CSRGraph(views["offsets"], views["targets"], views.get("weights"))
+    else:
+        from .graphfile import load_graph
+
+        csr = load_graph(source[1])
+    # the shm handle rides along so the mapping outlives the views
+    _worker = csr, {name: views[name] for name in extra}, shm
+
+
+def _run_chunk(query, chunk):
+    csr = _worker[0]
+    return [query(csr, q) for q in chunk]
+
+
+def single_source(csr, source):
+    """Distance array from `source` (dijkstra_ids)."""
+    return dijkstra_ids(csr, source)
+
+
+def bfs_order(csr, source):
+    """Node ids in BFS order from `source` (bfs_ids)."""
+    return bfs_ids(csr, source)
+
+
+def network_delay(csr, source):
+    """LeetCode 743 per source: time until every node has the signal, or -1."""
+    dist = dijkstra_ids(csr, source)
+    latest = float(dist.max()) if len(dist) else 0.0
+    return -1 if latest == np.inf else latest
+
+
+def cheapest_price(csr, query):
+    """LeetCode 787 per `(src, dst, k)`: cheapest fare with at most k stops, or -1."""
+    src, dst, k = query
+    price = hop_limited(csr, src, k + 1).distance(dst)
+    return -1 if price == np.inf else price
+
+
+QUERIES = {
+    "dijkstra": single_source,
+    "bfs": bfs_order,
+    "network_delay": network_delay,
+    "cheapest_price": cheapest_price,
+}
+
+
+if __name__ == "__main__":
+    times = [[0, 1, 1], [1, 2, 1], [2, 3, 1], [0, 3, 5], [3, 0, 2]]
+    csr = CSRGraph.from_edges(np.array(times)[:, :2], num_nodes=4, weights=np.array(times)[:, 2])
+    with BatchExecutor(csr, workers=2) as pool:
+        print("Network delay per source:", pool.map("network_delay", range(4)))
+        # Network delay per source: [3.0, 4.0, 4.0, 4.0]
+        print("Cheapest with 1 stop:", pool.map("cheapest_price", [(0, 3, 1), (1, 0, 1)]))
+        # Cheapest with 1 stop: [5.0, -1]
+        print("As completed:", sorted(pool.imap_unordered("bfs", range(4), chunk_size=1)))
@@ -0,0 +1,151 @@
+import numpy as np
+
+from .bfs import _gather_ranges
+from .csr import CSRGraph, as_csr
+
+
+# Bellman-Ford in synchronous rounds over the CSR edge arrays. Round k
+# relaxes every out-edge of the nodes whose distance changed in round k-1,
+# reading only the distances from before the round, so after k rounds a
+# node's distance is the cheapest walk of at most k edges: exactly what a
+# hop limit ("at most k stops") asks for. A round is one gather and one
+# np.minimum.at scatter; a round that changes nothing ends the search.
+
+
+class HopLimitedPaths:
+    """Result of hop_limited(): distances to every node plus itineraries.
+
+    preds[k][v] is the node v was reached from when round k improved it
+    (-1 if round k left v alone), which is enough to rebuild the cheapest
+    path that respects the hop limit.
+    """
+
+    __slots__ = ("csr", "dist", "preds", "source")
+
+    def __init__(self, csr, dist, preds, source):
+        self.csr, self.dist, self.preds, self.source = csr, dist, preds, source
+
+    def distance(self, target):
+        return self.dist[self.csr.id_of(target)].item()
+
+    def distances(self):
+        """Distance per node id (inf where no path fits the hop limit)."""
+        return self.dist
+
+    def path(self, target):
+        """Cheapest source-target itinerary within the hop limit, [] if there is none."""
+        v = self.csr.id_of(target)
+        if self.dist[v] == np.inf:
+            return []
+        path = [v]
+        for pred in reversed(self.preds):
+            if pred[v] >= 0:
+                v = int(pred[v])
+                path.append(v)
+        return self.csr.labels_of(path[::-1])
+
+
+def _edge_weights(csr):
+    return csr.edge_weights()
+
+
+def _relax(csr, weights, dist, frontier):
+    # one synchronous round: candidate distances over the frontier's
+    # out-edges, scattered with a min; returns the new distances, the nodes
+    # that improved and, per improved node, one edge source achieving it
+    idx = _gather_ranges(csr.offsets[frontier], csr.offsets[frontier + 1])
+    src = np.repeat(frontier, np.diff(csr.offsets)[frontier])
+    dst = csr.targets[idx]
+    cand = dist[src] + weights[idx]
+    new = dist.copy()
+    np.minimum.at(new, dst, cand)
+    improved = np.flatnonzero(new < dist)
+    hit = (cand == new[dst]) & (new[dst] < dist[dst])
+    via = np.full(len(dist), -1, dtype=np.int64)
+    via[dst[hit]] = src[hit]
+    return new, improved, via
+
+
+def hop_limited(graph, source, max_hops):
+    """Shortest paths from `source` using at most `max_hops` edges.
+
+    Returns a HopLimitedPaths covering every target at once. Weights may be
+    negative (a hop limit keeps every walk finite).
+    """
+    csr = as_csr(graph)
+    weights = _edge_weights(csr)
+    dist = np.full(csr.num_nodes, np.inf)
+    s = csr.id_of(source)
+    dist[s] = 0.0
+    frontier = np.array([s], dtype=np.int64)
+    preds = []
+    for _ in range(max_hops):
+        dist, frontier, via = _relax(csr, weights, dist, frontier)
+        if not len(frontier):
+            break
+        preds.append(via)
+    return HopLimitedPaths(csr, dist, preds, s)
+
+
+def bellman_ford(graph, source):
+    """General single-source shortest paths with negative weights.
+
+    Returns `(dist, pred, cycle)`: dist per node id (inf if unreachable),
+    the shortest-path tree as pred ids (-1 at the source and unreached
+    nodes), and `cycle`, the nodes of a negative cycle reachable from the
+    source ([] if there is none, in which case dist is exact).
+    """
+    csr = as_csr(graph)
+    weights = _edge_weights(csr)
+    n = csr.num_nodes
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    s = csr.id_of(source)
+    dist[s] = 0.0
+    frontier = np.array([s], dtype=np.int64)
+    # without negative cycles nothing can improve after n-1 rounds
+    for _ in range(n):
+        dist, frontier, via = _relax(csr, weights, dist, frontier)
+        if not len(frontier):
+            return dist, pred, []
+        pred[frontier] = via[frontier]
+    return dist, pred, csr.labels_of(_negative_cycle(pred, frontier))
+
+
+def _negative_cycle(pred, starts):
+    # a node still improving after n rounds has a pred chain that runs into
+    # a negative cycle: walk pred pointers, stamping nodes with the walk
+    # they were met on, until a walk meets its own stamp
+    stamp = np.full(len(pred), -1, dtype=np.int64)
+    for run, node in enumerate(starts.tolist()):
+        while node != -1 and stamp[node] == -1:
+            stamp[node] = run
+            node = int(pred[node])
+        if node != -1 and stamp[node] == run:
+            cycle = [node]
+            u = int(pred[node])
+            while u != node:
+                cycle.append(u)
+                u = int(pred[u])
+            return cycle[::-1]
+    return []
+
+
+def cheapest_price(n, flights, src, dst, k):
+    """LeetCode 787: cheapest src->dst fare with at most k stops (k + 1 legs), or -1."""
+    flights = np.asarray(flights, dtype=np.int64).reshape(-1, 3)
+    csr = CSRGraph.from_edges(flights[:, :2], num_nodes=n, weights=flights[:, 2])
+    price = hop_limited(csr, src, k + 1).distance(dst)
+    return -1 if price == np.inf else int(price)
+
+
+if __name__ == "__main__":
+    flights = [[0, 1, 100], [1, 2, 100], [2, 0, 100], [1, 3, 600], [2, 3, 200]]
+    print("Cheapest:", cheapest_price(4, flights, 0, 3, 1))
+    # Cheapest: 700
+    csr = CSRGraph.from_edges(np.array(flights)[:, :2], num_nodes=4, weights=np.array(flights)[:, 2])
+    print("Itinerary:", hop_limited(csr, 0, 3).path(3))
+    # Itinerary: [0, 1, 2, 3]
+    dist, pred, cycle = bellman_ford({'A': [('B', 1)], 'B': [('C', -2)], 'C': [('A', 0)]}, 'A')
+    print("Negative cycle:", cycle)
+    # Negative cycle: ['B', 'C', 'A']
@@ -1,54 +1,220 @@
 from collections import deque
 
+import numpy as np
 
+from .csr import CSRGraph, as_csr
+from .instrument import active, instrumented, phase, scanned
+
+
+@instrumented("bfs")
 def bfs(graph,start):
+    if isinstance(graph, CSRGraph):
+        res = bfs_ids(graph, graph.id_of(start))
+        with phase(active(), "export"):
+            return graph.labels_of(res)
+
     visited = set()
     q = deque([start])
     res = []
 
+    push, pop = q.append, q.popleft
+    stats = active()
+    if stats is not None:
+        push, pop = stats.counting(push, pop, q.__len__)
 
     while q:
-        node = q.popleft()
+        node = pop()
         if node not in visited:
             res.append(node)
             visited.add(node)
             for ni in graph[node]:
                 if ni not in visited:
-                    q.append(ni)
+                    push(ni)
+    if stats is not None:
+        stats.finish(len(res), sum(len(graph[node]) for node in res))
     return res
-    
 
 
-# Example usage
-graph = {
-    'A': ['B', 'C'],
-    'B': ['A', 'D', 'E'],
-    'C': ['A', 'F'],
-    'D': ['B'],
-    'E': ['B', 'F'],
-    'F': ['C', 'E']
-}
+@instrumented("bfs_ids")
+def bfs_ids(csr, start):
+    # same visit order as bfs(), on integer ids with a bytearray visited set;
+    # nodes are marked when queued so the queue never holds duplicates
+    offsets, targets, _ = csr.buffers()
+    visited = bytearray(csr.num_nodes)
+    visited[start] = 1
+    res = [start]
+    q = deque(res)
+    push, pop = q.append, q.popleft
+    stats = active()
+    if stats is not None:
+        push, pop = stats.counting(push, pop, q.__len__)
 
-print("BFS Traversal:", bfs(graph, 'A'))
-# BFS Traversal: ['A', 'B', 'C', 'D', 'E', 'F']
+    while q:
+        node = pop()
+        for ni in targets[offsets[node]:offsets[node + 1]]:
+            if not visited[ni]:
+                visited[ni] = 1
+                res.append(ni)
+                push(ni)
+    if stats is not None:
+        stats.finish(len(res), scanned(csr, res))
+    return res
 
 
+@instrumented("bfs_levels")
+def bfs_levels(graph, start):
+    """Level-synchronous BFS: the whole frontier is expanded per step with array ops.
 
-from collections import deque
+    Returns `(levels, depth)`: `levels[k]` is an id array of the nodes at hop
+    distance k, in the same order `bfs_ids` visits them, and `depth[u]` is the
+    hop distance of u (-1 if unreachable).
+    """
+    stats = active()
+    with phase(stats, "convert"):
+        csr = as_csr(graph)
+    offsets, targets = csr.offsets, csr.targets
+    depth = np.full(csr.num_nodes, -1, dtype=np.int32)
+    first = np.empty(csr.num_nodes, dtype=np.int64)
+    if stats is not None:
+        stats.begin()
 
+    frontier = np.array([csr.id_of(start)], dtype=targets.dtype)
+    depth[frontier] = 0
+    levels = []
+    level = 0
+    while len(frontier):
+        levels.append(frontier)
+        level += 1
+        cand = targets[_gather_ranges(offsets[frontier], offsets[frontier + 1])]
+        cand = cand[depth[cand] < 0]
+        # keep the first occurrence of each node so the scan order matches the
+        # queue order: scatter positions back to front, last write wins
+        pos = np.arange(len(cand))
+        first[cand[::-1]] = pos[::-1]
+        frontier = cand[first[cand] == pos]
+        depth[frontier] = level
+    if stats is not None:
+        # a level counts as one push and pop per node it holds
+        settled = sum(len(lv) for lv in levels)
+        stats.add(pushes=settled, pops=settled, levels=len(levels))
+        stats.peak("max_frontier", max(len(lv) for lv in levels))
+        stats.finish(settled, scanned(csr, np.concatenate(levels)))
+    return levels, depth
 
-def bfs(graph,start):
-    q = deque([start])
-    v = set()
-    res = []
 
+@instrumented("bfs_direction_optimizing")
+def bfs_direction_optimizing(graph, start, alpha=14, beta=24, reverse=None, probe_rounds=4):
+    """Beamer-style BFS that switches between top-down and bottom-up steps.
 
-    while q:
-        node = q.popleft()
+    Top-down expands the frontier's out-edges; bottom-up has every unvisited
+    node look for a parent in the frontier and stop at the first hit. It goes
+    bottom-up once the frontier's out-edges exceed 1/alpha of the unvisited
+    nodes' edges, and back once the frontier shrinks below n/beta nodes.
+    `reverse` is the in-edge CSR (pass it in to reuse it across calls on
+    directed graphs). Returns the depth array, like `bfs_levels(...)[1]`.
+    """
+    stats = active()
+    with phase(stats, "convert"):
+        csr = as_csr(graph)
+    n = csr.num_nodes
+    if reverse is None:
+        with phase(stats, "reverse"):
+            reverse = csr.reverse()
+    offsets, targets = csr.offsets, csr.targets
+    in_offsets, in_targets = reverse.offsets, reverse.targets
+    out_degree = np.diff(offsets)
 
-        if node not in v:
-            v.add(node)
-            res.append(node)
-            for nei in graph[node]:
-                q.append(nei)
-                
\ No newline at end of file
+    depth = np.full(n, -1, dtype=np.int32)
+    in_frontier = np.zeros(n, dtype=bool)
+    frontier = np.array([csr.id_of(start)], dtype=np.int64)
+    depth[frontier] = 0
+    unexplored_edges = int(offsets[-1]) - int(out_degree[frontier].sum())
+    bottom_up = False
+    level = 0
+    if stats is not None:
+        stats.begin()
+    while len(frontier):
+        level += 1
+        frontier_edges = int(out_degree[frontier].sum())
+        if not bottom_up and frontier_edges > unexplored_edges / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / beta:
+            bottom_up = False
+
+        if bottom_up:
+            in_frontier[frontier] = True
+            nxt = _bottom_up_step(in_offsets, in_targets, np.flatnonzero(depth < 0), in_frontier, probe_rounds)
+            in_frontier[frontier] = False
+        else:
+            cand = targets[_gather_ranges(offsets[frontier], offsets[frontier + 1])]
+            nxt = np.unique(cand[depth[cand] < 0])
+        depth[nxt] = level
+        unexplored_edges -= int(out_degree[nxt].sum())
+        if stats is not None:
+            # top-down steps relax the frontier's out-edges; bottom-up steps
+            # stop early per node, so they are counted by step only
+            if bottom_up:
+                stats.add(levels=1, bottom_up_steps=1)
+            else:
+                stats.add(levels=1, top_down_steps=1, relaxed=frontier_edges)
+            stats.peak("max_frontier", len(frontier))
+        frontier = nxt
+    if stats is not None:
+        settled = int((depth >= 0).sum())
+        stats.add(pushes=settled, pops=settled)
+        stats.finish(settled, 0)
+    return depth
+
+
+def _bottom_up_step(in_offsets, in_targets, unvisited, in_frontier, probe_rounds):
+    # the first few in-edges of every unvisited node are probed one round at a
+    # time so nodes drop out at their first frontier parent (the early exit
+    # that makes bottom-up cheap); whatever is left scans its remaining edges
+    found = []
+    lo, hi = in_offsets[unvisited], in_offsets[unvisited + 1]
+    for _ in range(probe_rounds):
+        live = lo < hi
+        unvisited, lo, hi = unvisited[live], lo[live], hi[live]
+        if not len(unvisited):
+            break
+        hit = in_frontier[in_targets[lo]]
+        found.append(unvisited[hit])
+        miss = ~hit
+        unvisited, lo, hi = unvisited[miss], lo[miss] + 1, hi[miss]
+    live = lo < hi
+    unvisited, lo, hi = unvisited[live], lo[live], hi[live]
+    if len(unvisited):
+        hits = in_frontier[in_targets[_gather_ranges(lo, hi)]]
+        starts = np.cumsum(hi - lo) - (hi - lo)
+        found.append(unvisited[np.logical_or.reduceat(hits, starts)])
+    return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+
+def _gather_ranges(starts, stops):
+    # concatenation of range(starts[i], stops[i]) for every i, without a loop
+    lens = stops - starts
+    total = int(lens.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    shift = np.repeat(starts - np.cumsum(lens) + lens, lens)
+    return shift + np.arange(total, dtype=np.int64)
+
+
+if __name__ == "__main__":
+    # Example usage
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E']
+    }
+
+    print("BFS Traversal:", bfs(graph, 'A'))
+    # BFS Traversal: ['A', 'B', 'C', 'D', 'E', 'F']
+    csr = CSRGraph.from_adjacency(graph)
+    print("BFS Traversal (CSR):", bfs(csr, 'A'))
+    levels, depth = bfs_levels(csr, 'A')
+    print("BFS Levels:", [csr.labels_of(level) for level in levels])
+    # BFS Levels: [['A'], ['B', 'C'], ['D', 'E', 'F']]
@@ -0,0 +1,260 @@
+from array import array
+
+import numpy as np
+
+from .csr import as_csr
+from .grid import DIRECTIONS
+
+
+# Minimax ("bottleneck") paths: the cheapest way from s to t when a path
+# costs its single most expensive edge. Adding edges in Kruskal order and
+# recording every merge as a new tree node whose value is the edge weight
+# gives the Kruskal reconstruction tree; the bottleneck between s and t is
+# then the value of their lowest common ancestor. LCA queries walk a
+# heavy-light decomposition of that tree, so each one crosses O(log n)
+# chains whatever the tree's depth.
+
+
+class BottleneckTree:
+    """Kruskal reconstruction tree (or forest) with O(log n) bottleneck queries.
+
+    parent[v] is v's tree parent (v itself for roots) and value[v] the
+    weight at which v's subtree was completed. Build with kruskal_tree()
+    for weighted graphs or grid_tree() for height grids.
+    """
+
+    __slots__ = ("parent", "value", "depth", "head", "labels", "index", "shape", "_buffers")
+
+    def __init__(self, parent, value, size, labels=None, shape=None):
+        self.parent = parent
+        self.value = value
+        self.depth, self.head = _decompose(parent, size)
+        self.labels = labels
+        self.index = None if labels is None else {label: i for i, label in enumerate(labels)}
+        self.shape = shape
+        self._buffers = None
+
+    def __len__(self):
+        return len(self.parent)
+
+    def id_of(self, node):
+        if self.index is not None:
+            return self.index[node]
+        if self.shape is not None and isinstance(node, tuple):
+            return node[0] * self.shape[1] + node[1]
+        return node
+
+    def lca(self, u, v):
+        """Lowest common ancestor of two tree nodes, or -1 if they are in different trees."""
+        if self._buffers is None:
+            self._buffers = tuple(memoryview(a) for a in (self.parent, self.depth, self.head))
+        parent, depth, head = self._buffers
+        while head[u] != head[v]:
+            if depth[head[u]] < depth[head[v]]:
+                u, v = v, u
+            if depth[head[u]] == 0:
+                return -1
+            u = parent[head[u]]
+        return u if depth[u] < depth[v] else v
+
+    def bottleneck(self, source, target):
+        """Smallest possible largest weight on a source-target path (inf if disconnected)."""
+        a = self.lca(self.id_of(source), self.id_of(target))
+        return float("inf") if a < 0 else self.value[a].item()
+
+    def bottlenecks(self, sources, targets):
+        """Vectorised bottleneck() for arrays of node ids: every query climbs at once."""
+        parent, depth, head, value = self.parent, self.depth, self.head, self.value
+        u = np.asarray(sources, dtype=parent.dtype).copy()
+        v = np.asarray(targets, dtype=parent.dtype).copy()
+        res = np.empty(len(u), dtype=np.float64)
+        live = np.arange(len(u))
+        while len(live):
+            hu, hv = head[u], head[v]
+            done = hu == hv
+            if done.any():
+                a = np.where(depth[u[done]] < depth[v[done]], u[done], v[done])
+                res[live[done]] = value[a]
+            swap = depth[hu] < depth[hv]
+            u, v = np.where(swap, v, u), np.where(swap, u, v)
+            top = head[u]
+            apart = ~done & (depth[top] == 0)
+            res[live[apart]] = np.inf
+            keep = ~done & ~apart
+            live, u, v = live[keep], parent[top[keep]], v[keep]
+        return res
+
+
+def _decompose(parent, size):
+    # heavy-light decomposition by pointer jumping, so no step walks the
+    # tree one level at a time: depth by list ranking, then every node's
+    # chain head is its nearest ancestor-or-self that is not a heavy child
+    n = len(parent)
+    nodes = np.arange(n, dtype=parent.dtype)
+    child = nodes[parent != nodes]
+    # heavy child: the biggest subtree under each parent (ties: any of them)
+    biggest = np.zeros(n, dtype=size.dtype)
+    np.maximum.at(biggest, parent[child], size[child])
+    heavy = np.full(n, -1, dtype=parent.dtype)
+    cand = child[size[child] == biggest[parent[child]]]
+    heavy[parent[cand]] = cand
+
+    depth = (parent != nodes).astype(parent.dtype)
+    up = parent.copy()
+    while True:
+        depth += depth[up]
+        nxt = up[up]
+        if np.array_equal(nxt, up):
+            break
+        up = nxt
+    head = np.where(heavy[parent] == nodes, parent, nodes)
+    while True:
+        nxt = head[head]
+        if np.array_equal(nxt, head):
+            break
+        head = nxt
+    return depth, head
+
+
+def kruskal_tree(graph):
+    """Kruskal reconstruction tree of a weighted graph (`{node: [(nei, w)]}` or CSRGraph).
+
+    Edges are treated as undirected (and as weight 1 if unweighted). Leaves are the graph's nodes (value
+    -inf: a path with no edges); each merge adds a node valued at the edge
+    weight, so a connected graph of n nodes gives 2n-1 tree nodes.
+    """
+    csr = as_csr(graph)
+    n = csr.num_nodes
+    src = np.repeat(np.arange(n, dtype=np.int64), np.diff(csr.offsets))
+    weights = csr.weights if csr.weighted else np.ones(csr.num_edges)
+    order = np.argsort(weights, kind="stable")
+    parent, value, size = _kruskal(n, src[order], csr.targets[order], weights[order])
+    return BottleneckTree(parent, value, size, labels=csr.labels)
+
+
+def _kruskal(n, src, dst, weights):
+    # union-find over tree nodes: a set's root is the tree node for it so far
+    dsu = array("q")
+    dsu.frombytes(np.arange(2 * n, dtype=np.int64).tobytes())
+    parent = np.arange(2 * n, dtype=np.int64)
+    value = np.full(2 * n, -np.inf)
+    size = np.ones(2 * n, dtype=np.int64)
+    par, val, sz = memoryview(parent), memoryview(value), memoryview(size)
+    node = n
+    for a, b, w in zip(memoryview(src), memoryview(dst), memoryview(weights)):
+        while dsu[a] != a:
+            dsu[a] = dsu[dsu[a]]
+            a = dsu[a]
+        while dsu[b] != b:
+            dsu[b] = dsu[dsu[b]]
+            b = dsu[b]
+        if a == b:
+            continue
+        dsu[a] = dsu[b] = par[a] = par[b] = node
+        val[node] = w
+        sz[node] = sz[a] + sz[b]
+        node += 1
+        if node == 2 * n - 1:
+            break
+    return parent[:node], value[:node], size[:node]
+
+
+def grid_tree(heights, connectivity=4):
+    """Merge tree of a height grid for swim-in-rising-water style queries.
+
+    A path costs the highest cell on it (endpoints included). Cells join in
+    height order and each cell becomes the parent of the components it
+    connects, so the tree needs no extra nodes: value[v] is just v's height.
+    Nodes are flat cell ids r * cols + c; queries also accept (r, c) tuples.
+    """
+    h = np.asarray(heights)
+    hi, lo = _grid_steps(h, connectivity)
+    parent, size = _merge_cells(h.size, hi, lo)
+    return BottleneckTree(parent, h.ravel(), size, shape=h.shape)
+
+
+def _grid_steps(h, connectivity):
+    # adjacent cell pairs as (later, earlier) in height order, grouped by the
+    # later cell in the order a sweep over rising water meets them; walking
+    # the cells in height order gives that grouping without sorting pairs
+    rows, cols = h.shape
+    idx = np.int32 if h.size < 2**31 else np.int64
+    order = np.argsort(h, axis=None, kind="stable").astype(idx)
+    rank = np.empty(h.size, dtype=idx)
+    rank[order] = np.arange(h.size, dtype=idx)
+    row, col = order // cols, order % cols
+    steps = DIRECTIONS[connectivity]
+    lo = np.full((h.size, len(steps)), -1, dtype=idx)
+    for d, (dr, dc) in enumerate(steps):
+        ok = (row + dr >= 0) & (row + dr < rows) & (col + dc >= 0) & (col + dc < cols)
+        nb = np.where(ok, order + (dr * cols + dc), 0)
+        ok &= rank[nb] < rank[order]
+        lo[ok, d] = nb[ok]
+    hi = np.repeat(order, len(steps))
+    lo = lo.ravel()
+    keep = lo >= 0
+    return hi[keep], lo[keep]
+
+
+def _merge_cells(n, hi, lo):
+    # union-find where the cell that joins the components is the new root,
+    # which makes the union-find forest's root links the merge tree's edges
+    dsu = array("q")
+    dsu.frombytes(np.arange(n, dtype=np.int64).tobytes())
+    parent = np.arange(n, dtype=np.int64)
+    size = np.ones(n, dtype=np.int64)
+    par, sz = memoryview(parent), memoryview(size)
+    for c, x in zip(memoryview(hi), memoryview(lo)):
+        while dsu[x] != x:
+            dsu[x] = dsu[dsu[x]]
+            x = dsu[x]
+        if x != c:
+            dsu[x] = par[x] = c
+            sz[c] += sz[x]
+    return parent, size
+
+
+def swim_in_water(grid, source=(0, 0), target=None, connectivity=4):
+    """Single query: lowest water level at which source and target connect.
+
+    Raises cells in height order with a union-find and stops as soon as the
+    two meet, so there is no tree to build; use grid_tree() for many queries.
+    """
+    h = np.asarray(grid)
+    rows, cols = h.shape
+    if target is None:
+        target = (rows - 1, cols - 1)
+    s, t = source[0] * cols + source[1], target[0] * cols + target[1]
+    hf = h.ravel()
+    hi, lo = _grid_steps(h, connectivity)
+    dsu = array("q")
+    dsu.frombytes(np.arange(h.size, dtype=np.int64).tobytes())
+    level = max(hf[s], hf[t]).item()
+    if s == t:
+        return level
+    for c, x in zip(memoryview(hi), memoryview(lo)):
+        while dsu[x] != x:
+            dsu[x] = dsu[dsu[x]]
+            x = dsu[x]
+        if x != c:
+            dsu[x] = c
+            # c is the newest root, so s and t have met once both find c
+            a, b = s, t
+            while dsu[a] != a:
+                dsu[a] = dsu[dsu[a]]
+                a = dsu[a]
+            while dsu[b] != b:
+                dsu[b] = dsu[dsu[b]]
+                b = dsu[b]
+            if a == b:
+                return max(level, hf[c].item())
+    return float("inf")
+
+
+if __name__ == "__main__":
+    grid = [[0, 1, 2, 3, 4], [24, 23, 22, 21, 5], [12, 13, 14, 15, 16], [11, 17, 18, 19, 20], [10, 9, 8, 7, 6]]
+    print("Swim:", swim_in_water(grid))
+    # Swim: 16
+    tree = grid_tree(grid)
+    print("Swim via tree:", tree.bottleneck((0, 0), (4, 4)), tree.bottleneck((0, 0), (0, 4)))
+    # Swim via tree: 16 4
@@ -0,0 +1,191 @@
+import heapq
+import json
+
+import numpy as np
+
+from .csr import CSRGraph, as_csr
+
+
+# Contraction hierarchies: nodes are contracted one at a time in order of
+# importance, adding a shortcut u->w whenever the only shortest u->w path
+# ran through the contracted node v. Afterwards every shortest path can be
+# found by two small Dijkstra searches that only ever move to more
+# important nodes: forward from s and backward from t.
+
+
+class ContractionHierarchy:
+    __slots__ = ("rank", "forward", "backward", "_buffers")
+
+    def __init__(self, rank, forward, backward):
+        self.rank = rank
+        self.forward = forward    # v -> higher-ranked w, for the search from s
+        self.backward = backward  # v -> higher-ranked u with an edge u->v, for the search from t
+        self._buffers = None
+
+    def distance(self, source, target):
+        """Shortest source->target distance, inf if unreachable."""
+        s, t = self.forward.id_of(source), self.forward.id_of(target)
+        if self._buffers is None:
+            self._buffers = (self.forward.buffers(), self.backward.buffers())
+        fwd, bwd = self._buffers
+        dists = ({s: 0}, {t: 0})
+        heaps = ([(0, s)], [(0, t)])
+        best = 0 if s == t else float("inf")
+
+        side = 0
+        while heaps[0] or heaps[1]:
+            if not heaps[side]:
+                side = 1 - side
+            curr_dist, node = heapq.heappop(heaps[side])
+            dist, other = dists[side], dists[1 - side]
+            if curr_dist > dist[node]:
+                continue
+            if curr_dist >= best:
+                heaps[side].clear()
+                continue
+            if node in other and curr_dist + other[node] < best:
+                best = curr_dist + other[node]
+            offsets, targets, weights = fwd if side == 0 else bwd
+            for i in range(offsets[node], offsets[node + 1]):
+                nei = targets[i]
+                temp_dist = curr_dist + weights[i]
+                if temp_dist < dist.get(nei, float("inf")):
+                    dist[nei] = temp_dist
+                    heapq.heappush(heaps[side], (temp_dist, nei))
+            side = 1 - side
+        return best
+
+    def save(self, path):
+        labels = self.forward.labels
+        np.savez(
+            path,
+            rank=self.rank,
+            forward_offsets=self.forward.offsets, forward_targets=self.forward.targets,
+            forward_weights=self.forward.weights,
+            backward_offsets=self.backward.offsets, backward_targets=self.backward.targets,
+            backward_weights=self.backward.weights,
+            labels=np.array(json.dumps(labels)),
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            labels = json.loads(str(data["labels"]))
+            if labels is not None:
+                # JSON has no tuples; grid-style (row, col) labels come back as lists
+                labels = [tuple(x) if isinstance(x, list) else x for x in labels]
+            graphs = []
+            for side in ("forward", "backward"):
+                csr = CSRGraph(data[side + "_offsets"], data[side + "_targets"], data[side + "_weights"])
+                if labels is not None:
+                    csr.labels = labels
+                    csr.index = {label: i for i, label in enumerate(labels)}
+                graphs.append(csr)
+            return cls(data["rank"], *graphs)
+
+
+def build_contraction_hierarchy(graph, witness_limit=100):
+    """Preprocess a `{node: [(nei, w)]}` graph or weighted CSRGraph into a ContractionHierarchy.
+
+    Deterministic: ties in the node ordering break on node id. `witness_limit`
+    caps how many nodes each witness search may settle; a smaller limit
+    preprocesses faster but adds more (harmless) shortcuts.
+    """
+    csr = as_csr(graph)
+    n = csr.num_nodes
+    offsets, targets, weights = csr.buffers(unit_weights=True)
+    out = [{} for _ in range(n)]
+    inn = [{} for _ in range(n)]
+    for u in range(n):
+        for i in range(offsets[u], offsets[u + 1]):
+            v, w = targets[i], weights[i]
+            if v != u and w < out[u].get(v, float("inf")):
+                out[u][v] = inn[v][u] = w
+
+    deleted_neighbors = [0] * n
+    fwd, bwd = [None] * n, [None] * n
+    rank = np.empty(n, dtype=np.int64)
+
+    def witness(u, skip, limit_dist):
+        dist = {u: 0}
+        heap = [(0, u)]
+        settled = 0
+        while heap and settled < witness_limit:
+            d, x = heapq.heappop(heap)
+            if d > dist[x]:
+                continue
+            if d > limit_dist:
+                break
+            settled += 1
+            for y, w in out[x].items():
+                if y != skip and d + w < dist.get(y, float("inf")):
+                    dist[y] = d + w
+                    heapq.heappush(heap, (d + w, y))
+        return dist
+
+    def shortcuts(v):
+        res = []
+        for u, wu in inn[v].items():
+            bounds = {w: wu + ww for w, ww in out[v].items() if w != u}
+            if not bounds:
+                continue
+            dist = witness(u, v, max(bounds.values()))
+            for w, bound in bounds.items():
+                if dist.get(w, float("inf")) > bound:
+                    res.append((u, w, bound))
+        return res
+
+    def priority(v, added):
+        # edge difference plus a spread term so contraction stays uniform
+        return len(added) - len(inn[v]) - len(out[v]) + deleted_neighbors[v]
+
+    heap = [(priority(v, shortcuts(v)), v) for v in range(n)]
+    heapq.heapify(heap)
+    order = 0
+    while heap:
+        _, v = heapq.heappop(heap)
+        # lazy update: re-evaluate and only contract if v is still the minimum
+        added = shortcuts(v)
+        p = priority(v, added)
+        if heap and (p, v) > heap[0]:
+            heapq.heappush(heap, (p, v))
+            continue
+
+        for u, w, bound in added:
+            if bound < out[u].get(w, float("inf")):
+                out[u][w] = inn[w][u] = bound
+        fwd[v], bwd[v] = out[v], inn[v]
+        for w in out[v]:
+            del inn[w][v]
+            deleted_neighbors[w] += 1
+        for u in inn[v]:
+            del out[u][v]
+            deleted_neighbors[u] += 1
+        out[v], inn[v] = {}, {}
+        rank[v] = order
+        order += 1
+
+    return ContractionHierarchy(rank, _to_csr(fwd, csr), _to_csr(bwd, csr))
+
+
+def _to_csr(adjacency, csr):
+    offsets = np.zeros(len(adjacency) + 1, dtype=np.int64)
+    np.cumsum([len(a) for a in adjacency], out=offsets[1:])
+    targets = np.fromiter((w for a in adjacency for w in a), dtype=np.int64, count=offsets[-1])
+    weights = np.fromiter((x for a in adjacency for x in a.values()), dtype=np.float64, count=offsets[-1])
+    res = CSRGraph(offsets, targets, weights)
+    res.labels, res.index = csr.labels, csr.index
+    return res
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': [('B', 2), ('C', 4)],
+        'B': [('A', 2), ('C', 1), ('D', 7)],
+        'C': [('A', 4), ('B', 1), ('E', 3)],
+        'D': [('B', 7), ('E', 1)],
+        'E': [('C', 3), ('D', 1)]
+    }
+    ch = build_contraction_hierarchy(graph)
+    print("CH A -> D:", ch.distance('A', 'D'))
+    # CH A -> D: 7.0
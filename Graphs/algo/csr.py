@@ -0,0 +1,173 @@
+from array import array
+
+import numpy as np
+
+
+# Compressed sparse row graph: the neighbours of node u are
+# targets[offsets[u]:offsets[u+1]] (and the matching slice of weights).
+# Nodes are dense integer ids 0..n-1; arbitrary labels are interned once
+# into `labels` / `index` so the hot loops never hash a label.
+class CSRGraph:
+    __slots__ = ("offsets", "targets", "weights", "labels", "index")
+
+    def __init__(self, offsets, targets, weights=None, labels=None):
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=_id_dtype(len(self.offsets) - 1))
+        self.weights = None if weights is None else np.asarray(weights, dtype=np.float64)
+        self.labels = labels
+        self.index = None if labels is None else {label: i for i, label in enumerate(labels)}
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    @property
+    def weighted(self):
+        return self.weights is not None
+
+    def __contains__(self, label):
+        # is `label` a node? ids 0..n-1 when there is no label table
+        if self.index is None:
+            return isinstance(label, (int, np.integer)) and 0 <= label < self.num_nodes
+        try:
+            return label in self.index
+        except TypeError:
+            return False
+
+    def id_of(self, label):
+        return label if self.index is None else self.index[label]
+
+    def label_of(self, node):
+        return node if self.labels is None else self.labels[node]
+
+    def labels_of(self, nodes):
+        if self.labels is None:
+            return list(nodes)
+        labels = self.labels
+        return [labels[u] for u in nodes]
+
+    def neighbors(self, node):
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def degree(self, node):
+        return int(self.offsets[node + 1] - self.offsets[node])
+
+    def edge_weights(self):
+        """The weights, or unit weights (hop counts) for an unweighted graph."""
+        return self.weights if self.weights is not None else np.ones(self.num_edges)
+
+    def buffers(self, unit_weights=False):
+        # memoryviews index to plain Python ints/floats, which is much cheaper
+        # than numpy scalars inside interpreted loops. unit_weights=True
+        # stands in 1.0 per edge when the graph has no weights, for the
+        # searches that need some
+        weights = self.edge_weights() if unit_weights else self.weights
+        weights = None if weights is None else memoryview(weights)
+        return memoryview(self.offsets), memoryview(self.targets), weights
+
+    def reverse(self):
+        sources = np.repeat(np.arange(self.num_nodes, dtype=self.targets.dtype), np.diff(self.offsets))
+        return CSRGraph._from_arrays(self.targets, sources, self.weights, self.num_nodes, self.labels)
+
+    def to_adjacency(self):
+        offsets, targets, weights = self.buffers()
+        graph = {}
+        for u in range(self.num_nodes):
+            lo, hi = offsets[u], offsets[u + 1]
+            if weights is None:
+                graph[self.label_of(u)] = [self.label_of(v) for v in targets[lo:hi]]
+            else:
+                graph[self.label_of(u)] = [(self.label_of(targets[i]), weights[i]) for i in range(lo, hi)]
+        return graph
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        """Build from the `{node: [nei, ...]}` / `{node: [(nei, w), ...]}` form."""
+        labels = list(graph)
+        index = {label: i for i, label in enumerate(labels)}
+        weighted = any(isinstance(nei, tuple) for neis in graph.values() for nei in neis[:1])
+
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d") if weighted else None
+        for node in labels:
+            for nei in graph[node]:
+                if weighted:
+                    nei, w = nei
+                    weights.append(w)
+                if nei not in index:
+                    index[nei] = len(labels)
+                    labels.append(nei)
+                targets.append(index[nei])
+            offsets.append(len(targets))
+        # nodes that only ever appear as a neighbour have no out-edges
+        offsets.extend([len(targets)] * (len(labels) + 1 - len(offsets)))
+
+        csr = cls(np.frombuffer(offsets, dtype=np.int64), np.frombuffer(targets, dtype=np.int64),
+                  None if weights is None else np.frombuffer(weights, dtype=np.float64))
+        csr.labels, csr.index = labels, index
+        return csr
+
+    @classmethod
+    def from_edges(cls, edges, num_nodes=None, weights=None, directed=True):
+        """Build from `(u, v)` / `(u, v, w)` edges as `build_adjacency_list` takes them.
+
+        With `num_nodes` the endpoints are taken to be ids in range(num_nodes)
+        and no label table is kept; otherwise every endpoint is interned. An
+        (m, 3) array's last column is the weights unless `weights` is given.
+        """
+        if isinstance(edges, np.ndarray) and num_nodes is not None:
+            if edges.ndim != 2 or edges.shape[1] not in (2, 3):
+                raise ValueError(f"edges must be an (m, 2) or (m, 3) array, got shape {edges.shape}")
+            if edges.shape[1] == 3 and weights is None:
+                weights = edges[:, 2]
+            pairs = edges[:, :2]
+        else:
+            edges = list(edges)
+            if weights is None and edges and len(edges[0]) == 3:
+                weights = [e[2] for e in edges]
+            pairs = [(e[0], e[1]) for e in edges]
+        labels = None
+        if num_nodes is None:
+            labels, index = [], {}
+            ids = array("q")
+            for u, v in pairs:
+                for x in (u, v):
+                    if x not in index:
+                        index[x] = len(labels)
+                        labels.append(x)
+                    ids.append(index[x])
+            pairs = np.frombuffer(ids, dtype=np.int64).reshape(-1, 2)
+            num_nodes = len(labels)
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        src, dst = pairs[:, 0], pairs[:, 1]
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+        if not directed:
+            src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+            if weights is not None:
+                weights = np.concatenate([weights, weights])
+        return cls._from_arrays(src, dst, weights, num_nodes, labels)
+
+    @classmethod
+    def _from_arrays(cls, src, dst, weights, num_nodes, labels=None):
+        order = np.argsort(src, kind="stable")
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_nodes), out=offsets[1:])
+        csr = cls(offsets, dst[order], None if weights is None else weights[order])
+        if labels is not None:
+            csr.labels = labels
+            csr.index = {label: i for i, label in enumerate(labels)}
+        return csr
+
+
+def _id_dtype(num_nodes):
+    return np.int32 if num_nodes < 2**31 else np.int64
+
+
+def as_csr(graph):
+    return graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
@@ -1,56 +1,73 @@
-from collections import deque
+from .csr import CSRGraph
+from .instrument import active, instrumented, phase, scanned
 
 
+@instrumented("dfs")
 def dfs(graph,start):
+    if isinstance(graph, CSRGraph):
+        res = dfs_ids(graph, graph.id_of(start))
+        with phase(active(), "export"):
+            return graph.labels_of(res)
+
     v =set()
     s= [start]
 
     res = []
 
+    push, pop = s.append, s.pop
+    stats = active()
+    if stats is not None:
+        push, pop = stats.counting(push, pop, s.__len__)
+
     while s:
-        node = s.pop()
+        node = pop()
         if node not in v:
             v.add(node)
             res.append(node)
             for ni in graph[node]:
                 if ni not in v:
-                    s.append(ni)
+                    push(ni)
+    if stats is not None:
+        stats.finish(len(res), sum(len(graph[node]) for node in res))
     return res
 
 
-
-
-# Example usage
-graph = {
-    'A': ['B', 'C'],
-    'B': ['A', 'D', 'E'],
-    'C': ['A', 'F'],
-    'D': ['B'],
-    'E': ['B', 'F'],
-    'F': ['C', 'E']
-}
-
-print("DFS Traversal:", dfs(graph, 'A'))
-# DFS Traversal: ['A', 'C', 'F', 'E', 'B', 'D']
-
-
-
-
-from collections import deque
-
-
-def dfs(graph,start):
+@instrumented("dfs_ids")
+def dfs_ids(csr, start):
+    # same visit order as dfs(): nodes are marked when popped, not when pushed
+    offsets, targets, _ = csr.buffers()
+    v = bytearray(csr.num_nodes)
     s = [start]
-    v = set()
     res = []
-
+    push, pop = s.append, s.pop
+    stats = active()
+    if stats is not None:
+        push, pop = stats.counting(push, pop, s.__len__)
 
     while s:
-        node = s.pop()
-        if node not in v:
-            v.add(node)
+        node = pop()
+        if not v[node]:
+            v[node] = 1
             res.append(node)
-            for nei in graph[node]:
-                s.append(node)
+            for ni in targets[offsets[node]:offsets[node + 1]]:
+                if not v[ni]:
+                    push(ni)
+    if stats is not None:
+        stats.finish(len(res), scanned(csr, res))
+    return res
+
 
-    return res
\ No newline at end of file
+if __name__ == "__main__":
+    # Example usage
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E']
+    }
+
+    print("DFS Traversal:", dfs(graph, 'A'))
+    # DFS Traversal: ['A', 'C', 'F', 'E', 'B', 'D']
+    print("DFS Traversal (CSR):", dfs(CSRGraph.from_adjacency(graph), 'A'))
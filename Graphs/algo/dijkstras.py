@@ -1,16 +1,41 @@
 import heapq
-from collections import defaultdict
+from array import array
 
+import numpy as np
+
+from .csr import CSRGraph, as_csr
+from .instrument import active, instrumented, phase, scanned
+from .priority_queues import make_queue
+
+
+@instrumented("dijkstra")
+def dijkstra(graph,start,queue=None):
+    # queue: None for lazy heapq insertion, or a priority_queues name/factory
+    if queue is not None:
+        stats = active()
+        with phase(stats, "convert"):
+            csr = as_csr(graph)
+        dist = dijkstra_queue(csr, csr.id_of(start), queue)
+        if graph is csr:
+            return dist
+        with phase(stats, "export"):
+            return dict(zip(csr.labels, dist.tolist()))
+    if isinstance(graph, CSRGraph):
+        return dijkstra_ids(graph, graph.id_of(start))
 
-def dijkstra(graph,start):
     heap = [(0,start)]
 
     dist = {node: float("inf") for node in graph}
 
     dist[start] = 0
 
+    push, pop = heapq.heappush, heapq.heappop
+    stats = active()
+    if stats is not None:
+        push, pop = stats.counting(push, pop, heap.__len__)
+
     while heap:
-        curr_dist , node = heapq.heappop(heap)
+        curr_dist , node = pop(heap)
         if curr_dist > dist[node]:
             continue
 
@@ -18,25 +43,324 @@ def dijkstra(graph,start):
             temp_dist = curr_dist + we
             if temp_dist < dist[nei]:
                 dist[nei] = temp_dist
-                heapq.heappush(heap,(temp_dist,nei))
+                push(heap,(temp_dist,nei))
+    if stats is not None:
+        # every reachable node is popped once at its final distance
+        reached = [node for node, d in dist.items() if d < float("inf")]
+        stats.finish(len(reached), sum(len(graph[node]) for node in reached))
     return dist 
-    
 
 
+@instrumented("dijkstra_ids")
+def dijkstra_ids(csr, start):
+    # returns a float64 array indexed by node id instead of a {node: dist} dict
+    offsets, targets, weights = csr.buffers(unit_weights=True)
+    dist = array("d", [float("inf")]) * csr.num_nodes
+    dist[start] = 0
+    heap = [(0, start)]
+    push, pop = heapq.heappush, heapq.heappop
+    stats = active()
+    if stats is not None:
+        push, pop = stats.counting(push, pop, heap.__len__)
+
+    while heap:
+        curr_dist , node = pop(heap)
+        if curr_dist > dist[node]:
+            continue
+
+        for i in range(offsets[node], offsets[node + 1]):
+            nei = targets[i]
+            temp_dist = curr_dist + weights[i]
+            if temp_dist < dist[nei]:
+                dist[nei] = temp_dist
+                push(heap,(temp_dist,nei))
+    dist = np.frombuffer(dist, dtype=np.float64)
+    if stats is not None:
+        reached = np.isfinite(dist)
+        stats.finish(int(reached.sum()), scanned(csr, reached))
+    return dist
+
+
+@instrumented("dijkstra_queue")
+def dijkstra_queue(csr, start, queue):
+    # decrease-key variant: every node sits in the queue at most once
+    offsets, targets, weights = csr.buffers(unit_weights=True)
+    q = make_queue(queue, csr.num_nodes, csr.edge_weights())
+    dist = array("d", [float("inf")]) * csr.num_nodes
+    done = bytearray(csr.num_nodes)
+    dist[start] = 0
+    push, pop = q.push, q.pop
+    stats = active()
+    if stats is not None:
+        push, pop = stats.counting(push, pop, q.__len__)
+    push(start, 0)
+
+    while q:
+        curr_dist, node = pop()
+        done[node] = 1
+        for i in range(offsets[node], offsets[node + 1]):
+            nei = targets[i]
+            temp_dist = curr_dist + weights[i]
+            if not done[nei] and temp_dist < dist[nei]:
+                dist[nei] = temp_dist
+                push(nei, temp_dist)
+    if stats is not None:
+        stats.finish(done.count(1), scanned(csr, done))
+    return np.frombuffer(dist, dtype=np.float64)
+
+
+class ShortestPathEngine:
+    """Dijkstra with a workspace that is allocated once and reused per query.
+
+    dist/pred live in flat arrays sized to the graph; a slot is only valid
+    when its stamp equals the current generation, so starting a new query is
+    O(1) instead of re-filling O(V) entries with inf.
+    """
+
+    def __init__(self, graph):
+        self.csr = as_csr(graph)
+        n = self.csr.num_nodes
+        self.dist = array("d", [0.0]) * n
+        self.pred = array("q", [-1]) * n
+        self.seen = array("q", [0]) * n
+        self.done = array("q", [0]) * n
+        self.generation = 0
+        self.sources = []
+        self.order = []
+        self._reverse = None
+
+    @instrumented("engine.run")
+    def run(self, sources, targets=None):
+        """Settle nodes from one source or a list of sources (distance to the nearest).
+
+        `sources` is read as a single node whenever it is one (so a tuple
+        label such as a grid cell is one source) and as a collection of
+        nodes otherwise. With `targets` the search stops as soon as all of
+        them are settled.
+        """
+        csr = self.csr
+        offsets, targets_buf, weights = csr.buffers(unit_weights=True)
+        dist, pred, seen, done = self.dist, self.pred, self.seen, self.done
+        self.generation += 1
+        gen = self.generation
+
+        if sources in csr:
+            sources = [sources]
+        elif not hasattr(sources, "__iter__"):
+            raise KeyError(sources)
+        self.sources = [csr.id_of(s) for s in sources]
+        heap = []
+        for s in self.sources:
+            dist[s], pred[s], seen[s] = 0.0, -1, gen
+            heap.append((0.0, s))
+        remaining = None if targets is None else {csr.id_of(t) for t in targets}
+        order = self.order = []
+        push, pop = heapq.heappush, heapq.heappop
+        stats = active()
+        if stats is not None:
+            push, pop = stats.counting(push, pop, heap.__len__)
+
+        while heap:
+            curr_dist, node = pop(heap)
+            if done[node] == gen or curr_dist > dist[node]:
+                continue
+            done[node] = gen
+            order.append(node)
+            if remaining is not None:
+                remaining.discard(node)
+                if not remaining:
+                    break
+
+            for i in range(offsets[node], offsets[node + 1]):
+                nei = targets_buf[i]
+                temp_dist = curr_dist + weights[i]
+                if seen[nei] != gen or temp_dist < dist[nei]:
+                    dist[nei], pred[nei], seen[nei] = temp_dist, node, gen
+                    push(heap, (temp_dist, nei))
+        if stats is not None:
+            relaxed = scanned(csr, order)
+            if remaining is not None and not remaining:
+                # the early exit settled the last target without relaxing its edges
+                relaxed -= scanned(csr, order[-1:])
+            stats.finish(len(order), relaxed)
+        return self
+
+    def distance(self, node):
+        u = self.csr.id_of(node)
+        return self.dist[u] if self.done[u] == self.generation else float("inf")
+
+    def path(self, target):
+        u = self.csr.id_of(target)
+        if self.done[u] != self.generation:
+            return []
+        res = []
+        while u != -1:
+            res.append(u)
+            u = self.pred[u]
+        return self.csr.labels_of(res[::-1])
+
+    def distances(self, targets=None):
+        if targets is None:
+            targets = self.csr.labels_of(self.order)
+        return {t: self.distance(t) for t in targets}
+
+    def batch(self, sources, targets=None):
+        """One query per source; returns [{node: dist}] over `targets` (or all settled nodes)."""
+        return [self.run(s, targets).distances(targets) for s in sources]
+
+    def to_target(self, target, sources=None):
+        """Distances from every node (or just `sources`) to `target` in a single search."""
+        if self._reverse is None:
+            self._reverse = ShortestPathEngine(self.csr.reverse())
+        return self._reverse.run(target, sources).distances(sources)
+
+
+def shortest_path(graph, source, target, method="bidirectional", heuristic=None, reverse=None):
+    """Point-to-point query that stops once the answer is known.
+
+    method is "bidirectional" (forward search from source and backward
+    search from target until they meet), "astar" (goal-directed with an
+    admissible `heuristic(node, target)`, see manhattan()/euclidean()) or
+    "dijkstra". Returns `(dist, path)`; `(inf, [])` if target is unreachable.
+    """
+    csr = as_csr(graph)
+    s, t = csr.id_of(source), csr.id_of(target)
+    if method == "bidirectional":
+        dist, path = _bidirectional(csr, s, t, csr.reverse() if reverse is None else reverse)
+    elif method == "astar":
+        label_of = csr.label_of
+        dist, path = _astar(csr, s, t, lambda u: heuristic(label_of(u), target))
+    elif method == "dijkstra":
+        dist, path = _astar(csr, s, t, lambda u: 0)
+    else:
+        raise ValueError(f"unknown method {method!r}")
+    return dist, csr.labels_of(path)
+
+
+def _astar(csr, s, t, h):
+    offsets, targets, weights = csr.buffers(unit_weights=True)
+    dist, pred = {s: 0}, {s: -1}
+    heap = [(h(s), 0, s)]
+
+    while heap:
+        _, curr_dist, node = heapq.heappop(heap)
+        if curr_dist > dist[node]:
+            continue
+        if node == t:
+            return curr_dist, _walk(pred, t)[::-1]
+        for i in range(offsets[node], offsets[node + 1]):
+            nei = targets[i]
+            temp_dist = curr_dist + weights[i]
+            if temp_dist < dist.get(nei, float("inf")):
+                dist[nei], pred[nei] = temp_dist, node
+                heapq.heappush(heap, (temp_dist + h(nei), temp_dist, nei))
+    return float("inf"), []
+
+
+def _bidirectional(csr, s, t, rev):
+    # sides[0] searches forward from s, sides[1] backward from t on the
+    # reversed graph; stop once the two heap tops together cannot beat the
+    # best s-t path seen so far
+    sides = []
+    for graph, root in ((csr, s), (rev, t)):
+        sides.append((graph.buffers(unit_weights=True), {root: 0}, {root: -1}, [(0, root)], set()))
+    best, meet = (0, s) if s == t else (float("inf"), -1)
+
+    while sides[0][3] and sides[1][3]:
+        if sides[0][3][0][0] + sides[1][3][0][0] >= best:
+            break
+        side = 0 if len(sides[0][3]) <= len(sides[1][3]) else 1
+        (offsets, targets, weights), dist, pred, heap, done = sides[side]
+        other_dist = sides[1 - side][1]
+        curr_dist, node = heapq.heappop(heap)
+        if node in done:
+            continue
+        done.add(node)
+        for i in range(offsets[node], offsets[node + 1]):
+            nei = targets[i]
+            temp_dist = curr_dist + weights[i]
+            if temp_dist < dist.get(nei, float("inf")):
+                dist[nei], pred[nei] = temp_dist, node
+                heapq.heappush(heap, (temp_dist, nei))
+            if nei in other_dist and temp_dist + other_dist[nei] < best:
+                best, meet = temp_dist + other_dist[nei], nei
+    if meet == -1:
+        return float("inf"), []
+    return best, _walk(sides[0][2], meet)[::-1] + _walk(sides[1][2], meet)[1:]
+
+
+def _walk(pred, node):
+    path = []
+    while node != -1:
+        path.append(node)
+        node = pred[node]
+    return path
+
+
+def manhattan(coords=None, scale=1):
+    """A* heuristic (|dx| + |dy|) * scale, admissible when every unit of distance costs >= scale.
+
+    `coords` maps node -> (x, y); without it nodes are taken to be their own
+    coordinates, as the (row, col) cells of a grid graph are.
+    """
+    pos = (lambda u: u) if coords is None else coords.__getitem__
+
+    def h(u, t):
+        (ux, uy), (tx, ty) = pos(u), pos(t)
+        return (abs(ux - tx) + abs(uy - ty)) * scale
+    return h
+
+
+def euclidean(coords=None, scale=1):
+    """Straight-line A* heuristic, see manhattan()."""
+    pos = (lambda u: u) if coords is None else coords.__getitem__
+
+    def h(u, t):
+        (ux, uy), (tx, ty) = pos(u), pos(t)
+        return ((ux - tx) ** 2 + (uy - ty) ** 2) ** 0.5 * scale
+    return h
+
+
+def grid_graph(grid):
+    """Weighted 4-neighbour graph over a list-of-lists grid, as swimInWater walks it.
+
+    Nodes are (row, col) tuples and stepping onto a cell costs its value.
+    """
+    rows, cols = len(grid), len(grid[0])
+    graph = {}
+    for r in range(rows):
+        for c in range(cols):
+            graph[(r, c)] = [((nr, nc), grid[nr][nc])
+                             for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1))
+                             if 0 <= nr < rows and 0 <= nc < cols]
+    return graph
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': [('B', 2), ('C', 4)],
+        'B': [('A', 2), ('C', 1), ('D', 7)],
+        'C': [('A', 4), ('B', 1), ('E', 3)],
+        'D': [('B', 7), ('E', 1)],
+        'E': [('C', 3), ('D', 1)]
+    }
 
+    start_node = 'B'
+    distances = dijkstra(graph, start_node)
 
+    print(f"Shortest distances from {start_node}:")
+    for node in sorted(distances):
+        print(f"{node} -> {distances[node]}")
 
-graph = {
-    'A': [('B', 2), ('C', 4)],
-    'B': [('A', 2), ('C', 1), ('D', 7)],
-    'C': [('A', 4), ('B', 1), ('E', 3)],
-    'D': [('B', 7), ('E', 1)],
-    'E': [('C', 3), ('D', 1)]
-}
+    csr = CSRGraph.from_adjacency(graph)
+    print("CSR:", dict(zip(csr.labels, dijkstra(csr, start_node))))
 
-start_node = 'B'
-distances = dijkstra(graph, start_node)
+    engine = ShortestPathEngine(graph)
+    print("B -> D:", engine.run('B', targets=['D']).distance('D'), engine.path('D'))
+    print("Batch A, E:", engine.batch(['A', 'E'], targets=['B', 'D']))
+    print("Pairing heap:", dijkstra(graph, start_node, queue="pairing"))
 
-print(f"Shortest distances from {start_node}:")
-for node in sorted(distances):
-    print(f"{node} -> {distances[node]}")
+    print("Bidirectional B -> D:", shortest_path(graph, 'B', 'D'))
+    grid = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    print("A* over a grid:", shortest_path(grid_graph(grid), (0, 0), (2, 2), method="astar",
+                                           heuristic=manhattan(scale=1)))
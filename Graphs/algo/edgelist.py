@@ -0,0 +1,269 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from .csr import CSRGraph, _id_dtype
+
+
+# Streaming edge-list loader. The file is read in chunks and never held
+# whole: a first pass counts out-degrees (and interns labels), the offsets
+# come from one cumsum, and a second pass scatters each chunk's arcs to
+# their final slots through per-node fill cursors, so the target/weight
+# arrays are allocated once at their exact size and never grow or get
+# concatenated. Within a chunk a node's arcs keep file order; with
+# directed=False the chunk's reversed arcs are placed after its forward
+# ones, so a node's arcs are in file order only per chunk and direction.
+#
+# Formats:
+#   text    "csv", "tsv" or "whitespace": one `u v [w]` edge per line,
+#           separated by commas, semicolons, tabs or spaces; lines starting
+#           with `comments` are skipped. Endpoints are integer ids unless
+#           labels=True, in which case every token is interned as a string.
+#   binary  raw little-endian records of (src, dst[, weight]) with int32 or
+#           int64 ids and a float32 weight, read through a memory map
+#           (see binary_dtype() / write_binary()). The records carry no
+#           header, so `weighted` has to be given for binary input.
+
+CHUNK_BYTES = 1 << 24
+CHUNK_ROWS = 1 << 21
+
+_SEPARATORS = bytes.maketrans(b",;\t\r", b"    ")
+_EXTENSIONS = {".csv": "csv", ".tsv": "tsv", ".bin": "binary"}
+
+
+def binary_dtype(id_dtype="int32", weighted=False):
+    """Record layout of the binary edge format."""
+    ids = np.dtype(id_dtype).newbyteorder("<")
+    fields = [("src", ids), ("dst", ids)]
+    if weighted:
+        fields.append(("weight", "<f4"))
+    return np.dtype(fields)
+
+
+def write_binary(path, edges, weights=None, id_dtype="int32"):
+    """Write `(m, 2)` edges (and optional weights) in the binary edge format."""
+    edges = np.asarray(edges).reshape(-1, 2)
+    records = np.empty(len(edges), dtype=binary_dtype(id_dtype, weights is not None))
+    records["src"], records["dst"] = edges[:, 0], edges[:, 1]
+    if weights is not None:
+        records["weight"] = weights
+    records.tofile(path)
+    return path
+
+
+def read_edges(path, format="auto", weighted=None, id_dtype="int32", header=False, comments="#",
+               chunk_rows=CHUNK_ROWS):
+    """Stream an edge list of integer ids as `(src, dst, weights)` chunks.
+
+    weights is None for unweighted input; weighted=None takes a third text
+    column as the weight when there is one. Binary records carry no
+    header, so for them weighted must be True or False.
+    """
+    format = _resolve_format(path, format)
+    if format == "binary":
+        if weighted is None:
+            raise ValueError("binary edge files carry no header; pass weighted=True or weighted=False")
+        yield from _binary_chunks(path, binary_dtype(id_dtype, bool(weighted)), chunk_rows)
+        return
+    for block, columns in _text_blocks(path, header, comments, chunk_rows):
+        yield _parse_numeric(block, columns, columns >= 3 if weighted is None else weighted)
+
+
+def load_edgelist(path, format="auto", directed=True, weighted=None, labels=False, num_nodes=None,
+                  id_dtype="int32", header=False, comments="#", chunk_rows=CHUNK_ROWS, out_dir=None,
+                  stats=None):
+    """Load an edge-list file into a CSRGraph without materialising the edge list.
+
+    directed=False stores every edge in both directions. labels=True
+    interns arbitrary string endpoints (text formats only); otherwise ids
+    are taken as they are and num_nodes defaults to the largest id + 1.
+    With `out_dir` the target/weight arrays are memory-mapped files in
+    that directory rather than RAM, for graphs larger than memory.
+    Pass a dict as `stats` to get rows, seconds and rows_per_sec back.
+    """
+    start = time.perf_counter()
+    format = _resolve_format(path, format)
+    if labels and format == "binary":
+        raise ValueError("the binary format carries integer ids; labels only apply to text")
+    scratch = None
+    names = None
+    if labels:
+        # tokenising and interning is the slow part, so pass one also
+        # writes the interned ids to a scratch binary file and pass two
+        # reads that back instead of parsing the text again
+        scratch = tempfile.NamedTemporaryFile(suffix=".bin", dir=out_dir, delete=False)
+        names, weighted = _intern(path, scratch, weighted, header, comments, chunk_rows)
+        scratch.close()
+        num_nodes = len(names)
+
+        def chunks():
+            return _binary_chunks(scratch.name, binary_dtype("int64", weighted), chunk_rows)
+    else:
+        def chunks():
+            return read_edges(path, format, weighted, id_dtype, header, comments, chunk_rows)
+    try:
+        counts, rows, weighted = _count_degrees(chunks(), directed, num_nodes)
+        n = len(counts) if num_nodes is None else num_nodes
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        m = int(offsets[-1])
+        targets = _allocate(out_dir, "targets", m, _id_dtype(n))
+        weights = _allocate(out_dir, "weights", m, np.float64) if weighted else None
+        fill = offsets[:-1].copy()
+        for src, dst, w in chunks():
+            _scatter(fill, targets, weights, src, dst, w)
+            if not directed:
+                _scatter(fill, targets, weights, dst, src, w)
+    finally:
+        if scratch is not None:
+            os.unlink(scratch.name)
+    csr = CSRGraph(offsets, targets, weights)
+    if names is not None:
+        csr.labels = names
+        csr.index = {label: i for i, label in enumerate(names)}
+    if stats is not None:
+        seconds = time.perf_counter() - start
+        stats.update(rows=rows, seconds=seconds, rows_per_sec=rows / seconds if seconds else float("inf"))
+    return csr
+
+
+def _resolve_format(path, format):
+    if format == "auto":
+        return _EXTENSIONS.get(os.path.splitext(path)[1].lower(), "whitespace")
+    if format not in ("csv", "tsv", "whitespace", "binary"):
+        raise ValueError(f"unknown format {format!r}")
+    return format
+
+
+def _binary_chunks(path, record, chunk_rows):
+    # a fresh map per chunk keeps the mapped (and resident) range small
+    size = os.path.getsize(path)
+    if size % record.itemsize:
+        raise ValueError(f"{path}: {size} bytes is not a whole number of {record.itemsize}-byte records; "
+                         f"check weighted= and id_dtype=")
+    rows = size // record.itemsize
+    weighted = "weight" in record.names
+    for lo in range(0, rows, chunk_rows):
+        part = np.memmap(path, dtype=record, mode="r", offset=lo * record.itemsize,
+                         shape=(min(chunk_rows, rows - lo),))
+        yield (part["src"].astype(np.int64), part["dst"].astype(np.int64),
+               part["weight"].astype(np.float64) if weighted else None)
+        del part
+
+
+def _text_blocks(path, header, comments, chunk_rows):
+    # whole lines in blocks of about chunk_rows, separators normalised to
+    # spaces and comment lines dropped; yields (block, columns per line)
+    comment = comments.encode() if comments else None
+    columns = None
+    with open(path, "rb") as f:
+        if header:
+            f.readline()
+        while True:
+            lines = f.readlines(CHUNK_BYTES)
+            if not lines:
+                return
+            if comment is not None:
+                lines = [line for line in lines if not line.startswith(comment)]
+            for lo in range(0, len(lines), chunk_rows):
+                part = lines[lo:lo + chunk_rows]
+                block = b"".join(part).translate(_SEPARATORS)
+                if columns is None:
+                    first = next((line for line in part if line.strip()), None)
+                    if first is None:
+                        continue
+                    columns = len(first.translate(_SEPARATORS).split())
+                    if columns < 2:
+                        raise ValueError(f"expected at least two columns per edge, got {first!r}")
+                yield block, columns
+
+
+def _parse_numeric(block, columns, weighted):
+    values = np.fromstring(block, dtype=np.float64 if weighted else np.int64, sep=" ")
+    if len(values) % columns:
+        raise ValueError("ragged edge list: every line needs the same number of columns")
+    values = values.reshape(-1, columns)
+    src, dst = values[:, 0], values[:, 1]
+    if weighted:
+        return src.astype(np.int64), dst.astype(np.int64), values[:, 2].copy()
+    return src.copy(), dst.copy(), None
+
+
+def _intern(path, scratch, weighted, header, comments, chunk_rows):
+    names, index = [], {}
+    for block, columns in _text_blocks(path, header, comments, chunk_rows):
+        if weighted is None:
+            weighted = columns >= 3
+        tokens = block.split()
+        if len(tokens) % columns:
+            raise ValueError("ragged edge list: every line needs the same number of columns")
+        # intern in row order (u then v), as CSRGraph.from_edges does
+        ends = tokens if columns == 2 else [t for pair in zip(tokens[0::columns], tokens[1::columns]) for t in pair]
+        ids = np.empty(len(ends), dtype=np.int64)
+        get = index.get
+        for i, tok in enumerate(ends):
+            node = get(tok)
+            if node is None:
+                node = index[tok] = len(names)
+                names.append(tok)
+            ids[i] = node
+        write_binary(scratch, ids, np.array(tokens[2::columns], dtype=np.float64) if weighted else None,
+                     id_dtype="int64")
+    return [name.decode() for name in names], bool(weighted)
+
+
+def _count_degrees(chunks, directed, num_nodes):
+    # out-degree per node (both ends when symmetrising), grown to the
+    # largest id seen unless num_nodes fixes it
+    counts = np.zeros(num_nodes or 0, dtype=np.int64)
+    rows = 0
+    weighted = False
+    for src, dst, w in chunks:
+        rows += len(src)
+        weighted = w is not None
+        if not len(src):
+            continue
+        low, high = min(src.min(), dst.min()), max(src.max(), dst.max())
+        if low < 0 or (num_nodes is not None and high >= num_nodes):
+            raise ValueError("edge endpoint out of range")
+        if high >= len(counts):
+            counts = np.concatenate([counts, np.zeros(int(high) + 1 - len(counts), dtype=np.int64)])
+        np.add.at(counts, src, 1)
+        if not directed:
+            np.add.at(counts, dst, 1)
+    return counts, rows, weighted
+
+
+def _allocate(out_dir, name, size, dtype):
+    if out_dir is None or size == 0:
+        return np.empty(size, dtype=dtype)
+    return np.memmap(os.path.join(out_dir, name + ".bin"), dtype=dtype, mode="w+", shape=(size,))
+
+
+def _scatter(fill, targets, weights, src, dst, w):
+    # place one chunk's arcs: sort by source (stable, to keep file order),
+    # slot k of a run of equal sources goes to fill[source] + k
+    order = np.argsort(src, kind="stable")
+    s = src[order]
+    starts = np.flatnonzero(np.concatenate(([True], s[1:] != s[:-1]))) if len(s) else np.zeros(0, dtype=np.int64)
+    sizes = np.diff(np.append(starts, len(s)))
+    nodes = s[starts]
+    pos = np.repeat(fill[nodes] - starts, sizes) + np.arange(len(s))
+    targets[pos] = dst[order]
+    if weights is not None:
+        weights[pos] = w[order]
+    fill[nodes] += sizes
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "roads.csv")
+        with open(path, "w") as f:
+            f.write("# from,to,km\nA,B,4\nA,C,2\nC,B,1\nB,D,5\n")
+        stats = {}
+        csr = load_edgelist(path, labels=True, directed=False, stats=stats)
+        print(csr.to_adjacency())
+        # {'A': [('B', 4.0), ('C', 2.0)], 'B': [('D', 5.0), ('A', 4.0), ('C', 1.0)], ...}
+        print(f"{stats['rows']} rows at {stats['rows_per_sec']:.0f} rows/sec")
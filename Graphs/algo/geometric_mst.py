@@ -0,0 +1,192 @@
+import numpy as np
+
+from .union_find import DisjointSet
+
+
+# Minimum spanning trees of point sets, where every pair of points is an
+# edge. Materialising all N^2 edges is hopeless beyond a few thousand
+# points, but the MST only ever needs a few candidates per point: the
+# nearest neighbour in each of 8 octants for the Manhattan metric, the
+# Delaunay triangulation for the Euclidean one. Small inputs skip the
+# candidate step and run a dense Prim over distance rows instead.
+
+DENSE_LIMIT = 1_000
+
+
+def point_mst(points, metric="manhattan", method="auto"):
+    """MST of a point set under the complete graph of pairwise distances.
+
+    metric  "manhattan" (L1) or "euclidean" (L2)
+    method  "auto", "dense" (O(N^2) Prim, any dimension), "sweep"
+            (Manhattan octant sweep, 2D) or "delaunay" (Euclidean, needs
+            scipy; falls back to "dense" without it)
+
+    Returns `(total, edges)`: the total weight and an (N-1, 2) int64 array
+    of point index pairs.
+    """
+    pts = np.asarray(points)
+    if pts.ndim != 2:
+        raise ValueError("points must be an (N, d) array")
+    if metric not in ("manhattan", "euclidean"):
+        raise ValueError(f"unknown metric {metric!r}")
+    if method == "auto":
+        if len(pts) <= DENSE_LIMIT or pts.shape[1] != 2:
+            method = "dense"
+        else:
+            method = "sweep" if metric == "manhattan" else "delaunay"
+    if method == "dense":
+        return dense_prim(pts, metric)
+    if method == "sweep":
+        if metric != "manhattan":
+            raise ValueError("the octant sweep only applies to the manhattan metric")
+        u, v = manhattan_candidates(pts)
+    elif method == "delaunay":
+        if metric != "euclidean":
+            raise ValueError("delaunay candidates only apply to the euclidean metric")
+        try:
+            u, v = delaunay_candidates(pts)
+        except ImportError:
+            return dense_prim(pts, metric)
+    else:
+        raise ValueError(f"unknown method {method!r}")
+    return _kruskal(len(pts), u, v, _distance(pts[u], pts[v], metric))
+
+
+def _distance(a, b, metric):
+    diff = a - b
+    if metric == "manhattan":
+        return np.abs(diff).sum(axis=-1)
+    return np.sqrt((diff.astype(np.float64) ** 2).sum(axis=-1))
+
+
+def _kruskal(n, u, v, w):
+    order = np.argsort(w, kind="stable")
+    ds = DisjointSet(n)
+    take = []
+    us, vs = u.tolist(), v.tolist()
+    for i in order.tolist():
+        if ds.union(us[i], vs[i]):
+            take.append(i)
+            if len(take) == n - 1:
+                break
+    take = np.array(take, dtype=np.int64)
+    return w[take].sum().item(), np.stack([u[take], v[take]], axis=1).astype(np.int64)
+
+
+def dense_prim(points, metric="manhattan"):
+    """O(N^2) Prim without a heap: each step updates one distance row and takes its argmin."""
+    pts = np.asarray(points)
+    n = len(pts)
+    if n < 2:
+        return 0, np.zeros((0, 2), dtype=np.int64)
+    best = _distance(pts, pts[0], metric)
+    dtype = best.dtype
+    best = best.astype(np.float64)
+    via = np.zeros(n, dtype=np.int64)
+    best[0] = np.inf
+    done = np.zeros(n, dtype=bool)
+    done[0] = True
+    edges = np.empty((n - 1, 2), dtype=np.int64)
+    weights = np.empty(n - 1, dtype=dtype)
+    for k in range(n - 1):
+        cur = int(np.argmin(best))
+        edges[k] = via[cur], cur
+        weights[k] = best[cur]
+        done[cur] = True
+        best[cur] = np.inf
+        d = _distance(pts, pts[cur], metric)
+        closer = (d < best) & ~done
+        best[closer] = d[closer]
+        via[closer] = cur
+    return weights.sum().item(), edges
+
+
+def manhattan_candidates(points):
+    """O(N) candidate edges containing a Manhattan MST of 2D points.
+
+    For each point and each of four octants (the other four are covered by
+    symmetry) keep only the nearest point in that octant. Returns `(u, v)`
+    index arrays with at most 4N edges.
+    """
+    pts = np.asarray(points)
+    x, y = pts[:, 0], pts[:, 1]
+    us, vs = [], []
+    for xs, ys in ((x, y), (y, x), (-y, x), (x, -y)):
+        near = _octant_nearest(xs, ys)
+        has = near >= 0
+        us.append(np.flatnonzero(has))
+        vs.append(near[has])
+    return np.concatenate(us), np.concatenate(vs)
+
+
+def _octant_nearest(x, y):
+    # For each i the j != i with x_j >= x_i and y_j - x_j >= y_i - x_i
+    # minimising x_j + y_j (the L1-nearest point in that octant), or -1.
+    # That is a 2D dominance-minimum query, answered offline by divide and
+    # conquer over the points sorted by y - x: at each level, every block's
+    # earlier half serves its later half through one segmented running
+    # minimum, so a level is a sort and a scan whatever the block count.
+    n = len(x)
+    order = np.lexsort((-x, -(y - x)))
+    xs = x[order]
+    by_rank = np.argsort(x + y, kind="stable")
+    rank = np.empty(n, dtype=np.int64)
+    rank[by_rank] = np.arange(n)
+    val = rank[order]
+    best = np.full(n, n, dtype=np.int64)
+    pos = np.arange(n)
+    size = 1
+    while size < n:
+        block, later = pos // (2 * size), (pos // size) & 1
+        num_blocks = int(block[-1]) + 1
+        offset = (num_blocks - 1 - block) * n
+        seq = np.lexsort((later, -xs, block))
+        key = np.where(later[seq] == 1, np.iinfo(np.int64).max, val[seq] + offset[seq])
+        low = np.minimum.accumulate(key)
+        found = (later[seq] == 1) & (low < offset[seq] + n)
+        hit = seq[found]
+        best[hit] = np.minimum(best[hit], low[found] - offset[hit])
+        size *= 2
+    near = np.full(n, -1, dtype=np.int64)
+    has = best < n
+    near[order[has]] = by_rank[best[has]]
+    return near
+
+
+def delaunay_candidates(points):
+    """Edges of the Delaunay triangulation, which contains every Euclidean MST (needs scipy)."""
+    from scipy.spatial import Delaunay, QhullError
+
+    pts = np.asarray(points, dtype=np.float64)
+    if len(pts) < 3:
+        i, j = np.triu_indices(len(pts), 1)
+        return i, j
+    try:
+        tri = Delaunay(pts)
+    except QhullError:
+        # all points on a line: the MST runs along it in sorted order
+        order = np.lexsort(pts.T[::-1])
+        return order[:-1], order[1:]
+    simplices = tri.simplices
+    d = simplices.shape[1]
+    pairs = [simplices[:, [a, b]] for a in range(d) for b in range(a + 1, d)]
+    # qhull leaves duplicate points out of the triangulation; tie each one
+    # to the vertex it coincides with
+    pairs.append(tri.coplanar[:, [0, 2]])
+    pairs = np.concatenate(pairs)
+    pairs.sort(axis=1)
+    pairs = np.unique(pairs, axis=0)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def min_cost_connect_points(points):
+    """LeetCode 1584: Manhattan MST weight of integer points."""
+    return point_mst(points)[0]
+
+
+if __name__ == "__main__":
+    points = [[0, 0], [2, 2], [3, 10], [5, 2], [7, 0]]
+    print("Min cost:", min_cost_connect_points(points))
+    # Min cost: 20
+    total, edges = point_mst(points, metric="euclidean", method="delaunay")
+    print("Euclidean MST:", round(total, 3), edges.tolist())
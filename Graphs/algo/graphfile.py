@@ -0,0 +1,194 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+
+import numpy as np
+
+from .csr import CSRGraph, _id_dtype, as_csr
+
+
+# On-disk CSRGraph. The file is a fixed header page followed by the
+# offsets / targets / weights sections, each starting on a page boundary
+# and stored in the little-endian dtype CSRGraph uses in memory, so
+# load_graph() is one mmap plus np.frombuffer views: no parsing and no
+# copy, and open time does not depend on the graph size. Every process
+# that loads the same file maps the same page-cache pages, so a pool of
+# workers shares one physical copy of the graph.
+#
+# Labels and caller metadata are small JSON sections after the arrays
+# (a labelled graph pays for decoding its label table on open).
+#
+# Header (HEADER_SIZE bytes, little-endian):
+#   magic "CSRGRAPH", version u32, flags u32, num_nodes u64, num_edges u64,
+#   then per section (offsets, targets, weights, labels, meta): file
+#   offset u64, byte length u64, dtype (4 bytes, e.g. b"<i8"), crc32 u32;
+#   finally a crc32 of everything before it.
+
+MAGIC = b"CSRGRAPH"
+VERSION = 1
+PAGE = 4096
+HEADER_SIZE = PAGE
+
+DIRECTED = 1
+WEIGHTED = 2
+LABELLED = 4
+
+_SECTIONS = ("offsets", "targets", "weights", "labels", "meta")
+_HEAD = struct.Struct("<8sIIQQ")
+_SECTION = struct.Struct("<QQ4sI")
+_CRC = struct.Struct("<I")
+_CRC_BLOCK = 1 << 24
+
+
+def save_graph(path, graph, directed=True, meta=None):
+    """Write `graph` (a CSRGraph or adjacency dict) to `path` in the graph file format.
+
+    `directed` is only recorded, for readers that care how the arcs came
+    about; `meta` is any JSON-serialisable dict stored alongside. The file
+    is written to a temporary name and renamed into place, so a reader
+    never maps a half-written graph.
+    """
+    csr = as_csr(graph)
+    n = csr.num_nodes
+    arrays = {
+        "offsets": csr.offsets.astype("<i8", copy=False),
+        "targets": csr.targets.astype(np.dtype(_id_dtype(n)).newbyteorder("<"), copy=False),
+        "weights": None if csr.weights is None else csr.weights.astype("<f8", copy=False),
+        "labels": None if csr.labels is None else np.frombuffer(json.dumps(csr.labels).encode(), dtype=np.uint8),
+        "meta": np.frombuffer(json.dumps(meta or {}).encode(), dtype=np.uint8),
+    }
+    flags = (DIRECTED if directed else 0) | (WEIGHTED if csr.weighted else 0) | (LABELLED if csr.labels is not None else 0)
+    table = []
+    tmp = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp, "wb") as f:
+            pos = HEADER_SIZE
+            for name in _SECTIONS:
+                arr = arrays[name]
+                if arr is None:
+                    table.append((0, 0, b"", 0))
+                    continue
+                pos = -(-pos // PAGE) * PAGE
+                f.seek(pos)
+                crc = _write(f, arr)
+                table.append((pos, arr.nbytes, arr.dtype.str.encode(), crc))
+                pos += arr.nbytes
+            f.truncate(-(-pos // PAGE) * PAGE)
+            f.seek(0)
+            f.write(_pack_header(flags, n, csr.num_edges, table))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return path
+
+
+def load_graph(path, verify=False):
+    """Map a graph file and return a CSRGraph over read-only zero-copy views.
+
+    The arrays stay valid as long as the returned graph (or any view of
+    it) is alive; the mapping closes with the last reference. verify=True
+    checks every section's crc32, which reads the whole file.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    info, table = _read_header(mm, path)
+    if verify:
+        for name, (offset, nbytes, _, crc) in table.items():
+            if nbytes and _crc(memoryview(mm)[offset:offset + nbytes]) != crc:
+                raise ValueError(f"{path}: checksum mismatch in the {name} section")
+    views = {name: _section(mm, *table[name][:3]) for name in ("offsets", "targets", "weights")}
+    csr = CSRGraph(views["offsets"], views["targets"], views["weights"])
+    if info["labelled"]:
+        # JSON has no tuples; bring back hashable (r, c)-style labels
+        labels = json.loads(_section(mm, *table["labels"][:3]).tobytes())
+        csr.labels = [tuple(label) if isinstance(label, list) else label for label in labels]
+        csr.index = {label: i for i, label in enumerate(csr.labels)}
+    return csr
+
+
+def graph_info(path):
+    """The header of a graph file as a dict, without mapping the arrays.
+
+    Keys: version, directed, weighted, labelled, num_nodes, num_edges and
+    meta (the dict given to save_graph()).
+    """
+    with open(path, "rb") as f:
+        info, table = _read_header(f.read(HEADER_SIZE), path)
+        offset, nbytes, _, _ = table["meta"]
+        f.seek(offset)
+        info["meta"] = json.loads(f.read(nbytes)) if nbytes else {}
+    return info
+
+
+def _write(f, arr):
+    # stream the array out in blocks, so a memory-mapped source is never
+    # copied whole, and checksum it on the way
+    data = memoryview(np.ascontiguousarray(arr)).cast("B")
+    crc = 0
+    for lo in range(0, len(data), _CRC_BLOCK):
+        block = data[lo:lo + _CRC_BLOCK]
+        f.write(block)
+        crc = zlib.crc32(block, crc)
+    return crc
+
+
+def _crc(data):
+    crc = 0
+    for lo in range(0, len(data), _CRC_BLOCK):
+        crc = zlib.crc32(data[lo:lo + _CRC_BLOCK], crc)
+    return crc
+
+
+def _pack_header(flags, num_nodes, num_edges, table):
+    head = _HEAD.pack(MAGIC, VERSION, flags, num_nodes, num_edges)
+    head += b"".join(_SECTION.pack(*entry) for entry in table)
+    return head + _CRC.pack(zlib.crc32(head))
+
+
+def _read_header(buf, path):
+    size = _HEAD.size + len(_SECTIONS) * _SECTION.size
+    if len(buf) < HEADER_SIZE:
+        raise ValueError(f"{path}: truncated graph file")
+    head = bytes(buf[:size])
+    magic, version, flags, num_nodes, num_edges = _HEAD.unpack_from(head)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a graph file")
+    if version > VERSION:
+        raise ValueError(f"{path}: graph file version {version} is newer than supported ({VERSION})")
+    if _CRC.unpack_from(buf, size)[0] != zlib.crc32(head):
+        raise ValueError(f"{path}: header checksum mismatch")
+    table = {}
+    for i, name in enumerate(_SECTIONS):
+        offset, nbytes, dtype, crc = _SECTION.unpack_from(head, _HEAD.size + i * _SECTION.size)
+        table[name] = (offset, nbytes, dtype.rstrip(b"\0").decode(), crc)
+    if isinstance(buf, mmap.mmap) and any(o + b > len(buf) for o, b, _, _ in table.values()):
+        raise ValueError(f"{path}: truncated graph file")
+    info = {
+        "version": version, "directed": bool(flags & DIRECTED), "weighted": bool(flags & WEIGHTED),
+        "labelled": bool(flags & LABELLED), "num_nodes": num_nodes, "num_edges": num_edges,
+    }
+    return info, table
+
+
+def _section(mm, offset, nbytes, dtype):
+    if not dtype:
+        return None
+    dtype = np.dtype(dtype)
+    return np.frombuffer(mm, dtype=dtype, count=nbytes // dtype.itemsize, offset=offset)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    graph = {'A': [('B', 1), ('C', 4)], 'B': [('C', 2), ('D', 5)], 'C': [('D', 1)], 'D': []}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = save_graph(os.path.join(tmp, "roads.csr"), graph, meta={"source": "example"})
+        print(graph_info(path))
+        csr = load_graph(path, verify=True)
+        print(csr.to_adjacency() == {k: [(v, float(w)) for v, w in e] for k, e in graph.items()})
+        # True
+        del csr
@@ -0,0 +1,225 @@
+import numpy as np
+
+from .union_find import DisjointSet
+
+
+# 2D grids as graphs, done with whole-array operations instead of walking
+# cell by cell. Grids may be numpy arrays, lists of lists or lists of
+# strings ("1"/"0" style, as the LeetCode island problems pass them).
+
+DIRECTIONS = {
+    4: ((-1, 0), (1, 0), (0, -1), (0, 1)),
+    8: ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)),
+}
+
+
+def as_mask(grid, land=None):
+    """Boolean foreground mask: cells equal to `land`, else nonzero / "1" cells."""
+    if not isinstance(grid, np.ndarray):
+        grid = np.array([list(row) if isinstance(row, str) else row for row in grid])
+    if land is not None:
+        return grid == land
+    if grid.dtype == bool:
+        return grid
+    if grid.dtype.kind in "US":
+        return grid == "1"
+    return grid != 0
+
+
+def label_components(grid, connectivity=4, land=None):
+    """Two-pass union-find connected-component labelling.
+
+    Pass one labels horizontal runs of foreground cells; the runs that touch
+    across neighbouring rows (diagonally too for connectivity=8) are merged
+    with one batched union; pass two maps every cell to its component.
+
+    Returns `(labels, count, areas, touches_border)`: labels is an int32 array
+    with 0 for background and 1..count for components (numbered in raster
+    order of their first cell); areas and touches_border are indexed by
+    label, with entry 0 standing for the background.
+    """
+    if connectivity not in (4, 8):
+        raise ValueError("connectivity must be 4 or 8")
+    mask = as_mask(grid, land)
+    rows, cols = mask.shape
+    if mask.size == 0:
+        return np.zeros(mask.shape, dtype=np.int32), 0, np.zeros(1, np.int64), np.zeros(1, bool)
+
+    # pass one: a run starts at every foreground cell whose left neighbour is not
+    starts = mask.copy()
+    starts[:, 1:] &= ~mask[:, :-1]
+    run = np.cumsum(starts, dtype=np.int64).reshape(mask.shape)
+    num_runs = int(run[-1, -1])
+    run = np.where(mask, run - 1, -1)
+
+    # pass two: component per run, then per cell
+    run_label = np.zeros(num_runs + 1, dtype=np.int32)
+    if num_runs:
+        run_label[1:] = _merge_runs(run, num_runs, lambda u, l: mask[u] & mask[l], connectivity) + 1
+    labels = run_label[run + 1]
+    count = int(run_label.max())
+
+    areas = np.bincount(labels.ravel(), minlength=count + 1)
+    areas[0] = 0
+    touches_border = np.zeros(count + 1, dtype=bool)
+    for edge in (labels[0], labels[-1], labels[:, 0], labels[:, -1]):
+        touches_border[edge] = True
+    touches_border[0] = False
+    return labels, count, areas, touches_border
+
+
+def label_plateaus(heights, connectivity=4):
+    """Label maximal connected regions of equal value; every cell gets a label.
+
+    Returns `(labels, count)` with labels numbered 0..count-1 in raster order.
+    """
+    h = np.asarray(heights)
+    starts = np.ones(h.shape, dtype=bool)
+    starts[:, 1:] = h[:, 1:] != h[:, :-1]
+    run = np.cumsum(starts, dtype=np.int32 if h.size < 2**31 else np.int64).reshape(h.shape)
+    run -= 1
+    num_runs = int(run[-1, -1]) + 1 if h.size else 0
+    run_label = _merge_runs(run, num_runs, lambda u, l: h[u] == h[l], connectivity).astype(np.int32)
+    return run_label[run], int(run_label.max()) + 1 if num_runs else 0
+
+
+def _merge_runs(run, num_runs, joined, connectivity):
+    # component per horizontal run: `joined(upper, lower)` says, for a pair of
+    # shifted views, which vertically (or diagonally) adjacent cells connect
+    views = [(np.s_[:-1, :], np.s_[1:, :])]
+    if connectivity == 8:
+        views += [(np.s_[:-1, 1:], np.s_[1:, :-1]), (np.s_[:-1, :-1], np.s_[1:, 1:])]
+    pairs = np.concatenate([_touching_runs(run[u], run[l], joined(u, l)) for u, l in views])
+    # only runs that touch another one need a union-find slot; on noisy
+    # grids most runs are isolated, so this keeps the forest small
+    involved = np.sort(pairs, axis=None)
+    keep = np.ones(len(involved), dtype=bool)
+    keep[1:] = involved[1:] != involved[:-1]
+    involved = involved[keep]
+    ds = DisjointSet(len(involved))
+    ds.union_many(np.searchsorted(involved, pairs))
+    # union_many roots every set at its smallest member, so numbering the
+    # roots in order numbers components by their first run
+    rep = np.arange(num_runs, dtype=run.dtype)
+    rep[involved] = involved[ds.roots(np.arange(len(involved)))]
+    first = np.cumsum(rep == np.arange(num_runs, dtype=run.dtype), dtype=run.dtype) - 1
+    return first[rep]
+
+
+def _touching_runs(upper, lower, both):
+    # one (upper run, lower run) pair per stretch where they overlap, rather
+    # than one per overlapping cell
+    first = both.copy()
+    first[:, 1:] &= ~(both[:, :-1] & (upper[:, :-1] == upper[:, 1:]) & (lower[:, :-1] == lower[:, 1:]))
+    return np.stack([upper[first], lower[first]], axis=1)
+
+
+def num_islands(grid, connectivity=4):
+    return label_components(grid, connectivity)[1]
+
+
+def max_area_of_island(grid, connectivity=4):
+    return int(label_components(grid, connectivity)[2].max())
+
+
+def capture_surrounded(board):
+    """Surrounded regions: flip every "O" region that does not reach the border to "X".
+
+    A list-of-lists board is modified in place (as LeetCode expects) and
+    returned; a numpy board comes back as a new array.
+    """
+    labels, _, _, touches_border = label_components(board, land="O")
+    captured = (labels > 0) & ~touches_border[labels]
+    if isinstance(board, np.ndarray):
+        return np.where(captured, "X", board)
+    for r, c in zip(*np.nonzero(captured)):
+        board[r][c] = "X"
+    return board
+
+
+INF = 2147483647  # "empty room" marker in walls-and-gates / islands-and-treasure
+
+
+def distance_transform(sources, obstacles=None):
+    """Multi-source BFS hop distances on a 4-connected grid, one whole frontier per step.
+
+    `sources` and `obstacles` are boolean masks (or anything as_mask takes).
+    Returns `(dist, max_dist, unreachable)`: dist is an int32 array with -1
+    for obstacles and cells no source can reach, max_dist is the largest
+    finite distance and unreachable counts the non-obstacle cells left at -1.
+    """
+    sources = as_mask(sources)
+    rows, cols = sources.shape
+    # open = not an obstacle and not reached yet; a single byte gather per
+    # candidate is the whole visited test
+    open_ = np.ones(rows * cols, dtype=bool) if obstacles is None else ~as_mask(obstacles).ravel()
+    dist = np.full(rows * cols, -1, dtype=np.int32)
+
+    frontier = np.flatnonzero(sources.ravel() & open_)
+    if rows * cols < 2**31:
+        frontier = frontier.astype(np.int32)
+    dist[frontier] = 0
+    open_[frontier] = False
+    level = 0
+    while len(frontier):
+        col = frontier % cols
+        cand = np.concatenate([
+            frontier[frontier >= cols] - cols,
+            frontier[frontier < (rows - 1) * cols] + cols,
+            frontier[col > 0] - 1,
+            frontier[col < cols - 1] + 1,
+        ])
+        cand = cand[open_[cand]]
+        if not len(cand):
+            break
+        level += 1
+        # sorting both dedupes and keeps the next round's gathers in memory order
+        cand.sort()
+        frontier = cand[np.concatenate(([True], cand[1:] != cand[:-1]))]
+        dist[frontier] = level
+        open_[frontier] = False
+    return dist.reshape(rows, cols), level, int(np.count_nonzero(open_))
+
+
+def oranges_rotting(grid):
+    """Minutes until every fresh orange (1) rots from the rotten ones (2), or -1."""
+    grid = np.asarray(grid)
+    dist, _, _ = distance_transform(grid == 2, grid == 0)
+    fresh = grid == 1
+    if (dist[fresh] < 0).any():
+        return -1
+    return int(dist[fresh].max()) if fresh.any() else 0
+
+
+def walls_and_gates(rooms):
+    """Fill every empty room (INF) with the distance to its nearest gate (0); walls are -1.
+
+    A list-of-lists grid is filled in place (as LeetCode expects) and
+    returned; a numpy grid comes back as a new array.
+    """
+    arr = np.asarray(rooms)
+    dist, _, _ = distance_transform(arr == 0, arr == -1)
+    filled = np.where((arr == INF) & (dist >= 0), dist, arr)
+    if isinstance(rooms, np.ndarray):
+        return filled
+    for r, row in enumerate(filled.tolist()):
+        rooms[r][:] = row
+    return rooms
+
+
+islands_and_treasure = walls_and_gates
+
+
+if __name__ == "__main__":
+    grid = [
+        ["1", "1", "0", "0", "0"],
+        ["1", "1", "0", "0", "0"],
+        ["0", "0", "1", "0", "0"],
+        ["0", "0", "0", "1", "1"],
+    ]
+    print("Islands:", num_islands(grid))
+    # Islands: 3
+    print("Max area:", max_area_of_island(grid))
+    # Max area: 4
+    print("Oranges:", oranges_rotting([[2, 1, 1], [1, 1, 0], [0, 1, 1]]))
+    # Oranges: 4
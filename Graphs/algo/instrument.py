@@ -0,0 +1,210 @@
+import contextvars
+import functools
+import json
+import time
+from contextlib import nullcontext
+
+import numpy as np
+
+# Opt-in counters and phase timings for the search loops. Nothing is
+# recorded unless a Recorder is active:
+#
+#     with instrument() as rec:
+#         dijkstra(graph, 'A')
+#     rec.calls  ->  [{"algorithm": "dijkstra", "seconds": ...,
+#                      "counters": {"settled": ..., "relaxed": ..., "pushes": ...,
+#                                   "pops": ..., "stale": ..., "max_frontier": ...},
+#                      "phases": {"search": ...}}]
+#
+# Instrumented functions check for a recorder once per call. The hot loops
+# call their queue operations through local aliases (push = heapq.heappush
+# and so on); under a recorder the aliases are swapped for counting
+# wrappers, and settled nodes and relaxed edges are derived after the loop
+# from the result arrays. The uninstrumented loop therefore runs exactly
+# as before, with no per-edge branches.
+#
+# Counters: settled (nodes finalised), relaxed (edges scanned from settled
+# nodes), pushes / pops (queue operations), stale (pops of an entry that
+# was already superseded or visited, i.e. pops - settled) and max_frontier
+# (largest queue, stack or level). Phases are timed in seconds; "search"
+# runs from counting()/begin() to finish(). A nested instrumented call
+# adds to its caller's record.
+
+_recorder = contextvars.ContextVar("recorder", default=None)
+_NO_PHASE = nullcontext()
+
+
+class CallStats:
+    """Counters and phase timings of one top-level instrumented call."""
+
+    __slots__ = ("algorithm", "counters", "phases", "seconds", "_start")
+
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.counters = dict.fromkeys(("settled", "relaxed", "pushes", "pops", "max_frontier"), 0)
+        self.phases = {}
+        self.seconds = 0.0
+        self._start = None
+
+    def add(self, **counts):
+        counters = self.counters
+        for name, n in counts.items():
+            counters[name] = counters.get(name, 0) + int(n)
+
+    def peak(self, name, value):
+        if value > self.counters.get(name, 0):
+            self.counters[name] = int(value)
+
+    def phase(self, name):
+        return _Phase(self.phases, name)
+
+    def begin(self):
+        """Start the "search" phase."""
+        self._start = time.perf_counter()
+
+    def finish(self, settled, relaxed):
+        """End the "search" phase and add the nodes it settled and the edges it relaxed."""
+        self.phases["search"] = self.phases.get("search", 0.0) + time.perf_counter() - self._start
+        self.add(settled=settled, relaxed=relaxed)
+
+    def counting(self, push, pop, size):
+        """Begin the search with a queue's push/pop wrapped to count themselves.
+
+        Whatever the queue already holds counts as pushed; the peak size()
+        after a push is kept as max_frontier.
+        """
+        counters = self.counters
+        counters["pushes"] += size()
+        self.peak("max_frontier", size())
+        self.begin()
+
+        def counted_push(*args):
+            push(*args)
+            counters["pushes"] += 1
+            n = size()
+            if n > counters["max_frontier"]:
+                counters["max_frontier"] = n
+
+        def counted_pop(*args):
+            counters["pops"] += 1
+            return pop(*args)
+
+        return counted_push, counted_pop
+
+    def as_dict(self):
+        counters = dict(self.counters)
+        counters["stale"] = max(counters["pops"] - counters["settled"], 0)
+        return {"algorithm": self.algorithm, "seconds": self.seconds,
+                "counters": counters, "phases": dict(self.phases)}
+
+
+class _Phase:
+    __slots__ = ("phases", "name", "start")
+
+    def __init__(self, phases, name):
+        self.phases, self.name = phases, name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.phases[self.name] = self.phases.get(self.name, 0.0) + time.perf_counter() - self.start
+
+
+class Recorder:
+    """Collects a CallStats per top-level instrumented call while active.
+
+    sink decides where each finished call goes:
+      None       kept as a dict in `calls`
+      callable   called with the dict, outside the call's own timing, so
+                 under cProfile its cost shows up as its own entry
+      file-like  one JSON line written per call
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink
+        self.calls = []
+        self._open = None
+        self._token = None
+
+    def __enter__(self):
+        self._token = _recorder.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        _recorder.reset(self._token)
+        self._open = None
+
+    def totals(self):
+        """Counters summed per algorithm over the kept calls (max_frontier is a max)."""
+        totals = {}
+        for call in self.calls:
+            entry = totals.setdefault(call["algorithm"], {"calls": 0, "seconds": 0.0})
+            entry["calls"] += 1
+            entry["seconds"] += call["seconds"]
+            for name, value in call["counters"].items():
+                if name.startswith("max_"):
+                    entry[name] = max(entry.get(name, 0), value)
+                else:
+                    entry[name] = entry.get(name, 0) + value
+        return totals
+
+    def _run(self, algorithm, fn, args, kwargs):
+        if self._open is not None:
+            return fn(*args, **kwargs)
+        stats = self._open = CallStats(algorithm)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            stats.seconds = time.perf_counter() - start
+            self._open = None
+            self._emit(stats.as_dict())
+
+    def _emit(self, record):
+        sink = self.sink
+        if sink is None:
+            self.calls.append(record)
+        elif callable(sink):
+            sink(record)
+        else:
+            sink.write(json.dumps(record) + "\n")
+
+
+def instrument(sink=None):
+    """Context manager that turns instrumentation on for the calls made inside it."""
+    return Recorder(sink)
+
+
+def instrumented(algorithm):
+    """Decorator: record calls of the function as `algorithm` while a Recorder is active."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def call(*args, **kwargs):
+            recorder = _recorder.get()
+            if recorder is None:
+                return fn(*args, **kwargs)
+            return recorder._run(algorithm, fn, args, kwargs)
+        return call
+    return wrap
+
+
+def active():
+    """The CallStats to record into, or None when instrumentation is off."""
+    recorder = _recorder.get()
+    return None if recorder is None else recorder._open
+
+
+def scanned(csr, settled):
+    """Out-edges of the `settled` nodes of a CSR graph (a mask or an id sequence)."""
+    if isinstance(settled, (bytes, bytearray)):
+        settled = np.frombuffer(settled, dtype=bool)
+    settled = np.asarray(settled)
+    if settled.dtype != bool:
+        settled = settled.astype(np.int64)
+    return int(np.diff(csr.offsets)[settled].sum())
+
+
+def phase(stats, name):
+    """`with phase(stats, "search"):` times into stats, or does nothing when stats is None."""
+    return _NO_PHASE if stats is None else stats.phase(name)
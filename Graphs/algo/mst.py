@@ -0,0 +1,215 @@
+import os
+
+import numpy as np
+
+from .csr import as_csr
+from .union_find import DisjointSet
+
+
+# Minimum spanning trees / forests over whole edge arrays. Edges are ranked
+# once by (weight, position), a strict order, so the MST is unique and
+# every method here returns exactly the same edges. Arcs are treated as
+# undirected: a `{node: [(nei, w)]}` graph listing both directions is fine.
+#
+# All of them return `(total, edges)`: the total weight and the chosen
+# edges in rank order, as an (k, 2) id array or, for labelled graphs, a
+# list of label pairs. With forest=False a disconnected graph is an error
+# (prim() would silently span only the start node's component);
+# forest=True spans every component.
+
+KRUSKAL_CHUNK = 1 << 16
+
+
+def minimum_spanning_tree(graph, method="kruskal", forest=False, workers=None):
+    """Dispatch to kruskal(), boruvka() or parallel_boruvka() by name."""
+    if method == "kruskal":
+        return kruskal(graph, forest)
+    if method == "boruvka":
+        return boruvka(graph, forest)
+    if method == "parallel":
+        return parallel_boruvka(graph, forest, workers)
+    raise ValueError(f"unknown method {method!r}")
+
+
+def _edge_arrays(graph):
+    csr = as_csr(graph)
+    src = np.repeat(np.arange(csr.num_nodes, dtype=csr.targets.dtype), np.diff(csr.offsets))
+    weights = csr.weights if csr.weighted else np.ones(csr.num_edges)
+    keep = src != csr.targets
+    return csr, src[keep], csr.targets[keep], weights[keep]
+
+
+def _result(csr, src, dst, weights, chosen, forest):
+    if not forest and len(chosen) < csr.num_nodes - 1:
+        raise ValueError("graph is disconnected; pass forest=True for a minimum spanning forest")
+    total = weights[chosen].sum().item()
+    if csr.labels is None:
+        return total, np.stack([src[chosen], dst[chosen]], axis=1).astype(np.int64)
+    return total, list(zip(csr.labels_of(src[chosen].tolist()), csr.labels_of(dst[chosen].tolist())))
+
+
+def kruskal(graph, forest=False):
+    """Kruskal over argsorted edges with the array-backed DisjointSet.
+
+    Sorted edges go in chunks; before a chunk is looped over, the edges
+    whose endpoints the forest already joins are dropped with one
+    vectorised find, so on dense graphs most edges never reach Python.
+    """
+    csr, src, dst, weights = _edge_arrays(graph)
+    order = np.argsort(weights, kind="stable")
+    ds = DisjointSet(csr.num_nodes)
+    chosen = []
+    for start in range(0, len(order), KRUSKAL_CHUNK):
+        if ds.count <= 1:
+            break
+        idx = order[start:start + KRUSKAL_CHUNK]
+        a, b = src[idx], dst[idx]
+        live = ds.roots(a) != ds.roots(b)
+        for i, u, v in zip(idx[live].tolist(), a[live].tolist(), b[live].tolist()):
+            if ds.union(u, v):
+                chosen.append(i)
+    return _result(csr, src, dst, weights, np.array(chosen, dtype=np.int64), forest)
+
+
+def _edge_ranks(weights):
+    by_rank = np.argsort(weights, kind="stable")
+    rank = np.empty(len(weights), dtype=np.int64)
+    rank[by_rank] = np.arange(len(weights))
+    return rank, by_rank
+
+
+def _lightest(cu, cv, rank, num_comps):
+    # lightest live edge rank at each component (int64 max where it has none)
+    best = np.full(num_comps, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(best, cu, rank)
+    np.minimum.at(best, cv, rank)
+    return best
+
+
+def _dedupe(ranks):
+    # an edge picked from both of its sides shows up twice
+    ranks = np.sort(ranks)
+    keep = np.ones(len(ranks), dtype=bool)
+    keep[1:] = ranks[1:] != ranks[:-1]
+    return ranks[keep]
+
+
+def _contract(comp, picked_u, picked_v, num_comps):
+    # merge components along the picked edges and renumber them 0..k-1
+    ds = DisjointSet(num_comps)
+    ds.union_many(np.stack([picked_u, picked_v], axis=1))
+    label = ds.labels()
+    return label[comp], int(label.max()) + 1 if num_comps else 0
+
+
+def boruvka(graph, forest=False):
+    """Borůvka: every component takes its lightest edge at once, O(log n) rounds.
+
+    Each round is whole-array work: the lightest edge per component from
+    one sort, a batched union to contract, then edges inside a component
+    are dropped for good.
+    """
+    csr, src, dst, weights = _edge_arrays(graph)
+    rank, by_rank = _edge_ranks(weights)
+    comp = np.arange(csr.num_nodes, dtype=np.int64)
+    num_comps = csr.num_nodes
+    eid = np.arange(len(weights))
+    cu, cv, er = src.astype(np.int64), dst.astype(np.int64), rank
+    chosen = []
+    while len(eid):
+        best = _lightest(cu, cv, er, num_comps)
+        best = _dedupe(best[best < len(rank)])
+        picked = by_rank[best]
+        chosen.append(picked)
+        comp, num_comps = _contract(comp, comp[src[picked]], comp[dst[picked]], num_comps)
+        cu, cv = comp[src[eid]], comp[dst[eid]]
+        live = cu != cv
+        eid, cu, cv, er = eid[live], cu[live], cv[live], er[live]
+    chosen = np.concatenate(chosen) if chosen else np.zeros(0, dtype=np.int64)
+    return _result(csr, src, dst, weights, by_rank[np.sort(rank[chosen])], forest)
+
+
+_worker = None
+
+
+def _attach_worker(spec):
+    from .shm import attach
+
+    global _worker
+    _worker = attach(spec)
+
+
+def _shard_lightest(bounds):
+    # one worker's share of a round: drop the shard's edges that became
+    # internal, then report its lightest edge per component
+    lo, hi, num_comps = bounds
+    arrays = _worker[1]
+    live = arrays["live"]
+    idx = lo + np.flatnonzero(live[lo:hi])
+    comp = arrays["comp"]
+    cu, cv = comp[arrays["src"][idx]], comp[arrays["dst"][idx]]
+    inside = cu == cv
+    live[idx[inside]] = False
+    keep = ~inside
+    best = _lightest(cu[keep], cv[keep], arrays["rank"][idx[keep]], num_comps)
+    found = np.flatnonzero(best < len(live))
+    return found, best[found]
+
+
+def parallel_boruvka(graph, forest=False, workers=None):
+    """Borůvka with each round's edge scan sharded over a process pool.
+
+    The edge arrays, the edge ranks, the node -> component map and a live
+    mask sit in shared memory: workers attach once and read them in place,
+    and the parent only ships back per-shard minima and writes the new
+    component map after each contraction.
+    """
+    # process pools and shared memory cost ~30 ms to import; only pay
+    # for them here
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .shm import SharedArrays
+
+    csr, src, dst, weights = _edge_arrays(graph)
+    rank, by_rank = _edge_ranks(weights)
+    workers = workers or os.cpu_count() or 1
+    m = len(weights)
+    bounds = np.linspace(0, m, 4 * workers + 1).astype(np.int64)
+    shards = [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+    num_comps = csr.num_nodes
+    chosen = []
+    shared = SharedArrays({
+        "src": src, "dst": dst, "rank": rank,
+        "comp": np.arange(csr.num_nodes, dtype=np.int64), "live": np.ones(m, dtype=bool),
+    })
+    try:
+        with ProcessPoolExecutor(workers, initializer=_attach_worker, initargs=(shared.spec,)) as pool:
+            comp = shared["comp"]
+            while True:
+                parts = list(pool.map(_shard_lightest, [(a, b, num_comps) for a, b in shards]))
+                best = np.full(num_comps, m, dtype=np.int64)
+                for c, r in parts:
+                    np.minimum.at(best, c, r)
+                best = _dedupe(best[best < m])
+                if not len(best):
+                    break
+                picked = by_rank[best]
+                chosen.append(picked)
+                comp[:], num_comps = _contract(comp, comp[src[picked]], comp[dst[picked]], num_comps)
+    finally:
+        shared.close()
+    chosen = np.concatenate(chosen) if chosen else np.zeros(0, dtype=np.int64)
+    return _result(csr, src, dst, weights, by_rank[np.sort(rank[chosen])], forest)
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': [('B', 2), ('C', 4)],
+        'B': [('A', 2), ('C', 1), ('D', 7)],
+        'C': [('A', 4), ('B', 1), ('E', 3)],
+        'D': [('B', 7), ('E', 1)],
+        'E': [('C', 3), ('D', 1)],
+    }
+    for method in ("kruskal", "boruvka", "parallel"):
+        print(method, minimum_spanning_tree(graph, method, workers=2))
+    # kruskal (7.0, [('B', 'C'), ('D', 'E'), ('A', 'B'), ('C', 'E')])
@@ -1,29 +1,100 @@
 import heapq
-from collections import defaultdict
 
+from .csr import CSRGraph, as_csr
+from .instrument import active, instrumented, phase, scanned
+from .priority_queues import make_queue
+
+
+@instrumented("prim")
+def prim(graph,start,queue=None):
+    # queue: None for lazy heapq insertion, or a priority_queues name/factory
+    if queue is not None:
+        with phase(active(), "convert"):
+            csr = as_csr(graph)
+        return prim_queue(csr, csr.id_of(start), queue)
+    if isinstance(graph, CSRGraph):
+        return prim_ids(graph, graph.id_of(start))
 
-def prim(graph,start):
     v = set()
     count= 0
     min_heap = [(0, start)]
+    push, pop = heapq.heappush, heapq.heappop
+    stats = active()
+    if stats is not None:
+        push, pop = stats.counting(push, pop, min_heap.__len__)
 
     while min_heap:
-        cnt, node = heapq.heappop(min_heap)
+        cnt, node = pop(min_heap)
         if node not in v:
             v.add(node)
             count += cnt
             for nei,wei in graph[node]:
                 if nei not in v:
-                    heapq.heappush(min_heap,(wei,nei))
+                    push(min_heap,(wei,nei))
+    if stats is not None:
+        stats.finish(len(v), sum(len(graph[node]) for node in v))
+    return count
+
+
+@instrumented("prim_ids")
+def prim_ids(csr, start):
+    offsets, targets, weights = csr.buffers(unit_weights=True)
+    v = bytearray(csr.num_nodes)
+    count= 0
+    min_heap = [(0, start)]
+    push, pop = heapq.heappush, heapq.heappop
+    stats = active()
+    if stats is not None:
+        push, pop = stats.counting(push, pop, min_heap.__len__)
+
+    while min_heap:
+        cnt, node = pop(min_heap)
+        if not v[node]:
+            v[node] = 1
+            count += cnt
+            for i in range(offsets[node], offsets[node + 1]):
+                nei = targets[i]
+                if not v[nei]:
+                    push(min_heap,(weights[i],nei))
+    if stats is not None:
+        stats.finish(v.count(1), scanned(csr, v))
+    return count
+
+
+@instrumented("prim_queue")
+def prim_queue(csr, start, queue):
+    # decrease-key variant: each node is queued once with its cheapest edge
+    offsets, targets, weights = csr.buffers(unit_weights=True)
+    q = make_queue(queue, csr.num_nodes, csr.edge_weights())
+    v = bytearray(csr.num_nodes)
+    count = 0
+    push, pop = q.push, q.pop
+    stats = active()
+    if stats is not None:
+        push, pop = stats.counting(push, pop, q.__len__)
+    push(start, 0)
+
+    while q:
+        cnt, node = pop()
+        v[node] = 1
+        count += cnt
+        for i in range(offsets[node], offsets[node + 1]):
+            nei = targets[i]
+            if not v[nei]:
+                push(nei, weights[i])
+    if stats is not None:
+        stats.finish(v.count(1), scanned(csr, v))
     return count
 
-graph = {
-    'A': [('B', 1), ('D', 3)],
-    'B': [('A', 1), ('D', 4), ('C', 2)],
-    'C': [('B', 2), ('D', 5)],
-    'D': [('A', 3), ('B', 4), ('C', 5)]
-}
 
-print("Prim's MST cost:", prim(graph, 'A'))
+if __name__ == "__main__":
+    graph = {
+        'A': [('B', 1), ('D', 3)],
+        'B': [('A', 1), ('D', 4), ('C', 2)],
+        'C': [('B', 2), ('D', 5)],
+        'D': [('A', 3), ('B', 4), ('C', 5)]
+    }
 
-    
\ No newline at end of file
+    print("Prim's MST cost:", prim(graph, 'A'))
+    print("Prim's MST cost (CSR):", prim(CSRGraph.from_adjacency(graph), 'A'))
+    print("Prim's MST cost (d-ary heap):", prim(graph, 'A', queue="dary"))
@@ -0,0 +1,248 @@
+from array import array
+
+import numpy as np
+
+
+# Addressable min-priority queues over integer items 0..n-1. They all share
+# one interface so dijkstra()/prim() can take any of them via `queue=`:
+#
+#   q.push(item, key)   insert item, or lower its key if already queued
+#                       (a larger key is ignored); returns True if it changed
+#   q.pop()             remove and return (key, item) with the smallest key
+#   len(q), bool(q)     number of queued items
+#
+# Unlike lazy heapq insertion an item is queued at most once, so the queue
+# never holds more than V entries.
+
+
+class IndexedDaryHeap:
+    """Implicit d-ary heap with a position index for O(log_d n) decrease-key."""
+
+    def __init__(self, n, d=4):
+        self.d = d
+        self.items = array("q")
+        self.keys = []
+        self.pos = array("q", [-1]) * n
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return self.pos[item] >= 0
+
+    def push(self, item, key):
+        i = self.pos[item]
+        if i < 0:
+            i = len(self.items)
+            self.items.append(item)
+            self.keys.append(key)
+            self.pos[item] = i
+        elif key < self.keys[i]:
+            self.keys[i] = key
+        else:
+            return False
+        self._sift_up(i)
+        return True
+
+    def pop(self):
+        items, keys, pos = self.items, self.keys, self.pos
+        key, item = keys[0], items[0]
+        last_item, last_key = items.pop(), keys.pop()
+        pos[item] = -1
+        if items:
+            items[0], keys[0] = last_item, last_key
+            pos[last_item] = 0
+            self._sift_down(0)
+        return key, item
+
+    def _sift_up(self, i):
+        items, keys, pos, d = self.items, self.keys, self.pos, self.d
+        item, key = items[i], keys[i]
+        while i:
+            parent = (i - 1) // d
+            if keys[parent] <= key:
+                break
+            items[i], keys[i] = items[parent], keys[parent]
+            pos[items[i]] = i
+            i = parent
+        items[i], keys[i] = item, key
+        pos[item] = i
+
+    def _sift_down(self, i):
+        items, keys, pos, d = self.items, self.keys, self.pos, self.d
+        n = len(items)
+        item, key = items[i], keys[i]
+        while True:
+            first = i * d + 1
+            if first >= n:
+                break
+            last = min(first + d, n)
+            child = first
+            for c in range(first + 1, last):
+                if keys[c] < keys[child]:
+                    child = c
+            if keys[child] >= key:
+                break
+            items[i], keys[i] = items[child], keys[child]
+            pos[items[i]] = i
+            i = child
+        items[i], keys[i] = item, key
+        pos[item] = i
+
+
+class BucketQueue:
+    """Circular bucket queue (Dial's algorithm) for small non-negative integer keys.
+
+    All queued keys must lie within `span` of the smallest one, which holds
+    for Dijkstra with integer weights <= span and for Prim with weights in
+    [0, span]. push/decrease-key are O(1); pop is amortised O(1) per key step.
+    """
+
+    def __init__(self, n, span):
+        self.span = int(span) + 1
+        self.buckets = [set() for _ in range(self.span)]
+        self.key = array("q", [-1]) * n
+        self.cur = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, item):
+        return self.key[item] >= 0
+
+    def push(self, item, key):
+        if key < 0 or key != int(key):
+            raise ValueError(f"bucket queue keys must be non-negative integers, got {key!r}")
+        key = int(key)
+        old = self.key[item]
+        if old >= 0:
+            if key >= old:
+                return False
+            self.buckets[old % self.span].discard(item)
+        else:
+            self.size += 1
+        self.key[item] = key
+        self.buckets[key % self.span].add(item)
+        if key < self.cur or self.size == 1:
+            self.cur = key
+        return True
+
+    def pop(self):
+        buckets, span = self.buckets, self.span
+        while not buckets[self.cur % span]:
+            self.cur += 1
+        item = buckets[self.cur % span].pop()
+        self.key[item] = -1
+        self.size -= 1
+        return self.cur, item
+
+
+class _PairingNode:
+    __slots__ = ("key", "item", "child", "sibling", "prev")
+
+    def __init__(self, key, item):
+        self.key, self.item = key, item
+        self.child = self.sibling = self.prev = None
+
+
+class PairingHeap:
+    """Pairing heap: O(1) insert and decrease-key, O(log n) amortised pop."""
+
+    def __init__(self, n):
+        self.root = None
+        self.nodes = [None] * n
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, item):
+        return self.nodes[item] is not None
+
+    def push(self, item, key):
+        node = self.nodes[item]
+        if node is None:
+            node = self.nodes[item] = _PairingNode(key, item)
+            self.root = node if self.root is None else self._link(self.root, node)
+            self.size += 1
+            return True
+        if key >= node.key:
+            return False
+        node.key = key
+        if node is not self.root:
+            # cut the subtree out of its sibling list and relink it at the root
+            if node.prev.child is node:
+                node.prev.child = node.sibling
+            else:
+                node.prev.sibling = node.sibling
+            if node.sibling is not None:
+                node.sibling.prev = node.prev
+            node.sibling = node.prev = None
+            self.root = self._link(self.root, node)
+        return True
+
+    def pop(self):
+        root = self.root
+        self.nodes[root.item] = None
+        self.size -= 1
+        self.root = self._merge_pairs(root.child)
+        return root.key, root.item
+
+    @staticmethod
+    def _link(a, b):
+        if b.key < a.key:
+            a, b = b, a
+        b.prev, b.sibling = a, a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        return a
+
+    def _merge_pairs(self, first):
+        # standard two-pass pairing: link neighbours left to right, then fold
+        # the pairs right to left
+        pairs = []
+        while first is not None:
+            a, b = first, first.sibling
+            if b is None:
+                first = None
+            else:
+                first = b.sibling
+                b.sibling = b.prev = None
+            a.sibling = a.prev = None
+            pairs.append(a if b is None else self._link(a, b))
+        root = pairs.pop() if pairs else None
+        while pairs:
+            root = self._link(pairs.pop(), root)
+        if root is not None:
+            root.prev = None
+        return root
+
+
+QUEUES = {
+    "dary": IndexedDaryHeap,
+    "bucket": BucketQueue,
+    "pairing": PairingHeap,
+}
+
+
+def make_queue(queue, n, weights=None):
+    """Instantiate `queue` (a QUEUES name or a factory taking n) for items 0..n-1.
+
+    The bucket queue sizes itself from the edge `weights`, which must be
+    non-negative integers (as floats or ints).
+    """
+    if callable(queue):
+        return queue(n)
+    if queue == "bucket":
+        if weights is None:
+            raise ValueError("the bucket queue needs the edge weights")
+        weights = np.asarray(weights)
+        if len(weights) and (weights.min() < 0 or not np.array_equal(weights, np.floor(weights))):
+            raise ValueError("the bucket queue needs non-negative integer weights")
+        return BucketQueue(n, weights.max() if len(weights) else 0)
+    try:
+        return QUEUES[queue](n)
+    except KeyError:
+        raise ValueError(f"unknown queue {queue!r}, expected one of {sorted(QUEUES)}") from None
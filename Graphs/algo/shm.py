@@ -0,0 +1,60 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+# Numpy arrays laid out once in a multiprocessing.shared_memory block, so
+# worker processes map the same pages instead of unpickling their own
+# copies. The creator owns the block (and unlinks it); workers attach from
+# the small picklable `spec` and get zero-copy views.
+
+ALIGN = 64
+
+
+class SharedArrays:
+    """Copy `{name: array}` into one shared block; index by name for the views."""
+
+    def __init__(self, arrays):
+        layout, offset = [], 0
+        arrays = {name: np.ascontiguousarray(arr) for name, arr in arrays.items()}
+        for name, arr in arrays.items():
+            offset = -(-offset // ALIGN) * ALIGN
+            layout.append((name, arr.dtype.str, arr.shape, offset))
+            offset += arr.nbytes
+        self.shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        self.spec = (self.shm.name, tuple(layout))
+        self.arrays = _views(self.shm, layout)
+        for name, arr in arrays.items():
+            self.arrays[name][...] = arr
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # views must go before the mapping can be closed
+        self.arrays = {}
+        self.shm.close()
+        self.shm.unlink()
+
+
+def attach(spec):
+    """Map a SharedArrays block from its spec; returns `(shm, {name: view})`.
+
+    Keep `shm` alive as long as the views are in use and close() it after.
+    """
+    name, layout = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, _views(shm, layout)
+
+
+def _views(shm, layout):
+    return {
+        name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+        for name, dtype, shape, offset in layout
+    }
@@ -0,0 +1,179 @@
+import tempfile
+
+import numpy as np
+
+from .grid import as_mask, label_components
+from .union_find import DisjointSet
+
+
+# Out-of-core grid processing: rasters that don't fit in RAM are read and
+# written one band of rows at a time through numpy.memmap, each band is
+# labelled in memory, and the seams between bands are stitched with a
+# union-find over the band-local labels. Peak memory is one band (about
+# BAND_CELLS cells unless band_rows says otherwise) plus one entry per
+# provisional label, whatever the size of the raster.
+
+
+def open_raster(path, shape, dtype=np.uint8, mode="r", offset=0):
+    """Memory-map a raw row-major raster file."""
+    return np.memmap(path, dtype=dtype, mode=mode, shape=tuple(shape), offset=offset)
+
+
+def _band(raster, r0, r1, mode="r"):
+    # A fresh mapping per band (dropped after use) keeps the band's pages
+    # from piling up in the resident set; plain arrays are just sliced.
+    if isinstance(raster, np.memmap) and raster.filename is not None:
+        cols = raster.shape[1]
+        offset = raster.offset + r0 * cols * raster.dtype.itemsize
+        return np.memmap(raster.filename, dtype=raster.dtype, mode=mode, shape=(r1 - r0, cols), offset=offset)
+    return raster[r0:r1]
+
+
+BAND_CELLS = 1 << 22
+
+
+def _rows_per_band(cols, band_rows):
+    # by default size bands by cell count so memory stays put as rasters widen
+    return band_rows if band_rows else max(1, BAND_CELLS // max(cols, 1))
+
+
+def _scratch(shape, dtype):
+    # named so _band() can re-map windows of it; the file is removed once
+    # the returned array is garbage collected
+    tmp = tempfile.NamedTemporaryFile(suffix=".raster")
+    arr = np.memmap(tmp.name, dtype=dtype, mode="w+", shape=shape)
+    arr.tmpfile = tmp
+    return arr
+
+
+def label_components_tiled(raster, connectivity=4, land=None, band_rows=None, out=None):
+    """Band-by-band version of grid.label_components with identical results.
+
+    `out` receives the int32 labels (a writable memmap of the raster's shape;
+    a temporary one is created if omitted). Returns `(out, count, areas,
+    touches_border)` exactly as label_components would for the whole raster.
+    """
+    rows, cols = raster.shape
+    band_rows = _rows_per_band(cols, band_rows)
+    if out is None:
+        out = _scratch((rows, cols), np.int32)
+
+    # pass one: label each band on its own, give its labels global ids and
+    # record which ids meet across the seam with the band above
+    next_id = 0
+    seams = []
+    band_areas = [np.zeros(1, dtype=np.int64)]
+    border = [np.zeros(1, dtype=bool)]
+    above = None
+    for r0 in range(0, rows, band_rows):
+        r1 = min(r0 + band_rows, rows)
+        labels, count, areas, _ = label_components(as_mask(np.asarray(_band(raster, r0, r1)), land), connectivity)
+        labels = np.where(labels > 0, labels + next_id, 0).astype(np.int32)
+        band_areas.append(areas[1:])
+        flags = np.zeros(count, dtype=bool)
+        edges = [labels[:, 0], labels[:, -1]]
+        if r0 == 0:
+            edges.append(labels[0])
+        if r1 == rows:
+            edges.append(labels[-1])
+        for edge in edges:
+            hit = edge[edge > 0] - next_id - 1
+            flags[hit] = True
+        border.append(flags)
+
+        if above is not None:
+            seams.append(_seam_pairs(above, labels[0], connectivity))
+        above = labels[-1].copy()
+        window = _band(out, r0, r1, mode="r+")
+        window[:] = labels
+        if isinstance(window, np.memmap):
+            window.flush()
+        del window
+        next_id += count
+
+    # stitch: provisional ids are handed out in raster order, so the smallest
+    # id of each merged component belongs to its first cell, and numbering
+    # the merged components by smallest id reproduces the in-memory labels
+    ds = DisjointSet(next_id + 1)
+    if seams:
+        ds.union_many(np.concatenate(seams))
+    final = ds.labels()
+    count = int(final.max())
+
+    areas = np.zeros(count + 1, dtype=np.int64)
+    np.add.at(areas, final, np.concatenate(band_areas))
+    areas[0] = 0
+    touches_border = np.zeros(count + 1, dtype=bool)
+    np.logical_or.at(touches_border, final, np.concatenate(border))
+
+    # pass two: rewrite provisional ids to final labels, band by band
+    for r0 in range(0, rows, band_rows):
+        r1 = min(r0 + band_rows, rows)
+        window = _band(out, r0, r1, mode="r+")
+        window[:] = final[window]
+        if isinstance(window, np.memmap):
+            window.flush()
+        del window
+    return out, count, areas, touches_border
+
+
+def _seam_pairs(upper, lower, connectivity):
+    pairs = [np.stack([upper, lower], axis=1)]
+    if connectivity == 8:
+        pairs.append(np.stack([upper[1:], lower[:-1]], axis=1))
+        pairs.append(np.stack([upper[:-1], lower[1:]], axis=1))
+    pairs = np.concatenate(pairs)
+    pairs = pairs[(pairs[:, 0] > 0) & (pairs[:, 1] > 0)]
+    return np.unique(pairs, axis=0) if len(pairs) else pairs.reshape(0, 2)
+
+
+def num_islands_tiled(raster, connectivity=4, band_rows=None):
+    return label_components_tiled(raster, connectivity, band_rows=band_rows)[1]
+
+
+def flood_fill_tiled(raster, sr, sc, new_color, band_rows=None):
+    """Recolour the 4-connected same-colour region around (sr, sc) in place.
+
+    `raster` must be writable (e.g. open_raster(..., mode="r+")).
+    """
+    color = raster[sr, sc]
+    if color == new_color:
+        return raster
+    labels, _, _, _ = label_components_tiled(raster, land=color, band_rows=band_rows)
+    band_rows = _rows_per_band(raster.shape[1], band_rows)
+    target = labels[sr, sc]
+    for r0 in range(0, raster.shape[0], band_rows):
+        r1 = min(r0 + band_rows, raster.shape[0])
+        window = _band(raster, r0, r1, mode="r+")
+        window[np.asarray(_band(labels, r0, r1)) == target] = new_color
+        if isinstance(window, np.memmap):
+            window.flush()
+        del window
+    return raster
+
+
+def reachable_tiled(passable, sources, band_rows=None, connectivity=4, out=None):
+    """Cells connected through passable cells to any source cell, as a bool raster.
+
+    Reachability is a labelling question: a cell is reachable exactly when
+    its passable component contains a source.
+    """
+    rows, cols = passable.shape
+    labels, count, _, _ = label_components_tiled(passable, connectivity, band_rows=band_rows)
+    band_rows = _rows_per_band(cols, band_rows)
+    hit = np.zeros(count + 1, dtype=bool)
+    for r0 in range(0, rows, band_rows):
+        r1 = min(r0 + band_rows, rows)
+        band_labels = np.asarray(_band(labels, r0, r1))
+        hit[band_labels[as_mask(np.asarray(_band(sources, r0, r1)))]] = True
+    hit[0] = False
+    if out is None:
+        out = _scratch((rows, cols), bool)
+    for r0 in range(0, rows, band_rows):
+        r1 = min(r0 + band_rows, rows)
+        window = _band(out, r0, r1, mode="r+")
+        window[:] = hit[np.asarray(_band(labels, r0, r1))]
+        if isinstance(window, np.memmap):
+            window.flush()
+        del window
+    return out
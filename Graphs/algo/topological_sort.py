@@ -1,4 +1,11 @@
 from collections import defaultdict
+from typing import List
+
+import numpy as np
+
+from .bfs import _gather_ranges
+from .csr import CSRGraph
+from .traversal import postorder
 
 def build_adjacency_list(vertices, edges):
     graph = defaultdict(list)
@@ -7,71 +14,143 @@ def build_adjacency_list(vertices, edges):
     return graph
 
 def topological_sort_dfs(vertices, graph):
-    visited = set()
-    stack = []
-
-    def dfs(node):
-        visited.add(node)
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                dfs(neighbor)
-        stack.append(node)
-
-    for v in range(vertices):
-        if v not in visited:
-            dfs(v)
-
+    # reverse post-order, on the explicit-stack engine so deep DAGs can't
+    # overflow the interpreter stack
+    stack = postorder(graph.__getitem__, range(vertices), num_nodes=vertices)
     return stack[::-1]
 
-# Example usage
-vertices = 6
-edges = [
-    (5, 0),
-    (5, 2),
-    (4, 0),
-    (4, 1),
-    (2, 3),
-    (3, 1)
-]
-
-# vertices = 4
-# edges = [
-#     (0, 1),
-#     (1, 2),
-#     (2, 3),
-#     (3, 1)  # This creates a cycle: 1 → 2 → 3 → 1
-# ]
-
-graph = build_adjacency_list(vertices, edges)
-
-print("Topological Sort (DFS):", topological_sort_dfs(vertices, graph))
-
-
+def kahn_topological_sort(vertices, edges):
+    """Kahn's algorithm over integer arrays, one whole antichain at a time.
+
+    edges are `(u, v)` pairs meaning u must come before v (an (m, 2) array
+    works too). Returns `(order, levels, cycle)`: the flat order, the list of
+    levels (each an array of nodes whose predecessors are all in earlier
+    levels, so a level can run concurrently) and, if the graph is not a DAG,
+    one cycle as a node list (`order` then only covers the acyclic part).
+    """
+    csr = CSRGraph.from_edges(np.asarray(edges, dtype=np.int64).reshape(-1, 2), num_nodes=vertices)
+    offsets, targets = csr.offsets, csr.targets
+    indegree = np.bincount(targets, minlength=vertices)
+
+    levels = []
+    frontier = np.flatnonzero(indegree == 0)
+    while len(frontier):
+        levels.append(frontier)
+        succ = targets[_gather_ranges(offsets[frontier], offsets[frontier + 1])]
+        hit, counts = np.unique(succ, return_counts=True)
+        indegree[hit] -= counts
+        frontier = hit[indegree[hit] == 0]
+    order = np.concatenate(levels) if levels else np.empty(0, dtype=np.int64)
+
+    cycle = []
+    if len(order) < vertices:
+        cycle = _cycle_witness(csr.reverse(), indegree)
+    return order, levels, cycle
+
+
+def _cycle_witness(reverse, indegree):
+    # every node Kahn could not place still has a predecessor that was not
+    # placed either, so walking those predecessors must eventually repeat
+    offsets, sources, _ = reverse.buffers()
+    node = int(np.flatnonzero(indegree > 0)[0])
+    seen = {}
+    walk = []
+    while node not in seen:
+        seen[node] = len(walk)
+        walk.append(node)
+        node = next(p for p in sources[offsets[node]:offsets[node + 1]] if indegree[p] > 0)
+    return walk[seen[node]:][::-1]
+
+
+class IncrementalTopologicalOrder:
+    """Keeps a topological order of a growing DAG up to date (Pearce-Kelly).
+
+    add_edge(u, v) only reorders the nodes between v and u in the current
+    order, and raises ValueError with the cycle when the edge would close one.
+    """
+
+    def __init__(self, vertices):
+        self.out = [[] for _ in range(vertices)]
+        self.inn = [[] for _ in range(vertices)]
+        self.ord = list(range(vertices))   # node -> position
+        self.node_at = list(range(vertices))  # position -> node
+
+    def order(self):
+        return list(self.node_at)
+
+    def add_edge(self, u, v):
+        ord_ = self.ord
+        lower, upper = ord_[v], ord_[u]
+        if u == v:
+            raise ValueError(f"edge {u}->{v} closes a cycle: {[u]}")
+        if lower < upper:
+            # v sits before u: find what must move, forward from v and back from u
+            forward, parent = self._search(v, self.out, lambda x: ord_[x] <= upper, u)
+            if u in parent:
+                cycle = [u]
+                while cycle[-1] != v:
+                    cycle.append(parent[cycle[-1]])
+                raise ValueError(f"edge {u}->{v} closes a cycle: {cycle[::-1]}")
+            backward, _ = self._search(u, self.inn, lambda x: ord_[x] >= lower)
+            self._reorder(backward, forward)
+        self.out[u].append(v)
+        self.inn[v].append(u)
+
+    def _search(self, start, adjacency, within, goal=None):
+        parent = {start: None}
+        stack = [start]
+        found = [start]
+        while stack:
+            x = stack.pop()
+            for y in adjacency[x]:
+                if y not in parent and within(y):
+                    parent[y] = x
+                    if y == goal:
+                        return found, parent
+                    found.append(y)
+                    stack.append(y)
+        return found, parent
+
+    def _reorder(self, backward, forward):
+        ord_, node_at = self.ord, self.node_at
+        backward.sort(key=ord_.__getitem__)
+        forward.sort(key=ord_.__getitem__)
+        nodes = backward + forward
+        slots = sorted(ord_[x] for x in nodes)
+        for x, pos in zip(nodes, slots):
+            ord_[x] = pos
+            node_at[pos] = x
 
 
 class Solution:
     def findOrder(self, numCourses: int, prerequisites: List[List[int]]) -> List[int]:
-        
-
-    def build_adjacency_list(vertices, edges):
-        graph = defaultdict(list)
-        for u, v in edges:
-            graph[u].append(v)
-        return graph
-
-    def topological_sort_dfs(vertices, graph):
-        visited = set()
-        stack = []
-
-        def dfs(node):
-            visited.add(node)
-            for neighbor in graph[node]:
-                if neighbor not in visited:
-                    dfs(neighbor)
-            stack.append(node)
-
-        for v in range(vertices):
-            if v not in visited:
-                dfs(v)
-
-        return stack[::-1]
\ No newline at end of file
+        # prerequisite pairs are (course, pre): pre has to come first
+        order, _, cycle = kahn_topological_sort(numCourses, [(pre, crs) for crs, pre in prerequisites])
+        return [] if cycle else order.tolist()
+
+
+if __name__ == "__main__":
+    vertices = 6
+    edges = [
+        (5, 0),
+        (5, 2),
+        (4, 0),
+        (4, 1),
+        (2, 3),
+        (3, 1)
+    ]
+
+    # vertices = 4
+    # edges = [
+    #     (0, 1),
+    #     (1, 2),
+    #     (2, 3),
+    #     (3, 1)  # This creates a cycle: 1 → 2 → 3 → 1
+    # ]
+
+    graph = build_adjacency_list(vertices, edges)
+
+    print("Topological Sort (DFS):", topological_sort_dfs(vertices, graph))
+
+    order, levels, cycle = kahn_topological_sort(vertices, edges)
+    print("Topological Sort (Kahn):", order.tolist(), "levels:", [level.tolist() for level in levels], "cycle:", cycle)
@@ -0,0 +1,154 @@
+from array import array
+
+
+# Explicit-stack depth-first search. Everything that used to be a recursive
+# `def dfs(node): ... dfs(nei)` closure can be phrased as pre/post callbacks
+# on this engine, which never touches the Python call stack and so handles
+# paths of any depth.
+
+TREE, BACK, FORWARD, CROSS = "tree", "back", "forward", "cross"
+
+WHITE, GRAY, BLACK = 0, 1, 2
+
+
+class DepthFirstSearch:
+    """Iterative DFS with pre/post-order callbacks and edge classification.
+
+    neighbors(u)      iterable of u's successors (dict.__getitem__ for the
+                      `{node: [nei]}` form, CSRGraph.neighbors for ids, a
+                      grid-step function for cells, ...)
+    pre(u, parent)    called when u is discovered; return False to leave u
+                      unexpanded (it is still finished right away)
+    post(u, parent)   called when all of u's successors are done
+    edge(u, v, kind)  called for every examined edge, kind one of TREE,
+                      BACK, FORWARD, CROSS
+    num_nodes         if given, nodes are ids 0..n-1 and the colour/
+                      discovery state lives in flat arrays instead of dicts
+    undirected        skip the edge straight back to the parent once, so an
+                      undirected edge is not reported as a BACK edge
+
+    `path` is the current root-to-node stack while a search runs, and any
+    callback may call stop() to abandon the search.
+    """
+
+    def __init__(self, neighbors, pre=None, post=None, edge=None, num_nodes=None, undirected=False):
+        self.neighbors = neighbors
+        self.pre, self.post, self.edge = pre, post, edge
+        self.undirected = undirected
+        if num_nodes is None:
+            self.color, self.disc = {}, {}
+        else:
+            self.color = bytearray(num_nodes)
+            self.disc = array("q", [0]) * num_nodes
+        self.dense = num_nodes is not None
+        self.path = []
+        self.clock = 0
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+    def visited(self, node):
+        return self._color(node) != WHITE
+
+    def _color(self, node):
+        return self.color[node] if self.dense else self.color.get(node, WHITE)
+
+    def run(self, roots):
+        """Search from each root in turn, skipping ones already reached. Returns self."""
+        for root in roots:
+            if self.stopped:
+                break
+            if self._color(root) == WHITE:
+                self._search(root)
+        return self
+
+    def _search(self, root):
+        neighbors, pre, post, edge = self.neighbors, self.pre, self.post, self.edge
+        color, disc, path = self.color, self.disc, self.path
+        dense, undirected = self.dense, self.undirected
+
+        # each frame: (node, parent, iterator over node's successors, parent edge still to skip)
+        stack = []
+
+        def discover(node, parent):
+            color[node] = GRAY
+            disc[node] = self.clock
+            self.clock += 1
+            path.append(node)
+            if pre is not None and pre(node, parent) is False:
+                finish(node, parent)
+                return
+            stack.append([node, parent, iter(neighbors(node)), undirected])
+
+        def finish(node, parent):
+            color[node] = BLACK
+            path.pop()
+            if post is not None:
+                post(node, parent)
+
+        discover(root, None)
+        while stack and not self.stopped:
+            frame = stack[-1]
+            node, parent, it = frame[0], frame[1], frame[2]
+            for nei in it:
+                if frame[3] and nei == parent:
+                    frame[3] = False
+                    continue
+                c = color[nei] if dense else color.get(nei, WHITE)
+                if c == WHITE:
+                    if edge is not None:
+                        edge(node, nei, TREE)
+                    discover(nei, node)
+                    break
+                if edge is not None:
+                    if c == GRAY:
+                        edge(node, nei, BACK)
+                    else:
+                        edge(node, nei, FORWARD if disc[node] < disc[nei] else CROSS)
+                    if self.stopped:
+                        break
+            else:
+                stack.pop()
+                finish(node, parent)
+        if self.stopped:
+            del path[:]
+
+
+def preorder(neighbors, roots, num_nodes=None):
+    res = []
+    DepthFirstSearch(neighbors, pre=lambda u, p: res.append(u), num_nodes=num_nodes).run(roots)
+    return res
+
+
+def postorder(neighbors, roots, num_nodes=None):
+    res = []
+    DepthFirstSearch(neighbors, post=lambda u, p: res.append(u), num_nodes=num_nodes).run(roots)
+    return res
+
+
+def find_cycle(neighbors, roots, num_nodes=None):
+    """Return the nodes of some directed cycle reachable from roots, or [] if there is none."""
+    cycle = []
+
+    def on_edge(u, v, kind):
+        if kind == BACK:
+            cycle.extend(search.path[search.path.index(v):])
+            search.stop()
+
+    search = DepthFirstSearch(neighbors, edge=on_edge, num_nodes=num_nodes)
+    search.run(roots)
+    return cycle
+
+
+def grid_neighbors(rows, cols, passable):
+    """4-neighbour step function over (r, c) cells for DepthFirstSearch.
+
+    `passable(r, c)` decides whether a cell may be entered.
+    """
+    def neighbors(cell):
+        r, c = cell
+        for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+            if 0 <= nr < rows and 0 <= nc < cols and passable(nr, nc):
+                yield nr, nc
+    return neighbors
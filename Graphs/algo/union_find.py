@@ -1,57 +1,173 @@
-
-n = 10
-par = [ i  for i in range(n)]
-
-rank =[1] * n
-
-
-def find(n):
-    if n != par[n]:
-        par[n] = find(par[n])
-    return par[n]
-
-
-def union(n1,n2):
-    p1, p2 = find(n1), find(n2)
-    if p1 == p2: return False
-
-    if rank[p1] > rank[p2]:
-        par[p2] = p1
-        rank[p1] += rank[p2]
-    else:
-        par[p1] = p2
-        rank[p2] += rank[p1]
-    return True
-
-
-# edges = [[0, 1], [1, 2], [2, 3], [1, 3], [4, 5]]
-edges = [[0, 1], [1, 2], [2, 0]]  # This creates a cycle: 0-1-2-0
-
-for n1,n2 in edges:
-    if not union(n1,n2):
-        print(f"Graph is connected at {n1} & {n2}")
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+from array import array
+
+import numpy as np
+
+
+class DisjointSet:
+    """Union-find over ids 0..n-1 with union by size and path halving.
+
+    parent/size live in array("q") buffers, so single operations index plain
+    Python ints while union_many()/labels() work on zero-copy numpy views of
+    the same memory.
+    """
+
+    def __init__(self, n):
+        self.parent = array("q")
+        self.parent.frombytes(np.arange(n, dtype=np.int64).tobytes())
+        self.size = array("q", [1]) * n
+        self.count = n
+        self._parent = np.frombuffer(self.parent, dtype=np.int64)
+        self._size = np.frombuffer(self.size, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.parent)
+
+    def find(self, x):
+        par = self.parent
+        while par[x] != x:
+            # path halving: point x at its grandparent and jump there
+            par[x] = par[par[x]]
+            x = par[x]
+        return x
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        size = self.size
+        if size[ra] < size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        size[ra] += size[rb]
+        self.count -= 1
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def component_size(self, x):
+        return self.size[self.find(x)]
+
+    def roots(self, nodes):
+        """Vectorised find() for an array of nodes (compresses the nodes queried)."""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        par = self._parent
+        r = par[nodes]
+        while True:
+            nr = par[r]
+            if np.array_equal(nr, r):
+                break
+            r = nr
+        par[nodes] = r
+        return r
+
+    def union_many(self, edges):
+        """Union every (a, b) row of `edges` at once; returns the number of merges.
+
+        Rounds of vectorised hooking: each root that has to merge is pointed
+        at the smallest other root it meets, until every edge's endpoints
+        share a root. Hooking by id rather than by size keeps the rounds
+        conflict-free; sizes are settled once at the end.
+        """
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        a, b = edges[:, 0], edges[:, 1]
+        par = self._parent
+        hooked = []
+        while len(a):
+            ra, rb = self.roots(a), self.roots(b)
+            live = ra != rb
+            a, b, ra, rb = a[live], b[live], ra[live], rb[live]
+            if not len(a):
+                break
+            hi, lo = np.maximum(ra, rb), np.minimum(ra, rb)
+            np.minimum.at(par, hi, lo)
+            hi.sort()
+            hooked.append(hi[np.concatenate(([True], hi[1:] != hi[:-1]))])
+            # hooks can form long chains of former roots (think a path graph);
+            # pointer doubling over them keeps the next round's roots() short
+            h = np.concatenate(hooked)
+            while True:
+                up = par[par[h]]
+                if np.array_equal(up, par[h]):
+                    break
+                par[h] = up
+        if not hooked:
+            return 0
+        # every hooked root still carries the size it had as a root, and each
+        # was hooked exactly once, so the final roots just add them up
+        hooked = np.concatenate(hooked)
+        np.add.at(self._size, self.roots(hooked), self._size[hooked])
+        self.count -= len(hooked)
+        return len(hooked)
+
+    def labels(self):
+        """Component label per node, numbered 0..count-1 by smallest member."""
+        # np.unique numbers the components by root id; renumber them in
+        # order of their first (smallest) member instead
+        _, first, labels = np.unique(self.roots(np.arange(len(self))), return_index=True, return_inverse=True)
+        rank = np.empty(len(first), dtype=labels.dtype)
+        rank[np.argsort(first)] = np.arange(len(first))
+        return rank[labels]
+
+
+class RollbackDisjointSet:
+    """Union by size without path compression, so unions can be undone.
+
+    Every union() logs what it changed; snapshot() marks a point in that log
+    and rollback(mark) undoes everything after it, which is what offline
+    dynamic-connectivity (segment tree over time) needs. find() is O(log n).
+    """
+
+    def __init__(self, n):
+        self.parent = array("q", range(n))
+        self.size = array("q", [1]) * n
+        self.count = n
+        self.history = []
+
+    def find(self, x):
+        par = self.parent
+        while par[x] != x:
+            x = par[x]
+        return x
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            self.history.append(None)
+            return False
+        size = self.size
+        if size[ra] < size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        size[ra] += size[rb]
+        self.count -= 1
+        self.history.append((ra, rb))
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def snapshot(self):
+        return len(self.history)
+
+    def rollback(self, mark=None):
+        """Undo back to `mark` (default: undo the last union)."""
+        if mark is None:
+            mark = len(self.history) - 1
+        while len(self.history) > mark:
+            change = self.history.pop()
+            if change is not None:
+                ra, rb = change
+                self.parent[rb] = rb
+                self.size[ra] -= self.size[rb]
+                self.count += 1
+
+
+if __name__ == "__main__":
+    # edges = [[0, 1], [1, 2], [2, 3], [1, 3], [4, 5]]
+    edges = [[0, 1], [1, 2], [2, 0]]  # This creates a cycle: 0-1-2-0
+
+    ds = DisjointSet(10)
+    for n1,n2 in edges:
+        if not ds.union(n1,n2):
+            print(f"Graph is connected at {n1} & {n2}")
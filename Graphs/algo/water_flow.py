@@ -0,0 +1,140 @@
+import numpy as np
+
+from .bfs import _gather_ranges
+from .grid import DIRECTIONS, label_plateaus
+
+
+# Which outlets does the water on each cell of a height map end up in?
+# Water moves to any neighbour that is no higher, so a cell drains to an
+# outlet exactly when some non-increasing path joins them. That makes the
+# answer a property of plateaus (connected equal-height regions): a
+# plateau drains to its own outlets plus everything its strictly lower
+# neighbours drain to. Priority flood settles cells lowest first so that
+# the lower side is always final; here the "heap" is the plateau DAG
+# itself, processed a whole ready frontier at a time.
+
+FRONTIER_CELLS = 1 << 20
+
+
+def _mask_dtype(num_outlets):
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if num_outlets <= np.iinfo(dtype).bits:
+            return dtype
+    raise ValueError("at most 64 outlet sets are supported")
+
+
+def outlet_bits(outlets, shape):
+    """Per-cell bitmask of the outlets a cell belongs to, plus the outlet count.
+
+    `outlets` is either an int label array (0 = no outlet, k = outlet k,
+    bit k-1) or a sequence of boolean masks, one per outlet, which may
+    overlap (mask i is bit i).
+    """
+    if isinstance(outlets, np.ndarray) and outlets.dtype != bool and outlets.shape == tuple(shape):
+        num = int(outlets.max()) if outlets.size else 0
+        dtype = _mask_dtype(num)
+        bits = np.zeros(shape, dtype=dtype)
+        has = outlets > 0
+        bits[has] = np.left_shift(dtype(1), (outlets[has] - 1).astype(dtype))
+        return bits, num
+    masks = [np.asarray(m, dtype=bool) for m in outlets]
+    dtype = _mask_dtype(len(masks))
+    bits = np.zeros(shape, dtype=dtype)
+    for i, m in enumerate(masks):
+        bits[m] |= dtype(1 << i)
+    return bits, len(masks)
+
+
+def drainage(heights, outlets, connectivity=4):
+    """Bitmask per cell of the outlets its water can reach (see outlet_bits).
+
+    Returns a uint8/16/32/64 array (the narrowest that holds every outlet)
+    of the heights' shape. Works level by level over the plateau DAG, so
+    nothing recurses and memory stays a handful of per-cell arrays.
+    """
+    if connectivity not in DIRECTIONS:
+        raise ValueError("connectivity must be 4 or 8")
+    h = np.asarray(heights)
+    rows, cols = h.shape
+    bits, _ = outlet_bits(outlets, h.shape)
+    if h.size == 0:
+        return bits
+    plat, count = label_plateaus(h, connectivity)
+    hf, pf = h.ravel(), plat.ravel()
+
+    pmask = np.zeros(count, dtype=bits.dtype)
+    own = np.flatnonzero(bits)
+    np.bitwise_or.at(pmask, pf[own], bits.ravel()[own])
+    del own
+
+    # pending[p]: (cell, strictly lower neighbour) pairs of plateau p not yet
+    # final; a plateau is ready once all of its lower neighbours are
+    idx = np.int32 if h.size < 2**28 else np.int64
+    pending = np.zeros(count, dtype=idx)
+    for dr, dc in DIRECTIONS[connectivity]:
+        here = np.s_[max(-dr, 0):rows - max(dr, 0), max(-dc, 0):cols - max(dc, 0)]
+        there = np.s_[max(dr, 0):rows - max(-dr, 0), max(dc, 0):cols - max(-dc, 0)]
+        pending += np.bincount(plat[here][h[there] < h[here]], minlength=count)
+
+    # cells grouped by plateau, so a frontier of plateaus expands to its cells
+    order = np.argsort(pf, kind="stable").astype(idx)
+    start = np.zeros(count + 1, dtype=idx)
+    np.cumsum(np.bincount(pf, minlength=count), out=start[1:])
+
+    frontier = np.flatnonzero(pending == 0)
+    while len(frontier):
+        # big frontiers (every pit of a noisy DEM is ready at once) go in
+        # pieces so the per-round temporaries stay bounded
+        pieces = -(-int((start[frontier + 1] - start[frontier]).sum()) // FRONTIER_CELLS)
+        ready = []
+        for part in np.array_split(frontier, pieces):
+            hi, lo = _uphill_pairs(order[_gather_ranges(start[part], start[part + 1])], hf, pf, rows, cols, connectivity)
+            if not len(hi):
+                continue
+            np.bitwise_or.at(pmask, hi, pmask[lo])
+            # one decrement per pair: sort, then count each run of equal plateaus
+            hi.sort()
+            first = np.flatnonzero(np.concatenate(([True], hi[1:] != hi[:-1])))
+            touched = hi[first]
+            pending[touched] -= np.diff(np.append(first, len(hi))).astype(idx)
+            ready.append(touched[pending[touched] == 0])
+        frontier = np.concatenate(ready) if ready else ready
+    return pmask[plat]
+
+
+def _uphill_pairs(cells, hf, pf, rows, cols, connectivity):
+    # (higher plateau, lower plateau) for every strictly uphill step out of `cells`
+    row, col = cells // cols, cells % cols
+    hi, lo = [], []
+    for dr, dc in DIRECTIONS[connectivity]:
+        ok = (row + dr >= 0) & (row + dr < rows) & (col + dc >= 0) & (col + dc < cols)
+        src = cells[ok]
+        nb = src + (dr * cols + dc)
+        up = hf[nb] > hf[src]
+        hi.append(pf[nb[up]])
+        lo.append(pf[src[up]])
+    return np.concatenate(hi), np.concatenate(lo)
+
+
+def pacific_atlantic(heights, connectivity=4):
+    """LeetCode 417: cells draining to both the Pacific (top/left) and the Atlantic (bottom/right)."""
+    h = np.asarray(heights)
+    if h.size == 0:
+        return []
+    pacific = np.zeros(h.shape, dtype=bool)
+    pacific[0, :] = pacific[:, 0] = True
+    atlantic = np.zeros(h.shape, dtype=bool)
+    atlantic[-1, :] = atlantic[:, -1] = True
+    return np.argwhere(drainage(h, [pacific, atlantic], connectivity) == 3).tolist()
+
+
+if __name__ == "__main__":
+    heights = [
+        [1, 2, 2, 3, 5],
+        [3, 2, 3, 4, 4],
+        [2, 4, 5, 3, 1],
+        [6, 7, 1, 4, 5],
+        [5, 1, 1, 2, 4],
+    ]
+    print("Both oceans:", pacific_atlantic(heights))
+    # Both oceans: [[0, 4], [1, 3], [1, 4], [2, 2], [3, 0], [3, 1], [4, 0]]
@@ -0,0 +1,96 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+
+from algo.all_pairs import distance_matrix
+from algo.csr import CSRGraph
+from algo.dijkstras import dijkstra
+from generators import random_weighted_edges
+
+
+def measure(fn, *args, memory=False, **kwargs):
+    # tracing allocations slows the interpreted searches several times over,
+    # so the peak comes from a second, traced run
+    t = time.perf_counter()
+    out = fn(*args, **kwargs)
+    seconds = time.perf_counter() - t
+    peak = float("nan")
+    if memory:
+        tracemalloc.start()
+        fn(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, peak, out
+
+
+def per_origin(graph, sources, targets):
+    # what callers do today: a dijkstra() dict per origin, then pick the targets
+    return np.array([[d[t] for t in targets] for d in (dijkstra(graph, s) for s in sources)])
+
+
+def plain_floyd(csr):
+    # unblocked reference: one full n x n pass per pivot
+    dist = np.full((csr.num_nodes, csr.num_nodes), np.inf)
+    src = np.repeat(np.arange(csr.num_nodes), np.diff(csr.offsets))
+    np.minimum.at(dist, (src, csr.targets), csr.weights)
+    np.fill_diagonal(dist, 0)
+    for k in range(csr.num_nodes):
+        np.minimum(dist, dist[:, k, None] + dist[k], out=dist)
+    return dist
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Many-to-many distance tables against one dijkstra() per origin")
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--degree", type=int, default=4)
+    parser.add_argument("--sources", type=int, default=100)
+    parser.add_argument("--targets", type=int, default=100)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--dense-nodes", type=int, nargs="+", default=[256, 512, 1024])
+    parser.add_argument("--memory", action="store_true", help="also report peak traced memory (runs everything twice)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    edges, weights = random_weighted_edges(args.nodes, args.nodes * args.degree // 2)
+    csr = CSRGraph.from_edges(edges, num_nodes=args.nodes, weights=weights, directed=False)
+    sources = rng.choice(args.nodes, args.sources, replace=False)
+    targets = rng.choice(args.nodes, args.targets, replace=False)
+
+    print(f"sparse: nodes={args.nodes} degree={args.degree} sources={args.sources} targets={args.targets}")
+    print(f"{'method':>22} {'seconds':>9} {'peak MB':>8}")
+    adjacency = csr.to_adjacency()
+    seconds, peak, expected = measure(per_origin, adjacency, sources.tolist(), targets.tolist(),
+                                      memory=args.memory)
+    print(f"{'dijkstra() per origin':>22} {seconds:>9.3f} {peak / 2**20:>8.2f}")
+    for workers in args.workers:
+        # tracemalloc only sees this process; the workers' workspaces are O(n) each
+        seconds, peak, out = measure(distance_matrix, csr, sources, targets, method="dijkstra", workers=workers,
+                                     memory=args.memory)
+        assert np.array_equal(out, expected), f"workers={workers} disagrees with dijkstra()"
+        print(f"{f'matrix workers={workers}':>22} {seconds:>9.3f} {peak / 2**20:>8.2f}")
+
+    print("\ndense: all pairs, degree n/8")
+    print(f"{'nodes':>6} {'method':>15} {'seconds':>9} {'peak MB':>8}")
+    for n in args.dense_nodes:
+        edges, weights = random_weighted_edges(n, n * n // 16)
+        small = CSRGraph.from_edges(edges, num_nodes=n, weights=weights, directed=False)
+        runs = [("plain floyd", plain_floyd, (small,), {}),
+                ("blocked floyd", distance_matrix, (small,), {"method": "floyd"}),
+                ("dijkstra", distance_matrix, (small,), {"method": "dijkstra", "workers": 1})]
+        expected = None
+        for name, fn, fargs, kwargs in runs:
+            seconds, peak, out = measure(fn, *fargs, memory=args.memory, **kwargs)
+            if expected is None:
+                expected = out
+            assert np.allclose(out, expected), f"{name} disagrees"
+            print(f"{n:>6} {name:>15} {seconds:>9.3f} {peak / 2**20:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+
+from algo.batch import QUERIES, BatchExecutor
+from algo.csr import CSRGraph
+from algo.graphfile import save_graph
+from generators import random_weighted_edges
+
+
+def make_queries(name, n, count, rng):
+    if name == "cheapest_price":
+        return [(int(s), int(t), 3) for s, t in rng.integers(0, n, size=(count, 2))]
+    return rng.integers(0, n, size=count).tolist()
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Throughput of BatchExecutor as workers are added")
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--degree", type=int, default=4)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--query", choices=sorted(QUERIES), default="network_delay")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, 8, 16, 32, 64, cpus} & set(range(1, cpus + 1))))
+    parser.add_argument("--from-file", action="store_true", help="workers map a graph file instead of shared memory")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    edges, weights = random_weighted_edges(args.nodes, args.nodes * args.degree // 2)
+    csr = CSRGraph.from_edges(edges, num_nodes=args.nodes, weights=weights, directed=False)
+    queries = make_queries(args.query, args.nodes, args.queries, rng)
+
+    query = QUERIES[args.query]
+    t = time.perf_counter()
+    expected = [query(csr, q) for q in queries]
+    serial = time.perf_counter() - t
+    print(f"{args.query}: nodes={args.nodes} degree={args.degree} queries={args.queries} cpus={cpus}")
+    print(f"{'workers':>7} {'startup s':>10} {'run s':>8} {'queries/s':>10} {'speedup':>8} {'efficiency':>10}")
+    print(f"{'serial':>7} {0:>10.3f} {serial:>8.3f} {len(queries) / serial:>10.1f} {1:>8.2f} {1:>10.2f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        graph = save_graph(os.path.join(tmp, "graph.csr"), csr) if args.from_file else csr
+        for workers in args.workers:
+            t = time.perf_counter()
+            with BatchExecutor(graph, workers=workers) as pool:
+                # one tiny batch so every worker has started and attached
+                # before the clock runs; startup is reported on its own
+                pool.map(args.query, queries[:workers], chunk_size=1)
+                startup = time.perf_counter() - t
+                t = time.perf_counter()
+                out = pool.map(args.query, queries)
+                seconds = time.perf_counter() - t
+            assert all(np.array_equal(a, b) for a, b in zip(out, expected)), f"workers={workers} disagrees"
+            speedup = serial / seconds
+            print(f"{workers:>7} {startup:>10.3f} {seconds:>8.3f} {len(queries) / seconds:>10.1f} "
+                  f"{speedup:>8.2f} {speedup / workers:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
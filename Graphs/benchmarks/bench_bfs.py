@@ -0,0 +1,51 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from algo.bfs import bfs_direction_optimizing, bfs_ids, bfs_levels
+from algo.csr import CSRGraph
+from generators import power_law_edges
+
+
+def timed(fn, *args, **kwargs):
+    t = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return time.perf_counter() - t, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare BFS variants on power-law graphs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--degree", type=int, default=16)
+    parser.add_argument("--alpha", type=float, default=14)
+    parser.add_argument("--beta", type=float, default=24)
+    parser.add_argument("--skip-loop", action="store_true", help="skip the interpreted deque BFS")
+    args = parser.parse_args()
+
+    print(f"{'nodes':>10} {'edges':>11} {'variant':>22} {'seconds':>9} {'Medges/s':>9}")
+    for n in args.sizes:
+        csr = CSRGraph.from_edges(power_law_edges(n, args.degree), num_nodes=n, directed=False)
+        start = 0
+        runs = [("level-synchronous", bfs_levels, {}),
+                ("direction-optimizing", bfs_direction_optimizing,
+                 {"alpha": args.alpha, "beta": args.beta, "reverse": csr})]
+        if not args.skip_loop:
+            runs.insert(0, ("deque loop", bfs_ids, {}))
+
+        expected = None
+        for name, fn, kwargs in runs:
+            seconds, out = timed(fn, csr, start, **kwargs)
+            if name == "level-synchronous":
+                expected = out[1]
+            elif name == "direction-optimizing":
+                assert np.array_equal(out, expected), "direction-optimizing depths differ"
+            print(f"{n:>10} {csr.num_edges:>11} {name:>22} {seconds:>9.3f} {csr.num_edges / seconds / 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from algo.bottleneck import grid_tree, swim_in_water
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a grid merge tree once, then time bottleneck queries on it")
+    parser.add_argument("--side", type=int, default=1_000, help="height grid is side x side")
+    parser.add_argument("--queries", type=int, default=100_000)
+    parser.add_argument("--check", type=int, default=3, help="queries to validate against swim_in_water")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    heights = rng.permutation(args.side ** 2).reshape(args.side, args.side)
+
+    t = time.perf_counter()
+    tree = grid_tree(heights)
+    build = time.perf_counter() - t
+    print(f"cells={heights.size} build={build:.2f}s max depth={int(tree.depth.max())}")
+
+    sources = rng.integers(0, heights.size, args.queries)
+    targets = rng.integers(0, heights.size, args.queries)
+    t = time.perf_counter()
+    single = [tree.bottleneck(int(s), int(d)) for s, d in zip(sources, targets)]
+    single_qps = len(single) / (time.perf_counter() - t)
+    t = time.perf_counter()
+    batch = tree.bottlenecks(sources, targets)
+    batch_qps = len(batch) / (time.perf_counter() - t)
+    print(f"bottleneck() {single_qps:,.0f} queries/s, bottlenecks() {batch_qps:,.0f} queries/s")
+
+    mismatches = int(np.count_nonzero(np.asarray(single) != batch))
+    for s, d in zip(sources[:args.check], targets[:args.check]):
+        t = time.perf_counter()
+        expected = swim_in_water(heights, divmod(int(s), args.side), divmod(int(d), args.side))
+        print(f"swim_in_water single query {time.perf_counter() - t:.2f}s")
+        mismatches += expected != tree.bottleneck(int(s), int(d))
+    print(f"mismatches={mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from algo.contraction_hierarchy import ContractionHierarchy, build_contraction_hierarchy
+from algo.csr import CSRGraph
+from algo.dijkstras import ShortestPathEngine
+from generators import road_grid_edges
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a contraction hierarchy, validate it against dijkstra, time queries")
+    parser.add_argument("--side", type=int, default=60, help="road grid is side x side")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    edges, weights = road_grid_edges(args.side, args.side, seed=args.seed)
+    csr = CSRGraph.from_edges(edges, num_nodes=args.side ** 2, weights=weights)
+
+    t = time.perf_counter()
+    ch = build_contraction_hierarchy(csr)
+    build = time.perf_counter() - t
+    shortcuts = ch.forward.num_edges + ch.backward.num_edges - csr.num_edges
+    print(f"nodes={csr.num_nodes} arcs={csr.num_edges} build={build:.2f}s shortcuts={shortcuts}")
+
+    path = os.path.join(tempfile.mkdtemp(), "ch.npz")
+    ch.save(path)
+    ch = ContractionHierarchy.load(path)
+
+    rng = random.Random(args.seed)
+    pairs = [(rng.randrange(csr.num_nodes), rng.randrange(csr.num_nodes)) for _ in range(args.queries)]
+    engine = ShortestPathEngine(csr)
+    t = time.perf_counter()
+    expected = [engine.run(s, [d]).distance(d) for s, d in pairs]
+    dijkstra_us = (time.perf_counter() - t) / len(pairs) * 1e6
+    t = time.perf_counter()
+    got = [ch.distance(s, d) for s, d in pairs]
+    ch_us = (time.perf_counter() - t) / len(pairs) * 1e6
+    mismatches = sum(a != b for a, b in zip(expected, got))
+
+    print(f"dijkstra {dijkstra_us:.0f} us/query, CH {ch_us:.0f} us/query, mismatches={mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
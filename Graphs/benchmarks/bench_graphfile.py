@@ -0,0 +1,68 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from algo.csr import CSRGraph
+from generators import random_weighted_edges
+
+
+def child(path):
+    t = time.perf_counter()
+    from algo.graphfile import load_graph
+
+    imported = time.perf_counter()
+    csr = load_graph(path)
+    opened = time.perf_counter()
+    touched = int(csr.targets[::4096].sum())  # fault in one page per 16 KB of targets
+    print(json.dumps({
+        "import_ms": (imported - t) * 1e3, "open_ms": (opened - imported) * 1e3,
+        "edges": csr.num_edges, "touched": touched,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuilding a CSRGraph from edges against mapping a saved graph file")
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--edges", type=int, default=10_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    from algo.graphfile import load_graph, save_graph
+
+    edges, weights = random_weighted_edges(args.nodes, args.edges, seed=args.seed)
+    t = time.perf_counter()
+    csr = CSRGraph.from_edges(edges, num_nodes=args.nodes, weights=weights)
+    print(f"nodes={args.nodes} edges={args.edges}")
+    print(f"{'from_edges':>20}: {time.perf_counter() - t:9.3f}s")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "graph.csr")
+        t = time.perf_counter()
+        save_graph(path, csr)
+        print(f"{'save_graph':>20}: {time.perf_counter() - t:9.3f}s  {os.path.getsize(path) / 2**20:.1f} MB")
+        t = time.perf_counter()
+        load_graph(path)
+        print(f"{'load_graph':>20}: {(time.perf_counter() - t) * 1e3:9.3f}ms")
+        t = time.perf_counter()
+        load_graph(path, verify=True)
+        print(f"{'load_graph(verify)':>20}: {time.perf_counter() - t:9.3f}s")
+        res = json.loads(subprocess.run([sys.executable, __file__, "--child", path],
+                                        check=True, capture_output=True, text=True).stdout)
+        print(f"{'fresh process open':>20}: {res['open_ms']:9.3f}ms  (+{res['import_ms']:.0f}ms imports, "
+              f"peak RSS {res['peak_rss_mb']:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+
+from algo.bfs import bfs_ids, bfs_levels
+from algo.csr import CSRGraph
+from algo.dfs import dfs_ids
+from algo.dijkstras import dijkstra, dijkstra_ids
+from algo.instrument import instrument
+from algo.prims import prim_ids
+from generators import random_weighted_edges
+
+
+def best(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - t)
+    return min(times), out
+
+
+def same(a, b):
+    if isinstance(a, tuple) or (isinstance(a, list) and a and isinstance(a[0], np.ndarray)):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict):
+        return a == b
+    return np.array_equal(a, b)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cost of the instrumentation hooks, off and on")
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--degree", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print each instrumented call as a JSON line")
+    args = parser.parse_args()
+
+    edges, weights = random_weighted_edges(args.nodes, args.nodes * args.degree // 2)
+    csr = CSRGraph.from_edges(edges, num_nodes=args.nodes, weights=weights, directed=False)
+    adjacency = csr.to_adjacency()
+    cases = [
+        ("dijkstra dict", dijkstra, adjacency),
+        ("dijkstra_ids", dijkstra_ids, csr),
+        ("prim_ids", prim_ids, csr),
+        ("bfs_ids", bfs_ids, csr),
+        ("bfs_levels", bfs_levels, csr),
+        ("dfs_ids", dfs_ids, csr),
+    ]
+
+    print(f"nodes={args.nodes} degree={args.degree}")
+    print(f"{'case':>14} {'bare':>8} {'off':>8} {'on':>8} {'off %':>7} {'on %':>7}")
+    for name, fn, graph in cases:
+        # bare is the function under the decorator with no recorder: the loop
+        # as it ran before, bar the one active() lookup per call
+        bare, expected = best(lambda: fn.__wrapped__(graph, 0), args.repeat)
+        off, out = best(lambda: fn(graph, 0), args.repeat)
+        assert same(out, expected), f"{name} changed its result"
+        with instrument(sys.stdout if args.json else None):
+            on, out = best(lambda: fn(graph, 0), args.repeat)
+        assert same(out, expected), f"{name} changed its result under instrumentation"
+        print(f"{name:>14} {bare:>8.3f} {off:>8.3f} {on:>8.3f} "
+              f"{(off / bare - 1) * 100:>6.1f}% {(on / bare - 1) * 100:>6.1f}%")
+
+    with instrument() as rec:
+        dijkstra_ids(csr, 0)
+    print(json.dumps(rec.calls[0], indent=1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+
+from generators import random_weighted_edges
+
+
+def child(path, method, directed):
+    from algo.edgelist import load_edgelist
+
+    t = time.perf_counter()
+    if method == "dict":
+        # what the solutions do: read every line, then a defaultdict(list)
+        edges = [line.split() for line in open(path)]
+        graph = defaultdict(list)
+        for u, v, w in edges:
+            graph[int(u)].append((int(v), float(w)))
+            if not directed:
+                graph[int(v)].append((int(u), float(w)))
+        rows = len(edges)
+    else:
+        stats = {}
+        load_edgelist(path, directed=directed, weighted=True, stats=stats)
+        rows = stats["rows"]
+    seconds = time.perf_counter() - t
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"rows": rows, "seconds": seconds, "peak_rss_mb": peak_mb}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming load_edgelist() against a defaultdict(list) build")
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--edges", type=int, default=5_000_000)
+    parser.add_argument("--undirected", action="store_true")
+    parser.add_argument("--skip-dict", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child[0], args.child[1], not args.undirected)
+        return
+
+    from algo.edgelist import write_binary
+
+    edges, weights = random_weighted_edges(args.nodes, args.edges, seed=args.seed)
+    print(f"nodes={args.nodes} edges={args.edges} directed={not args.undirected}")
+    print(f"{'input':>22} {'seconds':>9} {'rows/sec':>12} {'peak RSS MB':>12} {'file MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        text = os.path.join(tmp, "edges.txt")
+        np.savetxt(text, np.column_stack([edges, weights]), fmt="%d")
+        binary = write_binary(os.path.join(tmp, "edges.bin"), edges, weights)
+        runs = [("dict", text), ("stream", text), ("stream", binary)]
+        if args.skip_dict:
+            runs = runs[1:]
+        for method, path in runs:
+            # fresh process per run so ru_maxrss is that run's own peak
+            cmd = [sys.executable, __file__, "--child", path, method] + (["--undirected"] if args.undirected else [])
+            res = json.loads(subprocess.run(cmd, check=True, capture_output=True, text=True).stdout)
+            name = f"{method} {os.path.splitext(path)[1][1:]}"
+            print(f"{name:>22} {res['seconds']:>9.2f} {res['rows'] / res['seconds']:>12.0f} "
+                  f"{res['peak_rss_mb']:>12.1f} {os.path.getsize(path) / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
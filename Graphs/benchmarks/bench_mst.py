@@ -0,0 +1,50 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from algo.csr import CSRGraph
+from generators import random_weighted_edges
+from algo.mst import boruvka, kruskal, parallel_boruvka
+from algo.prims import prim
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kruskal / Borůvka / parallel Borůvka against heap prim()")
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--edges", type=int, default=10_000_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--skip-prim", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    edges, weights = random_weighted_edges(args.nodes, args.edges, max_weight=1_000_000, seed=args.seed)
+    csr = CSRGraph.from_edges(edges, num_nodes=args.nodes, weights=weights)
+    print(f"nodes={args.nodes} edges={args.edges} workers={args.workers}")
+
+    runs = [
+        ("kruskal", lambda: kruskal(csr, forest=True)),
+        ("boruvka", lambda: boruvka(csr, forest=True)),
+        ("parallel boruvka", lambda: parallel_boruvka(csr, forest=True, workers=args.workers)),
+    ]
+    totals = set()
+    for name, run in runs:
+        t = time.perf_counter()
+        total, tree = run()
+        print(f"{name:>17}: {time.perf_counter() - t:7.2f}s  weight={total:.0f} edges={len(tree)}")
+        totals.add(total)
+
+    if not args.skip_prim:
+        # prim() needs both directions of every edge and only spans node 0's component
+        sym = CSRGraph.from_edges(edges, num_nodes=args.nodes, weights=weights, directed=False)
+        t = time.perf_counter()
+        total = prim(sym, 0)
+        print(f"{'prim':>17}: {time.perf_counter() - t:7.2f}s  weight={total:.0f} (start component only)")
+
+    sys.exit(0 if len(totals) == 1 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from algo.csr import CSRGraph
+from algo.dijkstras import dijkstra
+from generators import random_weighted_edges
+from algo.prims import prim
+
+QUEUES = [None, "dary", "bucket", "pairing"]
+
+
+def measure(fn, *args, **kwargs):
+    tracemalloc.start()
+    t = time.perf_counter()
+    out = fn(*args, **kwargs)
+    seconds = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare priority queues in dijkstra() and prim()")
+    parser.add_argument("--nodes", type=int, default=2_000)
+    parser.add_argument("--degrees", type=int, nargs="+", default=[8, 64, 512])
+    parser.add_argument("--max-weight", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'algo':>8} {'degree':>6} {'queue':>8} {'seconds':>9} {'peak MB':>8}")
+    for degree in args.degrees:
+        edges, weights = random_weighted_edges(args.nodes, args.nodes * degree // 2, args.max_weight)
+        csr = CSRGraph.from_edges(edges, num_nodes=args.nodes, weights=weights, directed=False)
+        for name, fn in (("dijkstra", dijkstra), ("prim", prim)):
+            expected = None
+            for queue in QUEUES:
+                seconds, peak, out = measure(fn, csr, 0, queue=queue)
+                if expected is None:
+                    expected = out
+                elif name == "prim":
+                    assert out == expected, f"{queue} disagrees with heapq"
+                else:
+                    assert (out == expected).all(), f"{queue} disagrees with heapq"
+                print(f"{name:>8} {degree:>6} {queue or 'heapq':>8} {seconds:>9.3f} {peak / 2**20:>8.2f}")
+
+    # fractional weights: the bucket queue must refuse rather than truncate
+    edges, weights = random_weighted_edges(args.nodes, args.nodes * 4, args.max_weight)
+    csr = CSRGraph.from_edges(edges, num_nodes=args.nodes, weights=weights + 0.5, directed=False)
+    for name, fn in (("dijkstra", dijkstra), ("prim", prim)):
+        try:
+            fn(csr, 0, queue="bucket")
+        except ValueError:
+            print(f"{name:>8} float weights: bucket queue rejected")
+        else:
+            raise AssertionError(f"{name} accepted float weights with the bucket queue")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from generators import island_mask_file
+
+
+def child(path, side, band_rows):
+    from algo.tiled import label_components_tiled, open_raster
+
+    raster = open_raster(path, (side, side))
+    t = time.perf_counter()
+    _, count, _, _ = label_components_tiled(raster, band_rows=band_rows or None)
+    seconds = time.perf_counter() - t
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"side": side, "components": count, "seconds": seconds, "peak_rss_mb": peak_mb}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Peak RSS of tiled labelling as the raster grows")
+    parser.add_argument("--sides", type=int, nargs="+", default=[2_000, 4_000, 8_000])
+    parser.add_argument("--band-rows", type=int, default=0, help="rows per band (default: sized by cell count)")
+    parser.add_argument("--blob", type=int, default=64, help="land block size of the synthetic mask")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child[0], int(args.child[1]), args.band_rows)
+        return
+
+    print(f"{'side':>7} {'cells':>12} {'components':>10} {'seconds':>9} {'peak RSS MB':>12} {'raster MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for side in args.sides:
+            path = island_mask_file(os.path.join(tmp, f"mask_{side}.raw"), side, side, blob=args.blob)
+            # fresh process per size so ru_maxrss is that run's own peak
+            out = subprocess.run([sys.executable, __file__, "--band-rows", str(args.band_rows), "--child", path, str(side)],
+                                 check=True, capture_output=True, text=True).stdout
+            res = json.loads(out)
+            print(f"{side:>7} {side * side:>12} {res['components']:>10} {res['seconds']:>9.2f} {res['peak_rss_mb']:>12.1f} {side * side / 2**20:>10.1f}")
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+# Import-time budget check. Every module is imported in a fresh
+# interpreter and must print nothing, allocate little and import fast;
+# `import algo` on its own must not pull in numpy or any submodule. The
+# solution files are run as plain modules (not __main__) the same way, so
+# a missing typing/collections import or a stray demo shows up here.
+# Exits 1 on any violation.
+
+# runs in the child: numpy is loaded before the clock starts, so a
+# module's budget covers its own import work rather than numpy's. Time
+# and allocations come from separate runs, as tracing slows the import.
+# Only memory still held by lines of our own files counts as allocated:
+# module-level data, not the interpreter's code objects or stdlib imports
+_PROBE = """
+import contextlib, io, json, os, runpy, sys, time, tracemalloc
+target, preload, trace = sys.argv[1], sys.argv[2] == "1", sys.argv[3] == "1"
+if preload:
+    import numpy
+before = set(sys.modules)
+out = io.StringIO()
+if trace:
+    tracemalloc.start()
+t = time.perf_counter()
+with contextlib.redirect_stdout(out):
+    if target.endswith(".py"):
+        runpy.run_path(target, run_name="solution")
+    else:
+        __import__(target)
+seconds = time.perf_counter() - t
+held = 0
+if trace:
+    own = os.path.abspath(target) if target.endswith(".py") else os.path.abspath("algo") + os.sep + "*"
+    snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, own)])
+    held = sum(stat.size for stat in snapshot.statistics("filename"))
+print(json.dumps({"ms": seconds * 1e3, "alloc_kb": held / 1024, "stdout": out.getvalue(),
+                  "loaded": sorted(m for m in set(sys.modules) - before if m.split(".")[0] in ("algo", "numpy"))}))
+"""
+
+
+def probe(target, preload):
+    runs = []
+    for trace in ("0", "1"):
+        proc = subprocess.run([sys.executable, "-c", _PROBE, target, "1" if preload else "0", trace],
+                              cwd=ROOT, capture_output=True, text=True)
+        if proc.returncode:
+            return {"error": proc.stderr.strip().splitlines()[-1]}
+        runs.append(json.loads(proc.stdout))
+    timed, traced = runs
+    timed["alloc_kb"] = traced["alloc_kb"]
+    return timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that importing the graph code is quiet, cheap and fast")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="per-module import time (numpy preloaded)")
+    parser.add_argument("--package-ms", type=float, default=20.0, help="import time of the bare `algo` package")
+    parser.add_argument("--alloc-kb", type=float, default=64.0, help="memory held by module-level code after import")
+    args = parser.parse_args()
+
+    modules = sorted(os.path.splitext(os.path.basename(p))[0] for p in glob.glob(os.path.join(ROOT, "algo", "*.py")))
+    targets = [("algo", False, args.package_ms)]
+    targets += [(f"algo.{m}", True, args.budget_ms) for m in modules if m != "__init__"]
+    solutions = sorted(glob.glob(os.path.join(ROOT, "[0-9]*.py")) + glob.glob(os.path.join(ROOT, "questions", "*.py"))
+                       + glob.glob(os.path.join(ROOT, "Advance_graph", "*.py")))
+    targets += [(os.path.relpath(p, ROOT), True, args.budget_ms) for p in solutions]
+
+    failures = 0
+    print(f"{'target':<50} {'ms':>8} {'alloc KB':>9}  status")
+    for target, preload, budget in targets:
+        res = probe(target, preload)
+        problems = []
+        if "error" in res:
+            problems.append(res["error"])
+        else:
+            if res["ms"] > budget:
+                problems.append(f"over {budget:.0f} ms")
+            if res["alloc_kb"] > args.alloc_kb:
+                problems.append(f"over {args.alloc_kb:.0f} KB")
+            if res["stdout"]:
+                problems.append(f"prints {res['stdout'][:40]!r}")
+            if target == "algo" and res["loaded"] != ["algo"]:
+                problems.append(f"eagerly loads {', '.join(m for m in res['loaded'] if m != 'algo')}")
+        failures += bool(problems)
+        ms = res.get("ms", float("nan"))
+        kb = res.get("alloc_kb", float("nan"))
+        print(f"{target:<50} {ms:>8.2f} {kb:>9.1f}  {'; '.join(problems) or 'ok'}")
+    print(f"{failures} of {len(targets)} over budget" if failures else f"all {len(targets)} imports within budget")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import numpy as np
+
+
+# Seeded synthetic inputs for the benchmarks. Edge generators return an
+# (m, 2) int64 array of endpoints; feed it to CSRGraph.from_edges.
+
+def power_law_edges(n, avg_degree, gamma=2.5, seed=0):
+    # Chung-Lu: endpoints drawn with probability proportional to a
+    # power-law weight, giving a heavy-tailed degree sequence and a tiny
+    # diameter like social graphs
+    rng = np.random.default_rng(seed)
+    w = (np.arange(1, n + 1, dtype=np.float64)) ** (-1.0 / (gamma - 1))
+    w /= w.sum()
+    m = n * avg_degree // 2
+    edges = rng.choice(n, size=(m, 2), p=w)
+    return edges[edges[:, 0] != edges[:, 1]]
+
+
+def random_weighted_edges(n, m, max_weight=100, seed=0):
+    # Erdős–Rényi style G(n, m) with integer weights in [1, max_weight]
+    rng = np.random.default_rng(seed)
+    edges = rng.integers(0, n, size=(m, 2))
+    weights = rng.integers(1, max_weight + 1, size=m)
+    return edges, weights
+
+
+def road_grid_edges(rows, cols, max_weight=10, seed=0):
+    # road-like network: a rows x cols lattice with random segment lengths,
+    # node id r * cols + c; returns (edges, weights), one arc per direction
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows * cols).reshape(rows, cols)
+    pairs = np.concatenate([
+        np.stack([ids[:, :-1].ravel(), ids[:, 1:].ravel()], axis=1),
+        np.stack([ids[:-1, :].ravel(), ids[1:, :].ravel()], axis=1),
+    ])
+    weights = rng.integers(1, max_weight + 1, size=len(pairs))
+    return np.concatenate([pairs, pairs[:, ::-1]]), np.concatenate([weights, weights])
+
+
+def island_mask_file(path, rows, cols, density=0.45, seed=0, band_rows=1024, blob=1):
+    # random land/water mask written straight to a raw uint8 file in bands,
+    # so rasters larger than RAM can be produced; blob > 1 draws land in
+    # blob x blob blocks for island-like shapes rather than salt noise
+    rng = np.random.default_rng(seed)
+    band_rows -= band_rows % blob
+    coarse_cols = -(-cols // blob)
+    with open(path, "wb") as f:
+        for r0 in range(0, rows, band_rows):
+            r1 = min(r0 + band_rows, rows)
+            coarse = rng.random((-(-(r1 - r0) // blob), coarse_cols)) < density
+            band = np.repeat(np.repeat(coarse, blob, axis=0), blob, axis=1)[:r1 - r0, :cols]
+            band.astype(np.uint8).tofile(f)
+    return path
+
+
+def erdos_renyi_edges(n, avg_degree, seed=0):
+    # G(n, m) with m = n * avg_degree / 2 uniform pairs, self-loops dropped
+    rng = np.random.default_rng(seed)
+    edges = rng.integers(0, n, size=(n * avg_degree // 2, 2))
+    return edges[edges[:, 0] != edges[:, 1]]
+
+
+def barabasi_albert_edges(n, m=3, seed=0):
+    # preferential attachment as a linearised chord diagram: node t >= m
+    # adds m edges, each ending at a uniformly drawn endpoint of an earlier
+    # edge, which is a degree-proportional pick. "the far end of earlier
+    # edge j" chains are resolved by pointer jumping instead of a loop
+    rng = np.random.default_rng(seed)
+    src = np.concatenate([np.arange(1, m + 1), m + 1 + np.arange((n - m - 1) * m) // m])
+    k = len(src)
+    dst = np.full(k, -1, dtype=np.int64)
+    dst[:m] = 0                                   # seed star around node 0
+    first = np.arange(k) - (np.arange(k) - m) % m  # first edge added by the same node
+    slot = (rng.random(k) * 2 * first).astype(np.int64)
+    late = np.arange(m, k)
+    ptr = np.full(k, -1, dtype=np.int64)
+    even = slot[late] % 2 == 0
+    dst[late[even]] = src[slot[late[even]] // 2]
+    ptr[late[~even]] = slot[late[~even]] // 2
+    todo = late[~even]
+    while len(todo):
+        known = dst[ptr[todo]] >= 0
+        dst[todo[known]] = dst[ptr[todo[known]]]
+        todo = todo[~known]
+        ptr[todo] = ptr[ptr[todo]]
+    edges = np.stack([src, dst], axis=1)
+    return edges[edges[:, 0] != edges[:, 1]]
+
+
+def random_dag_edges(n, avg_degree, seed=0):
+    # random pairs oriented from the lower to the higher rank of a hidden
+    # random order, so the result is acyclic but not trivially sorted
+    rng = np.random.default_rng(seed)
+    edges = np.sort(rng.integers(0, n, size=(n * avg_degree, 2)), axis=1)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    return rng.permutation(n)[edges]
+
+
+def island_grid(rows, cols, density=0.45, seed=0, blob=1):
+    # in-memory counterpart of island_mask_file(): a bool land mask
+    rng = np.random.default_rng(seed)
+    coarse = rng.random((-(-rows // blob), -(-cols // blob))) < density
+    return np.repeat(np.repeat(coarse, blob, axis=0), blob, axis=1)[:rows, :cols]
+
+
+def height_grid(rows, cols, octaves=5, max_height=10_000, seed=0):
+    # DEM-like int32 terrain: value noise summed over octaves, each a
+    # coarser random grid blown up with bilinear interpolation and weighted
+    # by its cell size, so broad valleys and ridges dominate the speckle
+    rng = np.random.default_rng(seed)
+    terrain = np.zeros((rows, cols))
+    for octave in range(octaves):
+        cell = max(1, max(rows, cols) >> (octave + 1))
+        coarse = rng.random((rows // cell + 2, cols // cell + 2))
+        r, c = np.arange(rows) / cell, np.arange(cols) / cell
+        r0, c0 = r.astype(np.int64), c.astype(np.int64)
+        fr, fc = (r - r0)[:, None], (c - c0)[None, :]
+        top = coarse[r0][:, c0] * (1 - fc) + coarse[r0][:, c0 + 1] * fc
+        bottom = coarse[r0 + 1][:, c0] * (1 - fc) + coarse[r0 + 1][:, c0 + 1] * fc
+        terrain += (top * (1 - fr) + bottom * fr) * cell
+    terrain -= terrain.min()
+    return (terrain * (max_height / max(terrain.max(), 1e-12))).astype(np.int32)
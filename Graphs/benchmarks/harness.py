@@ -0,0 +1,305 @@
+import argparse
+import ast
+import contextlib
+import fnmatch
+import functools
+import heapq
+import importlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from typing import List, Optional
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+import generators as gen
+
+
+# Benchmark harness: every algorithm over a size sweep of seeded inputs.
+# Each run records the best-of-N wall time, the peak traced allocation
+# (a separate tracemalloc run, so tracing never skews the timing) and
+# edges/sec, where grids count their 4-neighbour edges. Results go to
+# JSON; given a baseline JSON from an earlier run, slower-than-tolerance
+# entries are flagged and the exit status is 1.
+#
+# Cases in the same group solve the same problem, which is how the
+# duplicated LeetCode solutions get compared: every version of a method
+# defined in a solution file becomes its own case, and answers that
+# disagree within a group at the same size are reported.
+
+class Case:
+    __slots__ = ("name", "group", "sizes", "build", "run", "copy")
+
+    def __init__(self, name, sizes, build, run, group=None, copy=None):
+        # build(size, seed) -> (data, edges); run(data) is the timed call;
+        # copy(data) gives each repetition a fresh input when run mutates it
+        self.name, self.group, self.sizes = name, group, sizes
+        self.build, self.run, self.copy = build, run, copy
+
+
+def solution_variants(path, method):
+    """Every definition of `method` in a solution file, in file order.
+
+    The files redefine `Solution` for each approach, so a plain import
+    keeps only the last; executing the top-level statements one at a time
+    catches each version as it is defined.
+    """
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    namespace = {"List": List, "Optional": Optional, "deque": deque, "defaultdict": defaultdict, "heapq": heapq}
+    variants = []
+    for node in tree.body:
+        exec(compile(ast.Module(body=[node], type_ignores=[]), path, "exec"), namespace)
+        if isinstance(node, ast.ClassDef):
+            if any(isinstance(item, ast.FunctionDef) and item.name == method for item in node.body):
+                variants.append(getattr(namespace[node.name](), method))
+        elif isinstance(node, ast.FunctionDef) and node.name == method:
+            # a bare copy of a method, still taking `self`
+            variants.append(functools.partial(namespace[node.name], None))
+    return variants
+
+
+def _grid_edges(rows, cols):
+    return 2 * rows * cols - rows - cols
+
+
+def _undirected(edges_fn):
+    def build(n, seed):
+        from algo.csr import CSRGraph
+
+        csr = CSRGraph.from_edges(edges_fn(n, seed), num_nodes=n, directed=False)
+        return csr, csr.num_edges
+    return build
+
+
+def _weighted(n, seed):
+    from algo.csr import CSRGraph
+
+    edges, weights = gen.random_weighted_edges(n, 4 * n, seed=seed)
+    csr = CSRGraph.from_edges(edges, num_nodes=n, weights=weights)
+    return csr, csr.num_edges
+
+
+def _road(side, seed):
+    from algo.csr import CSRGraph
+
+    edges, weights = gen.road_grid_edges(side, side, seed=seed)
+    csr = CSRGraph.from_edges(edges, num_nodes=side * side, weights=weights)
+    return csr, csr.num_edges
+
+
+def _dag(n, seed):
+    return (n, gen.random_dag_edges(n, 4, seed=seed)), 4 * n
+
+
+def _dem(side, seed):
+    return gen.height_grid(side, side, seed=seed), _grid_edges(side, side)
+
+
+def _islands(side, seed):
+    return gen.island_grid(side, side, blob=4, seed=seed), _grid_edges(side, side)
+
+
+def _island_strings(side, seed):
+    grid = gen.island_grid(side, side, density=0.35, seed=seed)
+    return [["1" if cell else "0" for cell in row] for row in grid.tolist()], _grid_edges(side, side)
+
+
+def _oranges(side, seed):
+    # fresh oranges on island-like land, a handful of them rotten
+    rng = np.random.default_rng(seed)
+    grid = gen.island_grid(side, side, density=0.8, seed=seed).astype(np.int64)
+    land = np.flatnonzero(grid)
+    grid.ravel()[rng.choice(land, size=max(1, len(land) // 500), replace=False)] = 2
+    return grid.tolist(), _grid_edges(side, side)
+
+
+def _points(n, seed):
+    return np.random.default_rng(seed).integers(0, 10 * n, size=(n, 2)), 4 * n
+
+
+def _lazy(module, name, *args, **kwargs):
+    # import at first call, so listing or filtering cases imports nothing
+    def run(data):
+        fn = getattr(importlib.import_module("algo." + module), name)
+        return fn(data, *args, **kwargs)
+    return run
+
+
+def _cases():
+    graph_sizes = (10_000, 100_000, 1_000_000)
+    road_sides = (100, 300, 1_000)
+    grid_sides = (256, 1_024, 2_048)
+    cases = [
+        Case("bfs/erdos_renyi", graph_sizes, _undirected(lambda n, s: gen.erdos_renyi_edges(n, 8, s)),
+             _lazy("bfs", "bfs_ids", 0)),
+        Case("bfs_levels/barabasi_albert", graph_sizes, _undirected(lambda n, s: gen.barabasi_albert_edges(n, 4, s)),
+             _lazy("bfs", "bfs_levels", 0)),
+        Case("bfs_direction_optimizing/barabasi_albert", graph_sizes,
+             _undirected(lambda n, s: gen.barabasi_albert_edges(n, 4, s)),
+             lambda csr: importlib.import_module("algo.bfs").bfs_direction_optimizing(csr, 0, reverse=csr)),
+        Case("dfs/erdos_renyi", graph_sizes, _undirected(lambda n, s: gen.erdos_renyi_edges(n, 8, s)),
+             _lazy("dfs", "dfs_ids", 0)),
+        Case("dijkstra/road", road_sides, _road, _lazy("dijkstras", "dijkstra", 0)),
+        Case("dijkstra_dary/road", road_sides, _road, _lazy("dijkstras", "dijkstra", 0, queue="dary")),
+        Case("prim/road", road_sides, _road, _lazy("prims", "prim", 0)),
+        Case("kruskal/erdos_renyi", graph_sizes, _weighted, _lazy("mst", "kruskal", forest=True)),
+        Case("boruvka/erdos_renyi", graph_sizes, _weighted, _lazy("mst", "boruvka", forest=True)),
+        Case("hop_limited/erdos_renyi", graph_sizes, _weighted, _lazy("bellman_ford", "hop_limited", 0, 8)),
+        Case("bellman_ford/road", road_sides[:2], _road, _lazy("bellman_ford", "bellman_ford", 0)),
+        Case("union_find/erdos_renyi", graph_sizes, lambda n, s: ((n, gen.erdos_renyi_edges(n, 8, s)), 4 * n),
+             lambda data: importlib.import_module("algo.union_find").DisjointSet(data[0]).union_many(data[1])),
+        Case("kahn/random_dag", graph_sizes, _dag,
+             lambda data: importlib.import_module("algo.topological_sort").kahn_topological_sort(*data)),
+        Case("label_components/islands", grid_sides, _islands, _lazy("grid", "label_components")),
+        Case("pacific_atlantic/dem", grid_sides[:2], _dem, _lazy("water_flow", "pacific_atlantic")),
+        Case("grid_tree/dem", grid_sides[:2], _dem, _lazy("bottleneck", "grid_tree")),
+        Case("point_mst/uniform", (1_000, 10_000, 100_000), _points, _lazy("geometric_mst", "point_mst")),
+    ]
+
+    island_sides = (100, 300, 1_000)
+    orange_sides = (12, 16, 100, 300, 1_000)
+    # the first 81-orange_rotten.py version re-walks every path, which is
+    # exponential in the grid side
+    capped = {"orangesRotting/81-orange_rotten.py#1": (12, 16)}
+    solutions = [
+        ("numIslands", "76-Visited_island.py", _island_strings, island_sides, None),
+        ("numIslands", "questions/no_of_islands.py", _island_strings, island_sides, None),
+        ("orangesRotting", "81-orange_rotten.py", _oranges, orange_sides, lambda g: [row[:] for row in g]),
+        ("orangesRotting", "questions/rotting_oranges.py", _oranges, orange_sides, lambda g: [row[:] for row in g]),
+    ]
+    for method, path, build, sizes, copy in solutions:
+        for i, fn in enumerate(solution_variants(os.path.join(ROOT, path), method)):
+            name = f"{method}/{path}#{i + 1}"
+            cases.append(Case(name, capped.get(name, sizes), build, fn, group=method, copy=copy))
+    cases.append(Case("numIslands/grid.num_islands", island_sides, _island_strings, _lazy("grid", "num_islands"),
+                      group="numIslands"))
+    cases.append(Case("orangesRotting/grid.oranges_rotting", orange_sides, _oranges,
+                      _lazy("grid", "oranges_rotting"), group="orangesRotting"))
+    return cases
+
+
+def measure(case, size, seed, repeat, memory):
+    data, edges = case.build(size, seed)
+    best = float("inf")
+    answer = None
+    # the solutions' own debug prints would swamp the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            arg = case.copy(data) if case.copy else data
+            t = time.perf_counter()
+            answer = case.run(arg)
+            best = min(best, time.perf_counter() - t)
+        peak_mb = None
+        if memory:
+            arg = case.copy(data) if case.copy else data
+            tracemalloc.start()
+            try:
+                case.run(arg)
+                peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+            finally:
+                tracemalloc.stop()
+    result = {"case": case.name, "size": size, "edges": int(edges), "seconds": best,
+              "edges_per_sec": edges / best if best else None, "peak_mb": peak_mb}
+    if isinstance(answer, (bool, int, float, np.integer, np.floating)):
+        result["answer"] = answer.item() if isinstance(answer, np.generic) else answer
+    return result
+
+
+def compare(results, baseline, tolerance, min_seconds):
+    """Entries more than `tolerance` (a fraction) slower than the baseline."""
+    base = {(r["case"], r["size"]): r for r in baseline["results"] if r.get("seconds") is not None}
+    regressions = []
+    for r in results:
+        old = base.get((r["case"], r["size"]))
+        if old is None or r.get("seconds") is None:
+            continue
+        r["baseline_seconds"] = old["seconds"]
+        r["ratio"] = r["seconds"] / old["seconds"] if old["seconds"] else None
+        if r["seconds"] > old["seconds"] * (1 + tolerance) and r["seconds"] - old["seconds"] > min_seconds:
+            regressions.append(r)
+    return regressions
+
+
+def _disagreements(results, groups):
+    answers = defaultdict(dict)
+    for r in results:
+        if "answer" in r and groups.get(r["case"]):
+            answers[groups[r["case"]], r["size"]][r["case"]] = r["answer"]
+    return {key: found for key, found in answers.items() if len(set(found.values())) > 1}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every algorithm over size sweeps and compare to a baseline")
+    parser.add_argument("--cases", nargs="+", default=["*"], help="glob patterns over case names")
+    parser.add_argument("--list", action="store_true", help="print the case names and sizes, then exit")
+    parser.add_argument("--quick", action="store_true", help="only the smallest size of every case")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-seconds", type=float, default=30.0,
+                        help="skip a case's larger sizes once one run takes longer than this")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the results JSON here")
+    parser.add_argument("--baseline", help="results JSON of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before flagging, as a fraction")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(100_000)
+    cases = [c for c in _cases() if any(fnmatch.fnmatch(c.name, p) for p in args.cases)]
+    if args.list:
+        for c in cases:
+            print(f"{c.name:<55} {', '.join(map(str, c.sizes))}")
+        return
+
+    results = []
+    print(f"{'case':<55} {'size':>9} {'seconds':>9} {'edges/sec':>12} {'peak MB':>9}")
+    for c in cases:
+        for size in c.sizes[:1] if args.quick else c.sizes:
+            try:
+                r = measure(c, size, args.seed, args.repeat, not args.no_memory)
+            except (RecursionError, MemoryError) as e:
+                # recursive solutions falling over at scale is a result too
+                r = {"case": c.name, "size": size, "seconds": None, "error": type(e).__name__}
+            results.append(r)
+            if r["seconds"] is None:
+                print(f"{c.name:<55} {size:>9} {r['error']:>9}")
+                break
+            peak = "-" if r["peak_mb"] is None else f"{r['peak_mb']:.1f}"
+            print(f"{c.name:<55} {size:>9} {r['seconds']:>9.4f} {r['edges_per_sec']:>12.0f} {peak:>9}")
+            if r["seconds"] > args.max_seconds:
+                break
+
+    status = 0
+    for (group, size), found in _disagreements(results, {c.name: c.group for c in cases}).items():
+        print(f"answers disagree for {group} at size {size}: {found}")
+        status = 1
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance, args.min_seconds)
+        for r in regressions:
+            print(f"REGRESSION {r['case']} size={r['size']}: {r['baseline_seconds']:.4f}s -> {r['seconds']:.4f}s "
+                  f"({r['ratio']:.2f}x)")
+        if regressions:
+            status = 1
+        else:
+            print(f"no regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    if args.out:
+        meta = {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(),
+                "seed": args.seed, "repeat": args.repeat, "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        with open(args.out, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=1)
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
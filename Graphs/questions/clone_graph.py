@@ -4,13 +4,17 @@ class Solution:
         oldtonew = {}
 
 
-        def dfs(node):
-            if node in oldtonew: return oldtonew[node]
-            newnode = Node(node.val)
-            oldtonew[node] = newnode
-            for ni in node.neighbors:
-                oldtonew[node].neighbors.append(dfs(ni))
-            return newnode
+        def dfs(root):
+            oldtonew[root] = Node(root.val)
+            s = [root]
+            while s:
+                node = s.pop()
+                for ni in node.neighbors:
+                    if ni not in oldtonew:
+                        oldtonew[ni] = Node(ni.val)
+                        s.append(ni)
+                    oldtonew[node].neighbors.append(oldtonew[ni])
+            return oldtonew[root]
         if node:
             return dfs(node)
         else: return None
\ No newline at end of file
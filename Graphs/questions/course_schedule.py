@@ -1,3 +1,6 @@
+from typing import List
+
+
 class Solution:
     def canFinish(self, numCourses: int, prerequisites: List[List[int]]) -> bool:
         premap = {i:[] for i in range(numCourses)}
@@ -1,3 +1,6 @@
+from typing import List
+
+
 class Solution:
     def findOrder(self, numCourses: int, prerequisites: List[List[int]]) -> List[int]:
         prereq = {c:[] for c in range(numCourses)}
@@ -5,20 +5,24 @@ def floodFill_DFS(image, sr, sc, newColor):
 
     rows, cols = len(image)-1, len(image[0])-1
     def dfs(r,c):
-        if 0 <=r <= rows and 0 <= c <= cols and image[r][c] == og_color:
-            image[r][c] = newColor
-            dfs(r+1,c)
-            dfs(r-1,c)
-            dfs(r,c+1)
-            dfs(r,c-1)
+        s = [(r,c)]
+        while s:
+            r,c = s.pop()
+            if 0 <=r <= rows and 0 <= c <= cols and image[r][c] == og_color:
+                image[r][c] = newColor
+                s.append((r+1,c))
+                s.append((r-1,c))
+                s.append((r,c+1))
+                s.append((r,c-1))
     dfs(sr,sc)
     return image
 
 
 
-image = [[1,1,1],[1,1,0],[1,0,1]]
-sr = 1
-sc = 1
-newColor = 2
+if __name__ == "__main__":
+    image = [[1,1,1],[1,1,0],[1,0,1]]
+    sr = 1
+    sc = 1
+    newColor = 2
 
-print(f"floodFill_DFS:{floodFill_DFS(image,1,1,2)}")
\ No newline at end of file
+    print(f"floodFill_DFS:{floodFill_DFS(image,1,1,2)}")
\ No newline at end of file
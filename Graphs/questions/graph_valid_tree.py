@@ -1,3 +1,6 @@
+from typing import List
+
+
 class Solution:
     def validTree(self, n: int, edges: List[List[int]]) -> bool:
         if not n : return True
@@ -1,3 +1,6 @@
+from typing import List
+
+
 class Solution:
     def maxAreaOfIsland(self, grid: List[List[int]]) -> int:
         v = set()
@@ -1,3 +1,6 @@
+from typing import List
+
+
 class Solution:
     def numIslands(self, grid: List[List[str]]) -> int:
         
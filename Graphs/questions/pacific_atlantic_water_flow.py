@@ -1,29 +1,29 @@
+import heapq
+from typing import List
+
+
 class Solution:
     def pacificAtlantic(self, heights: List[List[int]]) -> List[List[int]]:
-        ROWS, COLS = len(heights),len(heights[0])
+        ROWS, COLS = len(heights), len(heights[0])
+        PAC, ATL = 1, 2
+        # one bit per ocean the cell drains to, in a flat list instead of two sets of tuples
+        reach = [0] * (ROWS * COLS)
+
+        def flood(cells, bit):
+            # priority flood: settle the lowest border cell first and climb
+            # to every neighbour that is no lower; no recursion
+            heap = [(heights[r][c], r, c) for r, c in cells]
+            heapq.heapify(heap)
+            for _, r, c in heap:
+                reach[r * COLS + c] |= bit
+            while heap:
+                h, r, c = heapq.heappop(heap)
+                for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+                    if 0 <= nr < ROWS and 0 <= nc < COLS and not reach[nr * COLS + nc] & bit and heights[nr][nc] >= h:
+                        reach[nr * COLS + nc] |= bit
+                        heapq.heappush(heap, (heights[nr][nc], nr, nc))
 
-        pac = set()
-        atl = set()
-        def dfs(r,c,v,prev):
-            if (0 > r or r == ROWS or 0 > c or c== COLS or (r,c) in v): return 
-            if heights[r][c] < prev: return
-            v.add((r,c))
-            dfs(r+1,c,v,heights[r][c])
-            dfs(r-1,c,v,heights[r][c])
-            dfs(r,c+1,v,heights[r][c])
-            dfs(r,c-1,v,heights[r][c])
-        
-        for c in range(COLS):
-            dfs(0,c,pac,heights[0][c])
-            dfs(ROWS-1,c,atl,heights[ROWS-1][c])
-        
-        for r in range(ROWS):
-            dfs(r,0,pac,heights[r][0])
-            dfs(r,COLS-1,atl,heights[r][COLS-1])
+        flood([(0, c) for c in range(COLS)] + [(r, 0) for r in range(ROWS)], PAC)
+        flood([(ROWS - 1, c) for c in range(COLS)] + [(r, COLS - 1) for r in range(ROWS)], ATL)
 
-        res = []
-        for m in range(ROWS):
-            for n in range(COLS):
-                if (m,n) in pac and (m,n) in atl:
-                    res.append([m,n])
-        return res
+        return [[i // COLS, i % COLS] for i, bits in enumerate(reach) if bits == PAC | ATL]
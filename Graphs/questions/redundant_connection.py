@@ -1,3 +1,6 @@
+from typing import List
+
+
 class Solution:
     def findRedundantConnection(self, edges: List[List[int]]) -> List[int]:
         N = len(edges)
@@ -5,9 +8,10 @@ class Solution:
         rank = [1] * (N+1)
 
         def find(n):
-            if par[n] != n:
-                par[n] = find(par[n])
-            return par[n]
+            while par[n] != n:
+                par[n] = par[par[n]]
+                n = par[n]
+            return n
         
         def union(n1,n2):
             p1,p2 = find(n1), find(n2)
@@ -1,3 +1,7 @@
+from collections import deque
+from typing import List
+
+
 class Solution:
     def orangesRotting(self, grid: List[List[int]]) -> int:
         q = deque()
@@ -1,4 +1,7 @@
 from collections import deque
+from typing import List
+
+
 class Solution:
     def wallsAndGates(self, rooms: List[List[int]]) -> None:
         """
@@ -9,7 +12,7 @@ class Solution:
         rows , cols = len(rooms), len(rooms[0])
         v = set()
         q = deque([])
-        def dfs(r,c):
+        def addroom(r,c):
             if r < 0 or r >= rows or c < 0 or c >= cols or rooms[r][c] == -1: return
             if (r,c) in v: return
             v.add((r,c))
@@ -21,4 +24,13 @@ class Solution:
                     v.add((r,c))
                     q.append([r,c])
 
-
+        dist = 0
+        while q:
+            for i in range(len(q)):
+                r,c = q.popleft()
+                rooms[r][c] = dist
+                addroom(r+1,c)
+                addroom(r-1,c)
+                addroom(r,c+1)
+                addroom(r,c-1)
+            dist +=1